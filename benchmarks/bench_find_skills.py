@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark update_skill.find_skills on a synthetic marketplace.
+
+Builds a temporary tree of plugins/skills with realistic SKILL.md files and
+compares the original serial full-read scan against the current
+implementation: with --no-cache, on a first run (catalog and frontmatter memo
+empty, in memory and on disk, before every iteration) and warm (both
+populated).
+
+Usage:
+    python benchmarks/bench_find_skills.py [--plugins 100] [--skills 100] [--lines 250]
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                           'plugins', 'plugin-tools', 'skills', 'skill-updater', 'scripts')
+sys.path.insert(0, os.path.normpath(SCRIPTS_DIR))
+
+import frontmatter  # noqa: E402
+import update_skill  # noqa: E402
+
+
+def legacy_find_skills(plugins_path):
+    """The original serial implementation: listdir + full read + split."""
+    skills = []
+    plugins_dir = os.path.join(plugins_path, 'plugins')
+    if not os.path.exists(plugins_dir):
+        plugins_dir = plugins_path
+
+    for plugin_name in os.listdir(plugins_dir):
+        plugin_path = os.path.join(plugins_dir, plugin_name)
+        if not os.path.isdir(plugin_path):
+            continue
+        skills_dir = os.path.join(plugin_path, 'skills')
+        if not os.path.exists(skills_dir):
+            continue
+        for skill_name in os.listdir(skills_dir):
+            skill_path = os.path.join(skills_dir, skill_name)
+            skill_md = os.path.join(skill_path, 'SKILL.md')
+            if os.path.exists(skill_md):
+                with open(skill_md, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+                skills.append({
+                    'name': skill_name,
+                    'plugin': plugin_name,
+                    'path': skill_path,
+                    'frontmatter': match.group(1) if match else None,
+                    'lines': len(content.split('\n'))
+                })
+    return skills
+
+
+def build_tree(root, plugins, skills, lines):
+    """Create a synthetic plugins tree."""
+    body = ''.join(f"- ルール {i}: サンプルの本文テキスト line {i}\n" for i in range(lines))
+    for p in range(plugins):
+        for s in range(skills):
+            skill_dir = os.path.join(root, 'plugins', f'plugin-{p}', 'skills', f'skill-{s}')
+            os.makedirs(skill_dir)
+            with open(os.path.join(skill_dir, 'SKILL.md'), 'w', encoding='utf-8') as f:
+                f.write(f"---\nname: skill-{s}\ndescription: |\n  Skill {s} of plugin {p}.\n"
+                        f"  トリガー：「skill {s}」\n---\n\n# Skill {s}\n\n{body}")
+
+
+def reset_caches(root):
+    """Forget the frontmatter memo (in memory and on disk) and the skill catalog."""
+    frontmatter._load.cache_clear()
+    frontmatter._memos.clear()
+    shutil.rmtree(os.path.join(root, 'plugins', '.cache'), ignore_errors=True)
+
+
+def timed(label, func, repeat=3, before=None):
+    best = None
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<34} {best * 1000:9.1f} ms  ({len(result)} skills)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark find_skills')
+    parser.add_argument('--plugins', type=int, default=100)
+    parser.add_argument('--skills', type=int, default=100, help='Skills per plugin')
+    parser.add_argument('--lines', type=int, default=250, help='Body lines per SKILL.md')
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='bench-skills-')
+    try:
+        build_tree(root, args.plugins, args.skills, args.lines)
+        print(f"Tree: {args.plugins * args.skills} skills, {args.lines} body lines each\n")
+
+        legacy = timed('legacy (serial, full read)', lambda: legacy_find_skills(root))
+        no_cache = timed('current, --no-cache',
+                         lambda: update_skill.find_skills(root, use_cache=False))
+        cold = timed('current, first run (empty caches)',
+                     lambda: update_skill.find_skills(root), before=lambda: reset_caches(root))
+        update_skill.find_skills(root)
+        frontmatter.save_memo()
+        warm = timed('current, warm cache', lambda: update_skill.find_skills(root))
+
+        print(f"\n--no-cache speedup: {legacy / no_cache:.1f}x, "
+              f"first run speedup: {legacy / cold:.1f}x, warm speedup: {legacy / warm:.1f}x")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark the shared frontmatter parser across a marketplace.
+
+Compares the original full-read + DOTALL regex parse against
+frontmatter.load_skill_md cold (no memo), with the on-disk memo only (fresh
+process state), and with the in-memory LRU warm.
+
+Usage:
+    python benchmarks/bench_frontmatter.py [--path <plugins-dir>] [--repeat 20]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                           'plugins', 'plugin-tools', 'skills', 'skill-updater', 'scripts')
+sys.path.insert(0, os.path.normpath(SCRIPTS_DIR))
+
+import frontmatter  # noqa: E402
+
+
+def legacy_parse(path):
+    """The original per-script approach: read everything, regex, split lines."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return frontmatter.parse_frontmatter(content), len(content.split('\n'))
+
+
+def reset(memo_path, keep_disk):
+    """Forget in-process state; optionally drop the on-disk memo too."""
+    frontmatter._load.cache_clear()
+    frontmatter._memos.clear()
+    if not keep_disk and os.path.exists(memo_path):
+        os.remove(memo_path)
+
+
+def timed(label, paths, func, before=None, repeat=20):
+    best = None
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        for path in paths:
+            func(path)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    per_file = best / len(paths) * 1e6
+    print(f"{label:<28} {best * 1000:8.2f} ms  ({per_file:7.1f} us/file)")
+
+
+def main():
+    default_path = os.path.normpath(os.path.join(SCRIPTS_DIR, '..', '..', '..', '..'))
+    parser = argparse.ArgumentParser(description='Benchmark frontmatter parsing')
+    parser.add_argument('--path', default=default_path, help='Plugins directory path')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.path, '*', 'skills', '*', 'SKILL.md')))
+    if not paths:
+        print(f"No SKILL.md files under {args.path}")
+        return
+
+    memo_path = os.path.join(tempfile.mkdtemp(prefix='bench-frontmatter-'), 'frontmatter.json')
+    frontmatter.memo_path_for = lambda path: memo_path
+    print(f"{len(paths)} SKILL.md files under {args.path}\n")
+
+    def cold():
+        reset(memo_path, keep_disk=False)
+
+    def disk_only():
+        reset(memo_path, keep_disk=True)
+
+    timed('legacy full read + regex', paths, legacy_parse, repeat=args.repeat)
+    timed('load_skill_md cold', paths, frontmatter.load_skill_md, cold, args.repeat)
+
+    cold()
+    for path in paths:
+        frontmatter.load_skill_md(path)
+    frontmatter.save_memo()
+    timed('load_skill_md disk memo', paths, frontmatter.load_skill_md, disk_only, args.repeat)
+
+    timed('load_skill_md LRU warm', paths, frontmatter.load_skill_md, repeat=args.repeat)
+    os.remove(memo_path)
+
+
+if __name__ == '__main__':
+    main()
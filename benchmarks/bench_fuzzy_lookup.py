@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark skill_index.fuzzy_lookup on a synthetic name catalog.
+
+Usage:
+    python benchmarks/bench_fuzzy_lookup.py [--names 50000] [--repeat 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                           'plugins', 'plugin-tools', 'skills', 'skill-updater', 'scripts')
+sys.path.insert(0, os.path.normpath(SCRIPTS_DIR))
+
+import skill_index  # noqa: E402
+
+WORDS = [
+    'skill', 'updater', 'coding', 'standards', 'behavior', 'verification', 'design',
+    'discussion', 'implementation', 'workflow', 'learning', 'log', 'summarize', 'plugin',
+    'creator', 'asset', 'shader', 'network', 'deploy', 'review', 'test', 'runner', 'lint',
+    'format', 'docs', 'release', 'build', 'cache', 'index', 'search', 'report', 'data',
+]
+QUERIES = ['skil-updater', 'coding standard', 'behaviour verification', 'implmentation flow',
+           'lerning log', 'plugn creator']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark fuzzy skill lookup')
+    parser.add_argument('--names', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [('-'.join(rng.sample(WORDS, rng.randint(2, 3))) + f'-{i}', i)
+             for i in range(args.names)]
+    names += [('skill-updater', 'real'), ('behavior-verification', 'real2')]
+
+    start = time.perf_counter()
+    fuzzy = skill_index.build_fuzzy_index(names)
+    print(f"build: {(time.perf_counter() - start) * 1000:.1f} ms for {len(fuzzy['names'])} names\n")
+
+    for query in QUERIES:
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = skill_index.fuzzy_lookup({'fuzzy': fuzzy}, query, 5)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        top = results[0][1] if results else '-'
+        print(f"{query:<26} {best * 1000:6.2f} ms  top: {top}")
+
+
+if __name__ == '__main__':
+    main()
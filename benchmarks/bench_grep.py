@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark update_skill.py grep (skill_grep) against a serial Python walk.
+
+Builds a synthetic tree of skills with SKILL.md, references/*.md and scripts,
+then searches it with a plain os.walk + per-line re.search loop and with
+skill_grep.grep_skills.
+
+Usage:
+    python benchmarks/bench_grep.py [--files 100000] [--pattern DYNAMIC_CONTENT_START]
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                           'plugins', 'plugin-tools', 'skills', 'skill-updater', 'scripts')
+sys.path.insert(0, os.path.normpath(SCRIPTS_DIR))
+
+import skill_grep  # noqa: E402
+
+FILES_PER_SKILL = 50
+
+
+def build_tree(root, files):
+    """Create files/FILES_PER_SKILL skills of markdown and python files."""
+    md = ''.join(f"- ルール {i}: 説明テキスト sample line {i}\n" for i in range(120))
+    py = ''.join(f"def func_{i}():\n    return {i}\n\n" for i in range(60))
+    skills = max(1, files // FILES_PER_SKILL)
+    for s in range(skills):
+        skill_dir = os.path.join(root, f'plugin-{s // 20}', 'skills', f'skill-{s}')
+        os.makedirs(os.path.join(skill_dir, 'references'))
+        os.makedirs(os.path.join(skill_dir, 'scripts'))
+        marker = '<!-- DYNAMIC_CONTENT_START -->\n' if s % 50 == 0 else ''
+        with open(os.path.join(skill_dir, 'SKILL.md'), 'w', encoding='utf-8') as f:
+            f.write(f"---\nname: skill-{s}\n---\n{marker}{md}")
+        for i in range(FILES_PER_SKILL // 2 - 1):
+            with open(os.path.join(skill_dir, 'references', f'ref-{i}.md'), 'w', encoding='utf-8') as f:
+                f.write(md)
+        for i in range(FILES_PER_SKILL // 2):
+            with open(os.path.join(skill_dir, 'scripts', f'script_{i}.py'), 'w', encoding='utf-8') as f:
+                f.write(py)
+    return skills * FILES_PER_SKILL
+
+
+def serial_walk(root, pattern):
+    """Baseline: os.walk, read each file, re.search line by line."""
+    regex = re.compile(pattern)
+    hits = 0
+    for dir_path, _, names in os.walk(root):
+        for name in names:
+            with open(os.path.join(dir_path, name), 'r', encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    if regex.search(line):
+                        hits += 1
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark skill grep')
+    parser.add_argument('--files', type=int, default=100000)
+    parser.add_argument('--pattern', default='DYNAMIC_CONTENT_START')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='bench-grep-')
+    try:
+        count = build_tree(root, args.files)
+        print(f"Tree: {count} files\n")
+
+        start = time.perf_counter()
+        hits = serial_walk(root, args.pattern)
+        serial = time.perf_counter() - start
+        print(f"serial walk          {serial * 1000:9.1f} ms  ({hits} matching lines)")
+
+        start = time.perf_counter()
+        hits = sum(len(m) for _, _, found in skill_grep.grep_skills(root, args.pattern,
+                                                                   workers=args.workers)
+                   for _, m in found)
+        parallel = time.perf_counter() - start
+        print(f"skill_grep           {parallel * 1000:9.1f} ms  ({hits} matching lines)")
+        print(f"\nspeedup: {serial / parallel:.1f}x on {os.cpu_count()} CPUs")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stress test concurrent register_plugin.py writes to one marketplace.json.
+
+Creates a temporary marketplace with --plugins plugin directories, then
+starts --processes worker processes that register disjoint slices of them,
+one plugin per commit (plus a few small batches). At the end every plugin
+must be registered exactly once and marketplace.json must be valid JSON.
+
+--naive runs the same workload with a plain load/modify/overwrite cycle and
+no lock, which shows the lost updates the locked path prevents.
+
+Usage:
+    python benchmarks/stress_register_plugin.py [--plugins 400] [--processes 8] [--naive]
+"""
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                           'plugins', 'plugin-tools', 'skills', 'plugin-creator', 'scripts')
+sys.path.insert(0, os.path.normpath(SCRIPTS_DIR))
+
+import register_plugin  # noqa: E402
+
+BATCH_EVERY = 10
+BATCH_SIZE = 3
+
+
+def build_marketplace(root, plugins):
+    """Create .claude-plugin/marketplace.json and plugins/<name>/.claude-plugin/plugin.json."""
+    os.makedirs(os.path.join(root, '.claude-plugin'))
+    with open(os.path.join(root, '.claude-plugin', 'marketplace.json'), 'w', encoding='utf-8') as f:
+        json.dump({'name': 'stress', 'owner': {'name': 'stress'}, 'plugins': []}, f)
+    for i in range(plugins):
+        plugin_dir = os.path.join(root, 'plugins', f'plugin-{i}', '.claude-plugin')
+        os.makedirs(plugin_dir)
+        with open(os.path.join(plugin_dir, 'plugin.json'), 'w', encoding='utf-8') as f:
+            json.dump({'name': f'plugin-{i}', 'description': f'Plugin {i}', 'version': '1.0.0'}, f)
+
+
+def naive_register(name, marketplace_path):
+    """The pre-lock behaviour: load, append, overwrite in place."""
+    with open(marketplace_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data['plugins'].append({'name': name, 'source': f'./plugins/{name}'})
+    with open(marketplace_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def worker(marketplace_path, names, naive):
+    errors = []
+    i = 0
+    while i < len(names):
+        if naive:
+            try:
+                naive_register(names[i], marketplace_path)
+            except (OSError, ValueError) as e:
+                errors.append(f"{names[i]}: {e}")
+            i += 1
+        elif i % BATCH_EVERY == 0:
+            batch = names[i:i + BATCH_SIZE]
+            reports, error = register_plugin.apply_batch(
+                [('register', n) for n in batch], marketplace_path)
+            errors.extend(f"{n}: {m}" for n, _, ok, m in reports if not ok)
+            if error:
+                errors.append(error)
+            i += len(batch)
+        else:
+            success, message = register_plugin.register_plugin(names[i], marketplace_path)
+            if not success:
+                errors.append(f"{names[i]}: {message}")
+            i += 1
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stress test concurrent marketplace.json registration')
+    parser.add_argument('--plugins', type=int, default=400)
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--naive', action='store_true', help='Use unlocked in-place writes instead')
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix='stress-register-')
+    try:
+        build_marketplace(root, args.plugins)
+        marketplace_path = os.path.join(root, '.claude-plugin', 'marketplace.json')
+        names = [f'plugin-{i}' for i in range(args.plugins)]
+        slices = [names[p::args.processes] for p in range(args.processes)]
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            futures = [pool.submit(worker, marketplace_path, s, args.naive) for s in slices]
+            errors = [e for f in futures for e in f.result()]
+        elapsed = time.perf_counter() - start
+
+        try:
+            with open(marketplace_path, 'r', encoding='utf-8') as f:
+                registered = Counter(p['name'] for p in json.load(f)['plugins'])
+        except ValueError as e:
+            print(f"FAIL: marketplace.json is not valid JSON: {e}")
+            sys.exit(1)
+
+        missing = [n for n in names if n not in registered]
+        duplicates = [n for n, c in registered.items() if c > 1]
+        print(f"{args.plugins} plugins, {args.processes} processes, "
+              f"{'naive' if args.naive else 'locked'}: {elapsed:.2f}s")
+        print(f"registered: {len(registered)}, missing: {len(missing)}, "
+              f"duplicates: {len(duplicates)}, errors: {len(errors)}")
+        for error in errors[:5]:
+            print(f"  {error}")
+
+        if missing or duplicates or errors:
+            print("FAIL")
+            sys.exit(1)
+        print("OK")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,14 +6,30 @@ List available coding standards and search by keywords.
 Usage:
     python list_standards.py                    # List all standards
     python list_standards.py --search "unity"   # Search by keyword
+    python list_standards.py --search "ｃ＃ async"  # Multi-term, normalized and prefix matches
     python list_standards.py --json             # Output as JSON
+    python list_standards.py --pack unity --section async      # One section of a standards.md
+    python list_standards.py --search "c#" --section naming,linq
+    python list_standards.py --pack unity --list-sections
+
+Searches go through a keyword index (exact and normalized forms of every
+keyword) cached in config/.cache/keyword_index.json and rebuilt only when
+language_packs.json changes. Prefix matches bisect the sorted normalized forms.
+
+Sections are read by byte range from a heading index of each standards.md
+("## N." headings outside code fences, mapped in order to the "sections"
+keys of the pack's metadata.json), cached in config/.cache/section_index.json
+and rebuilt per file when the file or its metadata.json changes.
 """
 
 import argparse
+import bisect
 import json
 import os
+import re
 import sys
 import io
+import unicodedata
 
 # Windows UTF-8 support
 if sys.platform == 'win32':
@@ -49,6 +65,394 @@ def load_language_packs():
         return {}
 
 
+KEYWORD_INDEX_VERSION = 2
+MIN_PREFIX_LENGTH = 2
+
+# Match strengths; prefix matches are scaled by how much of the keyword they cover
+EXACT_MATCH = 3.0
+NORMALIZED_MATCH = 2.0
+PREFIX_MATCH = 1.0
+
+# Canonical forms for common spellings of the same language, applied after
+# normalize_keyword has folded width/case and spelled out symbols
+KEYWORD_ALIASES = {
+    'cs': 'csharp',
+    'net': 'dotnet',
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+}
+
+TERM_SEPARATOR = re.compile(r'[\s,、，/]+')
+
+
+def fold_keyword(text):
+    """Fold full-width characters and case ('Ｕｎｉｔｙ' -> 'unity', 'Ｃ＃' -> 'c#')."""
+    return unicodedata.normalize('NFKC', text).strip().lower()
+
+
+def normalize_keyword(text):
+    """
+    Canonical form of a keyword for alias-insensitive matching.
+
+    Folds width and case, spells out '#' and '+', drops other punctuation and
+    spaces, then applies KEYWORD_ALIASES: 'C#', 'c sharp', 'cs' -> 'csharp';
+    '.NET', 'dot-net' -> 'dotnet'.
+    """
+    folded = fold_keyword(text).replace('#', 'sharp').replace('+', 'plus')
+    folded = re.sub(r'[\W_]+', '', folded)
+    if folded.startswith('dot') and KEYWORD_ALIASES.get(folded[3:]) == 'dotnet':
+        folded = folded[3:]
+    return KEYWORD_ALIASES.get(folded, folded)
+
+
+def get_keyword_index_path(config_path):
+    """Get the keyword index cache path (config/.cache/keyword_index.json)."""
+    return os.path.join(os.path.dirname(config_path), '.cache', 'keyword_index.json')
+
+
+def build_keyword_index(packs):
+    """
+    Build the keyword lookup tables for a language packs dict.
+
+    Each pack's key, display name (and its words) and keywords are indexed
+    under their folded form (exact) and their normalized form.
+
+    Returns:
+        Dict with packs, exact and normalized ({form: [pack keys]})
+    """
+    exact = {}
+    normalized = {}
+
+    def add(table, form, value):
+        entries = table.setdefault(form, [])
+        if value not in entries:
+            entries.append(value)
+
+    for key, pack in packs.items():
+        display_name = pack.get('display_name', key)
+        forms = [key, display_name] + display_name.split() + list(pack.get('keywords', []))
+        for form in forms:
+            folded = fold_keyword(form)
+            norm = normalize_keyword(form)
+            if not norm:
+                continue
+            add(exact, folded, key)
+            add(normalized, norm, key)
+
+    return {'packs': packs, 'exact': exact, 'normalized': normalized}
+
+
+def prefix_matches(index, norm):
+    """
+    Find packs with a normalized form that starts with norm (but is longer).
+
+    The sorted normalized forms are computed once per loaded index and
+    searched with bisect, so no per-prefix table is stored.
+
+    Returns:
+        Dict: pack key -> length of its shortest matching form
+    """
+    if len(norm) < MIN_PREFIX_LENGTH:
+        return {}
+    forms = index.get('sorted_forms')
+    if forms is None:
+        forms = index['sorted_forms'] = sorted(index['normalized'])
+    lengths = {}
+    for i in range(bisect.bisect_left(forms, norm), len(forms)):
+        form = forms[i]
+        if not form.startswith(norm):
+            break
+        if len(form) == len(norm):
+            continue
+        for key in index['normalized'][form]:
+            lengths[key] = min(lengths.get(key, len(form)), len(form))
+    return lengths
+
+
+def load_keyword_index(use_cache=True):
+    """
+    Load the keyword index, rebuilding it when language_packs.json changed.
+
+    The cache is keyed by the config's mtime and size.
+
+    Returns:
+        Keyword index dict (see build_keyword_index)
+    """
+    config_path = get_config_path()
+    index_path = get_keyword_index_path(config_path)
+    try:
+        st = os.stat(config_path)
+        signature = [st.st_mtime_ns, st.st_size]
+    except OSError:
+        signature = None
+
+    if use_cache and signature is not None:
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('version') == KEYWORD_INDEX_VERSION and cached.get('config') == signature:
+                return cached
+        except (OSError, ValueError):
+            pass
+
+    index = build_keyword_index(load_language_packs())
+    if use_cache and signature is not None:
+        index['version'] = KEYWORD_INDEX_VERSION
+        index['config'] = signature
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass
+    return index
+
+
+def match_term(index, term):
+    """
+    Match one search term against the keyword index.
+
+    Returns:
+        Dict: pack key -> (strength, match kind)
+    """
+    matches = {}
+
+    def offer(key, strength, kind):
+        if strength > matches.get(key, (0, None))[0]:
+            matches[key] = (strength, kind)
+
+    for key in index['exact'].get(fold_keyword(term), []):
+        offer(key, EXACT_MATCH, 'exact')
+    norm = normalize_keyword(term)
+    for key in index['normalized'].get(norm, []):
+        offer(key, NORMALIZED_MATCH, 'normalized')
+    for key, full_length in prefix_matches(index, norm).items():
+        offer(key, PREFIX_MATCH * len(norm) / full_length, 'prefix')
+    return matches
+
+
+def rank_standards(index, query):
+    """
+    Rank language packs for a (multi-term) query.
+
+    Each term contributes its strongest match per pack; the whole query is
+    also tried as one term (e.g. 'c sharp') and used when it scores higher.
+    Packs are ordered by score, then priority.
+
+    Returns:
+        List of (score, pack key, {term: match kind})
+    """
+    terms = [t for t in TERM_SEPARATOR.split(fold_keyword(query)) if t]
+    scores = {}
+    matched = {}
+    for term in terms:
+        for key, (strength, kind) in match_term(index, term).items():
+            scores[key] = scores.get(key, 0) + strength
+            matched.setdefault(key, {})[term] = kind
+
+    if len(terms) > 1:
+        for key, (strength, kind) in match_term(index, query).items():
+            if strength * len(terms) > scores.get(key, 0):
+                scores[key] = strength * len(terms)
+                matched[key] = {query: kind}
+
+    packs = index['packs']
+    return sorted(((score, key, matched[key]) for key, score in scores.items()),
+                  key=lambda r: (-r[0], packs[r[1]].get('priority', 999), r[1]))
+
+
+SECTION_INDEX_VERSION = 1
+SECTION_HEADING = re.compile(rb'^## (\d+)\.\s*(.*?)\s*$')
+
+
+def get_skill_dir():
+    """Get the coding-standards skill directory (pack file paths are relative to it)."""
+    return os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def scan_section_headings(path):
+    """
+    Find the numbered "## N. Title" sections of a standards file.
+
+    Lines inside ``` fences are ignored. A section runs until the next "## "
+    heading (numbered or not) or the end of the file.
+
+    Returns:
+        List of dicts with number, title, start and end (byte offsets)
+    """
+    sections = []
+    offset = 0
+    in_code = False
+    current = None
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.lstrip().startswith(b'```'):
+                in_code = not in_code
+            elif not in_code and line.startswith(b'## '):
+                if current:
+                    current['end'] = offset
+                    current = None
+                match = SECTION_HEADING.match(line)
+                if match:
+                    current = {'number': int(match.group(1)),
+                               'title': match.group(2).decode('utf-8', errors='replace'),
+                               'start': offset, 'end': None}
+                    sections.append(current)
+            offset += len(line)
+    if current:
+        current['end'] = offset
+    return sections
+
+
+def _stat_signature(path):
+    try:
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return None
+
+
+def load_section_index(packs, use_cache=True):
+    """
+    Heading index of every available pack's standards file.
+
+    Numbered sections are mapped in order to the "sections" keys of the pack's
+    metadata.json (section 1 -> first key); extra sections get key None.
+    Entries are reused while the standards file and metadata.json keep
+    their mtime and size.
+
+    Returns:
+        Dict: pack key -> {'file_path': ..., 'sections': [{key, number, title, start, end}]}
+    """
+    skill_dir = get_skill_dir()
+    index_path = os.path.join(os.path.dirname(get_config_path()), '.cache', 'section_index.json')
+    cached = {}
+    if use_cache:
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == SECTION_INDEX_VERSION:
+                cached = data.get('packs', {})
+        except (OSError, ValueError):
+            pass
+
+    index = {}
+    changed = False
+    for key, pack in packs.items():
+        if not pack.get('file_path'):
+            continue
+        file_path = os.path.join(skill_dir, pack['file_path'])
+        metadata_path = os.path.join(skill_dir, pack['metadata_path']) if pack.get('metadata_path') else None
+        signature = [pack['file_path'], _stat_signature(file_path),
+                     _stat_signature(metadata_path) if metadata_path else None]
+        if signature[1] is None:
+            continue
+
+        entry = cached.get(key)
+        if not entry or entry.get('signature') != signature:
+            section_keys = []
+            if metadata_path:
+                try:
+                    with open(metadata_path, 'r', encoding='utf-8') as f:
+                        section_keys = json.load(f).get('sections', [])
+                except (OSError, ValueError):
+                    pass
+            sections = scan_section_headings(file_path)
+            for i, section in enumerate(sections):
+                section['key'] = section_keys[i] if i < len(section_keys) else None
+            entry = {'signature': signature, 'file_path': pack['file_path'], 'sections': sections}
+            changed = True
+        index[key] = entry
+
+    if use_cache and (changed or set(index) != set(cached)):
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': SECTION_INDEX_VERSION, 'packs': index}, f,
+                          ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass
+    return index
+
+
+def find_section(entry, query):
+    """Find a section by metadata key or number (e.g. 'async' or '5'); None if absent."""
+    query = query.strip().lower()
+    for section in entry['sections']:
+        if (section['key'] or '').lower() == query or str(section['number']) == query:
+            return section
+    return None
+
+
+def read_sections(entry, sections):
+    """Read the byte ranges of the given sections from the pack's standards file."""
+    texts = []
+    with open(os.path.join(get_skill_dir(), entry['file_path']), 'rb') as f:
+        for section in sections:
+            f.seek(section['start'])
+            texts.append(f.read(section['end'] - section['start']).decode('utf-8', errors='replace'))
+    return texts
+
+
+def show_sections(pack_query, section_queries, list_only=False, use_cache=True):
+    """
+    Print selected sections (or the section list) of one pack's standards file.
+
+    Args:
+        pack_query: Pack key, or a search query whose top-ranked pack is used
+        section_queries: Section keys or numbers
+        list_only: Only list the sections with their keys and sizes
+
+    Returns:
+        True on success, False if the pack or a section was not found
+    """
+    keyword_index = load_keyword_index(use_cache)
+    packs = keyword_index['packs']
+    pack_key = pack_query if pack_query in packs else None
+    if pack_key is None:
+        ranked = rank_standards(keyword_index, pack_query)
+        pack_key = ranked[0][1] if ranked else None
+    if pack_key is None:
+        print(f"No standards found matching '{pack_query}'", file=sys.stderr)
+        return False
+
+    entry = load_section_index({pack_key: packs[pack_key]}, use_cache).get(pack_key)
+    if entry is None:
+        print(f"Standards file not found for '{pack_key}'", file=sys.stderr)
+        return False
+
+    if list_only:
+        print(f"## Sections of {entry['file_path']}\n")
+        print("| Key | Section | Bytes |")
+        print("|-----|---------|-------|")
+        for section in entry['sections']:
+            print(f"| {section['key'] or '-'} | {section['number']}. {section['title']} "
+                  f"| {section['end'] - section['start']} |")
+        return True
+
+    selected = []
+    for query in section_queries:
+        section = find_section(entry, query)
+        if section is None:
+            available = ', '.join(s['key'] or str(s['number']) for s in entry['sections'])
+            print(f"Section '{query}' not found in {entry['file_path']} (available: {available})",
+                  file=sys.stderr)
+            return False
+        if section not in selected:
+            selected.append(section)
+
+    for section, text in zip(selected, read_sections(entry, selected)):
+        print(f"<!-- {entry['file_path']} §{section['number']} ({section['key'] or '-'}) -->")
+        print(text.rstrip('\n'))
+        print()
+    return True
+
+
 def list_all_standards(as_json=False):
     """List all available coding standards."""
     packs = load_language_packs()
@@ -82,26 +486,24 @@ def list_all_standards(as_json=False):
         print(f"- **{display_name}**: {keywords} (詳細度: {detail_level})")
 
 
-def search_standards(keyword):
-    """Search for standards matching a keyword."""
-    packs = load_language_packs()
-    keyword_lower = keyword.lower()
+def search_standards(keyword, use_cache=True):
+    """Search for standards matching a keyword (or several terms)."""
+    index = load_keyword_index(use_cache)
+    packs = index['packs']
 
     matches = []
-    for key, pack in packs.items():
-        pack_keywords = [k.lower() for k in pack.get('keywords', [])]
-        if keyword_lower in pack_keywords or keyword_lower in key.lower():
-            matches.append({
-                'key': key,
-                'display_name': pack.get('display_name', key),
-                'file_path': pack.get('file_path'),
-                'status': pack.get('status', 'unknown'),
-                'priority': pack.get('priority', 999),
-                'detail_level': pack.get('detail_level', 'basic')
-            })
-
-    # Sort by priority
-    matches.sort(key=lambda x: x['priority'])
+    for score, key, matched in rank_standards(index, keyword):
+        pack = packs[key]
+        matches.append({
+            'key': key,
+            'display_name': pack.get('display_name', key),
+            'file_path': pack.get('file_path'),
+            'status': pack.get('status', 'unknown'),
+            'priority': pack.get('priority', 999),
+            'detail_level': pack.get('detail_level', 'basic'),
+            'score': score,
+            'matched': matched
+        })
 
     if not matches:
         print(f"No standards found matching '{keyword}'")
@@ -110,20 +512,35 @@ def search_standards(keyword):
     print(f"## Standards matching '{keyword}'\n")
     for match in matches:
         status_symbol = '✓' if match['status'] == 'available' else '○'
+        matched = ', '.join(f"{term} ({kind})" for term, kind in match['matched'].items())
         print(f"- **{match['display_name']}** [{status_symbol}]")
         print(f"  - File: {match['file_path']}")
         print(f"  - Detail Level: {match['detail_level']}")
+        print(f"  - Matched: {matched}")
 
 
 def main():
     parser = argparse.ArgumentParser(description='List and search coding standards')
     parser.add_argument('--search', '-s', type=str, help='Search by keyword')
     parser.add_argument('--json', '-j', action='store_true', help='Output as JSON')
+    parser.add_argument('--no-cache', action='store_true', help='Rebuild the keyword and section indexes in memory')
+    parser.add_argument('--pack', '-p', type=str,
+                        help='Language pack for --section (key or keyword; default: top --search result)')
+    parser.add_argument('--section', type=str,
+                        help='Print only these sections (metadata keys or numbers, comma-separated)')
+    parser.add_argument('--list-sections', action='store_true', help='List the sections of --pack')
 
     args = parser.parse_args()
 
-    if args.search:
-        search_standards(args.search)
+    if args.section or args.list_sections:
+        pack_query = args.pack or args.search
+        if not pack_query:
+            parser.error('--section/--list-sections require --pack or --search')
+        section_queries = [q for q in (args.section or '').split(',') if q.strip()]
+        if not show_sections(pack_query, section_queries, args.list_sections, not args.no_cache):
+            sys.exit(1)
+    elif args.search:
+        search_standards(args.search, not args.no_cache)
     else:
         list_all_standards(as_json=args.json)
 
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Retrieval index over individual coding-standards rules.
+
+Every bullet, table row and code example in references/*/standards.md is
+a rule. Code blocks are split into separate examples at a blank line
+followed by a comment line (e.g. "// ✅ 推奨" / "// ❌ 避ける"). Rules are
+tokenized CJK-aware (ASCII identifiers, split camelCase/snake_case parts,
+and kana/kanji bigrams). Their heading path is added at half weight, and
+they are stored as TF-IDF vectors in an inverted index.
+
+The index is kept in config/.cache/rule_index.json. Only standards files
+whose mtime or size changed are re-parsed; the IDF weights and postings
+are then recomputed from the stored term counts.
+
+Usage:
+    python rule_index.py build [--rebuild]
+    python rule_index.py query "string concatenation in Update loop" [-k 5] [--pack unity]
+    python rule_index.py query "GetComponent<Transform>()" --kind code --json
+"""
+
+import argparse
+import glob
+import io
+import json
+import math
+import os
+import re
+import sys
+import unicodedata
+
+# Windows UTF-8 support
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+RULE_INDEX_VERSION = 1
+RULE_KINDS = ['bullet', 'table', 'code']
+SECTION_WEIGHT = 0.5
+SYNONYM_WEIGHT = 0.5
+
+# Rules below this cosine similarity share only incidental terms with the
+# query (e.g. one common bigram) and are dropped rather than padding top_k
+MIN_SCORE = 0.15
+
+TOKEN_PATTERN = re.compile(
+    r'(?P<word>[A-Za-z][A-Za-z0-9_]*)'
+    r'|(?P<number>[0-9]+)'
+    r'|(?P<cjk>[぀-ヿ㐀-䶿一-鿿ｦ-ﾟ]+)'
+)
+CAMEL_PARTS = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+HEADING_PATTERN = re.compile(r'^(#{2,4})\s+(.+?)\s*$')
+BULLET_PATTERN = re.compile(r'^(\s*)(?:[-*+]|\d+\.)\s+(.+)$')
+TABLE_SEPARATOR = re.compile(r'^\|?[\s:|-]+\|?$')
+COMMENT_LINE = re.compile(r'^(?://|#(?!if|endif|region|endregion|pragma)|/\*)')
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'do', 'for', 'from', 'how', 'i',
+    'if', 'in', 'is', 'it', 'of', 'on', 'or', 'should', 'the', 'to', 'use', 'what',
+    'when', 'with',
+}
+
+# English query terms expanded to the Japanese wording of the standards
+QUERY_SYNONYMS = {
+    'string': '文字列',
+    'concatenation': '連結',
+    'concat': '連結',
+    'loop': 'ループ',
+    'naming': '命名',
+    'name': '命名',
+    'exception': '例外',
+    'async': '非同期',
+    'asynchronous': '非同期',
+    'performance': 'パフォーマンス',
+    'comment': 'コメント',
+    'test': 'テスト',
+    'security': 'セキュリティ',
+    'class': 'クラス',
+    'method': 'メソッド',
+    'collection': 'コレクション',
+    'indent': 'インデント',
+    'prohibited': '禁止',
+    'forbidden': '禁止',
+    'validation': '検証',
+}
+
+
+def get_skill_dir():
+    """Get the coding-standards skill directory."""
+    return os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def get_index_path():
+    """Get the rule index path (<plugin>/config/.cache/rule_index.json)."""
+    return os.path.normpath(os.path.join(get_skill_dir(), '..', '..', 'config', '.cache', 'rule_index.json'))
+
+
+def tokenize(text):
+    """
+    Split text into index terms.
+
+    ASCII identifiers are lowercased and, when they are camelCase or
+    snake_case, also contribute their parts (StringBuilder -> stringbuilder,
+    string, builder). Runs of kana/kanji become overlapping bigrams (a single
+    character stays as is). Full-width characters are folded first.
+    """
+    terms = []
+    for match in TOKEN_PATTERN.finditer(unicodedata.normalize('NFKC', text)):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == 'word':
+            lower = token.lower()
+            if lower in STOPWORDS:
+                continue
+            terms.append(lower)
+            parts = [p.lower() for chunk in token.split('_') for p in CAMEL_PARTS.findall(chunk)]
+            if len(parts) > 1:
+                terms.extend(p for p in parts if len(p) > 1 and p not in STOPWORDS)
+        elif kind == 'number':
+            terms.append(token)
+        elif len(token) == 1:
+            terms.append(token)
+        else:
+            terms.extend(token[i:i + 2] for i in range(len(token) - 1))
+    return terms
+
+
+def _split_code(lines):
+    """Split a code block into examples at blank lines followed by a comment line."""
+    chunks = [[]]
+    for i, line in enumerate(lines):
+        if chunks[-1] and i > 0 and not lines[i - 1].strip() and COMMENT_LINE.match(line):
+            chunks.append([])
+        chunks[-1].append(line)
+    return [chunk for chunk in chunks if any(line.strip() for line in chunk)]
+
+
+def extract_rules(text):
+    """
+    Extract the rules of one standards file.
+
+    Returns:
+        List of dicts with kind, section (heading path), line (1-based) and text
+    """
+    rules = []
+    headings = []
+    lines = text.split('\n')
+    table_header = None
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if stripped.startswith('```'):
+            block = []
+            start = i + 1
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith('```'):
+                block.append(lines[i])
+                i += 1
+            offset = 0
+            for chunk in _split_code(block):
+                offset = block.index(chunk[0], offset)
+                rules.append({'kind': 'code', 'section': ' > '.join(headings),
+                              'line': start + offset + 1, 'text': '\n'.join(chunk).strip('\n')})
+            i += 1
+            continue
+
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            level = len(heading.group(1))
+            headings = headings[:level - 2] + [heading.group(2)]
+            table_header = None
+        elif stripped.startswith('|'):
+            cells = [cell.strip() for cell in stripped.strip('|').split('|')]
+            if TABLE_SEPARATOR.match(stripped):
+                pass
+            elif table_header is None:
+                table_header = cells
+            else:
+                rules.append({'kind': 'table', 'section': ' > '.join(headings), 'line': i + 1,
+                              'text': ' | '.join(cells), 'header': ' | '.join(table_header)})
+        else:
+            table_header = None
+            bullet = BULLET_PATTERN.match(line)
+            if bullet:
+                indent = len(bullet.group(1))
+                text_lines = [bullet.group(2)]
+                # Indented continuation lines (not nested bullets) belong to the bullet
+                while (i + 1 < len(lines) and lines[i + 1].strip()
+                       and len(lines[i + 1]) - len(lines[i + 1].lstrip()) > indent
+                       and not BULLET_PATTERN.match(lines[i + 1])
+                       and not lines[i + 1].strip().startswith('```')):
+                    i += 1
+                    text_lines.append(lines[i].strip())
+                rules.append({'kind': 'bullet', 'section': ' > '.join(headings),
+                              'line': i + 2 - len(text_lines), 'text': ' '.join(text_lines)})
+        i += 1
+    return rules
+
+
+def _term_counts(rule):
+    counts = {}
+    for term in tokenize(rule['text']):
+        counts[term] = counts.get(term, 0) + 1
+    for term in tokenize(rule['section']):
+        counts[term] = counts.get(term, 0) + SECTION_WEIGHT
+    return counts
+
+
+def find_standards_files(skill_dir=None):
+    """Map pack name -> path of references/<pack>/standards.md."""
+    skill_dir = skill_dir or get_skill_dir()
+    paths = sorted(glob.glob(os.path.join(skill_dir, 'references', '*', 'standards.md')))
+    return {os.path.basename(os.path.dirname(path)): path for path in paths}
+
+
+def load_index():
+    """Load the persisted index, or None if missing or another version."""
+    try:
+        with open(get_index_path(), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get('version') == RULE_INDEX_VERSION else None
+
+
+def _signature(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def is_stale(index):
+    """Whether any standards file was added, removed or changed since the index was built."""
+    files = find_standards_files()
+    if set(files) != set(index['files']):
+        return True
+    try:
+        return any(_signature(path) != index['files'][pack]['signature'] for pack, path in files.items())
+    except OSError:
+        return True
+
+
+def build_index(rebuild=False, stats=None):
+    """
+    Update the rule index, re-parsing only changed standards files.
+
+    Args:
+        rebuild: Ignore the persisted index
+        stats: Optional dict; 'parsed' and 'reused' files are counted
+
+    Returns:
+        Index dict with files ({pack: {signature, rules}}), postings
+        ({term: [[rule id, weight]]}), idf and rules ([pack, rule index])
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('parsed', 0)
+    stats.setdefault('reused', 0)
+
+    old = None if rebuild else load_index()
+    old_files = old['files'] if old else {}
+    files = {}
+    for pack, path in find_standards_files().items():
+        signature = _signature(path)
+        entry = old_files.get(pack)
+        if entry and entry['signature'] == signature:
+            stats['reused'] += 1
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                rules = extract_rules(f.read())
+            for rule in rules:
+                rule['terms'] = _term_counts(rule)
+            entry = {'signature': signature, 'rules': rules}
+            stats['parsed'] += 1
+        files[pack] = entry
+
+    # Global weights depend on every file, so they are always recomputed
+    rule_refs = [[pack, i] for pack in sorted(files) for i in range(len(files[pack]['rules']))]
+    df = {}
+    for pack, i in rule_refs:
+        for term in files[pack]['rules'][i]['terms']:
+            df[term] = df.get(term, 0) + 1
+    total = len(rule_refs)
+    idf = {term: math.log((total + 1) / (count + 1)) + 1 for term, count in df.items()}
+
+    postings = {}
+    for rule_id, (pack, i) in enumerate(rule_refs):
+        weights = {term: (1 + math.log(count)) * idf[term] if count >= 1 else count * idf[term]
+                   for term, count in files[pack]['rules'][i]['terms'].items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        for term, weight in weights.items():
+            postings.setdefault(term, []).append([rule_id, round(weight / norm, 6)])
+
+    index = {'version': RULE_INDEX_VERSION, 'files': files, 'rules': rule_refs,
+             'idf': idf, 'postings': postings}
+    if stats['parsed'] or set(files) != set(old_files):
+        index_path = get_index_path()
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass
+    return index
+
+
+def get_index(update=True):
+    """Load the index, updating it first when a standards file changed."""
+    index = load_index()
+    if index is None or (update and is_stale(index)):
+        index = build_index()
+    return index
+
+
+def query_rules(index, query, top_k=5, pack=None, kind=None, min_score=MIN_SCORE):
+    """
+    Rank rules by cosine similarity to a question or code snippet.
+
+    English terms with an entry in QUERY_SYNONYMS also match their Japanese
+    wording at SYNONYM_WEIGHT. Rules scoring below min_score are dropped, so
+    fewer than top_k rules may be returned.
+
+    Returns:
+        List of (score, pack, rule dict)
+    """
+    counts = {}
+    for term in tokenize(query):
+        counts[term] = counts.get(term, 0) + 1
+        if term in QUERY_SYNONYMS:
+            for synonym in tokenize(QUERY_SYNONYMS[term]):
+                counts[synonym] = counts.get(synonym, 0) + SYNONYM_WEIGHT
+
+    weights = {}
+    for term, count in counts.items():
+        if term in index['idf']:
+            weights[term] = (1 + math.log(count) if count >= 1 else count) * index['idf'][term]
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+
+    scores = {}
+    for term, weight in weights.items():
+        for rule_id, rule_weight in index['postings'][term]:
+            scores[rule_id] = scores.get(rule_id, 0.0) + weight / norm * rule_weight
+
+    results = []
+    for rule_id, score in sorted(scores.items(), key=lambda item: (-item[1], item[0])):
+        if score < min_score:
+            break
+        rule_pack, i = index['rules'][rule_id]
+        rule = index['files'][rule_pack]['rules'][i]
+        if (pack and rule_pack != pack) or (kind and rule['kind'] != kind):
+            continue
+        results.append((score, rule_pack, rule))
+        if len(results) >= top_k:
+            break
+    return results
+
+
+def print_results(results, max_lines=20):
+    """Print query results as markdown."""
+    if not results:
+        print("No matching rules found.")
+        return
+    for rank, (score, pack, rule) in enumerate(results, 1):
+        print(f"### {rank}. {pack} / {rule['section']} (line {rule['line']}, {rule['kind']}, score {score:.3f})\n")
+        if rule['kind'] == 'code':
+            lines = rule['text'].split('\n')
+            print('```')
+            print('\n'.join(lines[:max_lines]))
+            if len(lines) > max_lines:
+                print(f"// ... ({len(lines) - max_lines} more lines)")
+            print('```')
+        elif rule['kind'] == 'table':
+            print(f"| {rule['header']} |")
+            print(f"| {rule['text']} |")
+        else:
+            print(f"- {rule['text']}")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Retrieval index over coding-standards rules')
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+
+    build_parser = subparsers.add_parser('build', help='Build or update the rule index')
+    build_parser.add_argument('--rebuild', action='store_true', help='Re-parse every standards file')
+
+    query_parser = subparsers.add_parser('query', help='Find the rules relevant to a question or code')
+    query_parser.add_argument('query', help='Question or code snippet')
+    query_parser.add_argument('-k', '--top', type=int, default=5, help='Number of rules to return')
+    query_parser.add_argument('--pack', default=None, help='Only rules of this language pack')
+    query_parser.add_argument('--kind', choices=RULE_KINDS, default=None, help='Only rules of this kind')
+    query_parser.add_argument('--min-score', type=float, default=MIN_SCORE,
+                              help=f'Drop rules scoring below this (default: {MIN_SCORE})')
+    query_parser.add_argument('--max-lines', type=int, default=20, help='Truncate code examples')
+    query_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    query_parser.add_argument('--no-update', action='store_true',
+                              help='Do not check standards files for changes')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        stats = {}
+        index = build_index(args.rebuild, stats)
+        counts = {kind: 0 for kind in RULE_KINDS}
+        for entry in index['files'].values():
+            for rule in entry['rules']:
+                counts[rule['kind']] += 1
+        print(f"✅ Rule index: {len(index['rules'])} rules from {len(index['files'])} file(s) "
+              f"({', '.join(f'{n} {kind}' for kind, n in counts.items())})")
+        print(f"   {stats['parsed']} file(s) parsed, {stats['reused']} unchanged, "
+              f"{len(index['postings'])} terms")
+        print(f"   {get_index_path()}")
+    elif args.command == 'query':
+        index = get_index(update=not args.no_update)
+        results = query_rules(index, args.query, args.top, args.pack, args.kind, args.min_score)
+        if args.json:
+            print(json.dumps([
+                {'score': round(score, 4), 'pack': pack, 'section': rule['section'],
+                 'line': rule['line'], 'kind': rule['kind'], 'text': rule['text']}
+                for score, pack, rule in results
+            ], ensure_ascii=False, indent=2))
+        else:
+            print_results(results, args.max_lines)
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Move old learning log entries into compressed monthly archives.
+
+Entries older than the cutoff are moved from the log into
+<log-name>_archive/YYYY-MM.md.gz (or .md.zst when the zstandard package is
+installed). A small index.json in the archive directory records the date range
+of each archive so readers can skip archives without decompressing them.
+
+Usage:
+    python archive_log.py --before <YYYY-MM-DD> [--log-file <path>] [--codec gzip|zstd]
+    python archive_log.py --list [--log-file <path>]
+"""
+
+import argparse
+from datetime import datetime
+import gzip
+import io
+import json
+import os
+import re
+import sys
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Force UTF-8 encoding for stdout/stderr on Windows
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+INDEX_VERSION = 1
+CODEC_EXTENSIONS = {
+    'gzip': '.md.gz',
+    'zstd': '.md.zst',
+}
+
+HEADER_PATTERN = re.compile(r'^### (\d{4}-\d{2}-\d{2} \d{2}:\d{2}) - ', re.MULTILINE)
+
+
+def get_archive_dir(log_file):
+    """Get the archive directory for a log file (<log-dir>/<log-name>_archive)."""
+    log_dir = os.path.dirname(os.path.abspath(log_file))
+    log_name = os.path.splitext(os.path.basename(log_file))[0]
+    return os.path.join(log_dir, f"{log_name}_archive")
+
+
+def split_entries(text):
+    """
+    Split log text into its preamble and raw entry blocks.
+
+    Returns:
+        Tuple of (preamble, entries) where entries is a list of
+        (timestamp, block) and block is the entry text up to the next header
+    """
+    headers = list(HEADER_PATTERN.finditer(text))
+    if not headers:
+        return text, []
+
+    preamble = text[:headers[0].start()]
+    entries = []
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        entries.append((header.group(1), text[header.start():end]))
+    return preamble, entries
+
+
+def open_archive(path, codec):
+    """
+    Open an archive as a streaming UTF-8 text reader.
+
+    Args:
+        path: Path to the archive file
+        codec: 'gzip' or 'zstd'
+
+    Returns:
+        Text stream (use as a context manager)
+    """
+    if codec == 'gzip':
+        return gzip.open(path, 'rt', encoding='utf-8')
+    if codec == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstandard package is required to read .zst archives")
+        raw = open(path, 'rb')
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding='utf-8')
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def _write_archive(path, codec, text):
+    """Write archive text atomically."""
+    tmp_path = path + '.tmp'
+    data = text.encode('utf-8')
+    if codec == 'gzip':
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(data)
+    else:
+        with open(tmp_path, 'wb') as f:
+            f.write(zstandard.ZstdCompressor(level=10).compress(data))
+    os.replace(tmp_path, path)
+
+
+def load_archive_index(archive_dir):
+    """
+    Load the archive index.
+
+    Returns:
+        List of dicts with file, codec, first, last and entries, sorted by date
+    """
+    index_path = os.path.join(archive_dir, 'index.json')
+    if not os.path.exists(index_path):
+        return []
+
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Archive index unreadable ({e}); ignoring archives", file=sys.stderr)
+        return []
+
+    return sorted(index.get('archives', []), key=lambda a: a['first'])
+
+
+def _save_archive_index(archive_dir, archives):
+    index_path = os.path.join(archive_dir, 'index.json')
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': INDEX_VERSION,
+            'archives': sorted(archives, key=lambda a: a['first'])
+        }, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, index_path)
+
+
+def iter_archive_streams(log_file, since=None, until=None):
+    """
+    Open the archives of a log file that may hold entries in a date range.
+
+    Archives whose indexed date range lies entirely outside [since, until] are
+    skipped without being opened.
+
+    Args:
+        log_file: Path to the learning log file
+        since: Optional datetime; skip archives that end before it
+        until: Optional datetime; skip archives that start after it
+
+    Yields:
+        Text streams of the matching archives, oldest first
+    """
+    archive_dir = get_archive_dir(log_file)
+    for archive in load_archive_index(archive_dir):
+        last = datetime.strptime(archive['last'], "%Y-%m-%d %H:%M")
+        first = datetime.strptime(archive['first'], "%Y-%m-%d %H:%M")
+        if since is not None and last < since:
+            continue
+        if until is not None and first > until:
+            continue
+        with open_archive(os.path.join(archive_dir, archive['file']), archive['codec']) as stream:
+            yield stream
+
+
+def archive_entries(log_file, cutoff, codec='gzip'):
+    """
+    Move entries older than cutoff from the log into monthly archives.
+
+    Existing archives for the same month are merged. Archives and the index
+    are written before the log is rewritten, so an interruption can leave an
+    entry in both places but never in neither.
+
+    Args:
+        log_file: Path to the learning log file
+        cutoff: datetime; entries strictly before it are archived
+        codec: 'gzip' or 'zstd'
+
+    Returns:
+        Number of entries archived
+    """
+    with open(log_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    preamble, entries = split_entries(text)
+    cutoff_str = cutoff.strftime("%Y-%m-%d %H:%M")
+    old = [e for e in entries if e[0] < cutoff_str]
+    if not old:
+        return 0
+    keep = [e for e in entries if e[0] >= cutoff_str]
+
+    by_month = {}
+    for timestamp, block in old:
+        by_month.setdefault(timestamp[:7], []).append((timestamp, block))
+
+    archive_dir = get_archive_dir(log_file)
+    os.makedirs(archive_dir, exist_ok=True)
+    archives = {a['file'][:7]: a for a in load_archive_index(archive_dir)}
+
+    for month, month_entries in sorted(by_month.items()):
+        existing = archives.get(month)
+        if existing:
+            with open_archive(os.path.join(archive_dir, existing['file']), existing['codec']) as f:
+                _, previous = split_entries(f.read())
+            month_entries = previous + month_entries
+        month_entries.sort(key=lambda e: e[0])
+
+        body = ''.join(block if block.endswith('\n') else block + '\n'
+                       for _, block in month_entries)
+        file_name = month + CODEC_EXTENSIONS[codec]
+        _write_archive(os.path.join(archive_dir, file_name), codec,
+                       f"# Learning Log Archive {month}\n\n{body}")
+        if existing and existing['file'] != file_name:
+            os.remove(os.path.join(archive_dir, existing['file']))
+
+        archives[month] = {
+            'file': file_name,
+            'codec': codec,
+            'first': month_entries[0][0],
+            'last': month_entries[-1][0],
+            'entries': len(month_entries)
+        }
+
+    _save_archive_index(archive_dir, archives.values())
+
+    tmp_path = log_file + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(preamble + ''.join(block for _, block in keep))
+    os.replace(tmp_path, log_file)
+
+    return len(old)
+
+
+def list_archives(log_file):
+    """Display the archives of a log file."""
+    archives = load_archive_index(get_archive_dir(log_file))
+    if not archives:
+        print("ℹ️  アーカイブはありません")
+        return
+
+    print(f"\n📦 アーカイブ ({len(archives)}件)")
+    print("-"*60)
+    for archive in archives:
+        print(f"  {archive['file']}: {archive['first']} 〜 {archive['last']} "
+              f"({archive['entries']}件)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move old learning log entries into compressed archives"
+    )
+    parser.add_argument(
+        "--log-file",
+        default="docs/learning_log.md",
+        help="Path to learning log file (default: docs/learning_log.md)"
+    )
+    parser.add_argument(
+        "--before",
+        help="Archive entries older than this date (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--codec",
+        choices=sorted(CODEC_EXTENSIONS),
+        default='gzip',
+        help="Compression codec (default: gzip; zstd needs the zstandard package)"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List existing archives"
+    )
+
+    args = parser.parse_args()
+
+    if args.list:
+        list_archives(args.log_file)
+        return
+
+    if not args.before:
+        parser.print_help()
+        return
+
+    if not os.path.exists(args.log_file):
+        print("❌ Log file not found", file=sys.stderr)
+        sys.exit(1)
+
+    if args.codec == 'zstd' and zstandard is None:
+        print("❌ zstd codec requires the zstandard package (pip install zstandard)", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        cutoff = datetime.strptime(args.before, "%Y-%m-%d")
+    except ValueError:
+        print(f"❌ Invalid date: {args.before} (expected YYYY-MM-DD)", file=sys.stderr)
+        sys.exit(1)
+
+    count = archive_entries(args.log_file, cutoff, args.codec)
+    if count == 0:
+        print(f"ℹ️  {args.before} より前のエントリーはありません")
+        return
+
+    print(f"✅ {count}件のエントリーをアーカイブしました")
+    print(f"   Archive: {get_archive_dir(args.log_file)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Find past learning log entries related to a new entry.
+
+Entries are indexed as sparse TF-IDF vectors over CJK bigrams and ASCII words.
+The index is persisted next to the log file (docs/.cache/) and only the entries
+appended since the last run are tokenized, so a lookup stays cheap even when the
+log holds tens of thousands of entries.
+
+Usage:
+    python related_entries.py [--log-file <path>] [--top <n>]
+    python related_entries.py --query "<text>" [--log-file <path>]
+    python related_entries.py --rebuild [--log-file <path>]
+"""
+
+import argparse
+from array import array
+from collections import Counter
+import hashlib
+import heapq
+import math
+import os
+import pickle
+import re
+import sys
+import io
+import unicodedata
+
+# Force UTF-8 encoding for stdout/stderr on Windows
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+INDEX_VERSION = 1
+
+# Query terms that occur in more than this fraction of entries carry almost no
+# signal (particles, common suffixes) and are skipped once the log is large.
+MAX_DF_RATIO = 0.2
+MAX_DF_MIN_ENTRIES = 1000
+
+# Doc norms are recomputed with fresh IDF weights once the log has grown by this
+# factor since the last full refresh; in between, appended entries use the
+# current IDF and older norms are left as-is.
+NORM_REFRESH_GROWTH = 1.1
+
+HEADER_PATTERN = re.compile(r'^### (\d{4}-\d{2}-\d{2} \d{2}:\d{2}) - (.+)$', re.MULTILINE)
+TOKEN_PATTERN = re.compile(
+    r'[a-z0-9][a-z0-9_+#.-]*'
+    r'|[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+'
+)
+
+
+def tokenize(text):
+    """
+    Split text into index terms.
+
+    ASCII runs become lowercase words; runs of kana/kanji become overlapping
+    character bigrams (a single-character run is kept as a unigram).
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(unicodedata.normalize('NFKC', text).lower()):
+        word = match.group(0)
+        if word[0] < '\u3040':
+            word = word.rstrip('.-')
+            if len(word) > 1:
+                tokens.append(word)
+        elif len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def entry_text(body):
+    """Strip reference quotes and supplement markers from an entry body."""
+    lines = []
+    for line in body.split('\n'):
+        if line.startswith('>') or line.startswith('**🤖 AI補足'):
+            continue
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def get_index_path(log_file):
+    """Get the index path for a log file (<log-dir>/.cache/<log-name>.related.pickle)."""
+    log_dir = os.path.dirname(os.path.abspath(log_file))
+    log_name = os.path.splitext(os.path.basename(log_file))[0]
+    return os.path.join(log_dir, '.cache', f"{log_name}.related.pickle")
+
+
+def _tail_digest(data, offset):
+    """Digest of the bytes just before offset, used to detect rewritten logs."""
+    return hashlib.sha1(data[max(0, offset - 256):offset]).hexdigest()
+
+
+def _empty_index():
+    return {
+        'version': INDEX_VERSION,
+        'indexed_bytes': 0,
+        'tail_digest': _tail_digest(b'', 0),
+        'entries': [],
+        'postings': {},
+        'norms': array('d'),
+        'norm_count': 0,
+    }
+
+
+def _idf(df, n):
+    return math.log((n + 1) / (df + 1)) + 1.0
+
+
+def _refresh_norms(index):
+    """Recompute every document norm with the current IDF weights."""
+    n = len(index['entries'])
+    sums = [0.0] * n
+    for docs, weights in index['postings'].values():
+        idf = _idf(len(docs), n)
+        idf_sq = idf * idf
+        for doc, weight in zip(docs, weights):
+            sums[doc] += weight * weight * idf_sq
+    index['norms'] = array('d', (math.sqrt(s) or 1.0 for s in sums))
+    index['norm_count'] = n
+
+
+def _add_entry(index, timestamp, category, body):
+    """Append one entry to the index."""
+    doc = len(index['entries'])
+    text = entry_text(body)
+    title = next((line.strip() for line in text.split('\n') if line.strip()), '')
+    index['entries'].append((timestamp, category, title[:80]))
+
+    counts = Counter(tokenize(f"{category}\n{text}"))
+    postings = index['postings']
+    n = doc + 1
+    norm_sq = 0.0
+    for term, tf in counts.items():
+        weight = 1.0 + math.log(tf)
+        posting = postings.get(term)
+        if posting is None:
+            posting = postings[term] = (array('I'), array('f'))
+        posting[0].append(doc)
+        posting[1].append(weight)
+        idf = _idf(len(posting[0]), n)
+        norm_sq += (weight * idf) ** 2
+    index['norms'].append(math.sqrt(norm_sq) or 1.0)
+
+
+def split_tail(text):
+    """
+    Split log text into complete entries and the trailing (open) entry.
+
+    Returns:
+        Tuple of (entries, open_start) where entries is a list of
+        (start, timestamp, category, body) for every entry followed by another
+        header, and open_start is the character offset of the last header
+        (or None if there are no headers).
+    """
+    headers = list(HEADER_PATTERN.finditer(text))
+    if not headers:
+        return [], None
+
+    entries = []
+    for current, following in zip(headers, headers[1:]):
+        body = text[current.end():following.start()]
+        entries.append((current.start(), current.group(1), current.group(2).strip(), body))
+    return entries, headers[-1].start()
+
+
+def load_index(log_file, rebuild=False):
+    """
+    Load the index for a log file, indexing any newly completed entries.
+
+    Only the bytes after the last indexed entry are read and tokenized. The
+    index is rebuilt from scratch if the log was truncated or rewritten.
+
+    Returns:
+        Tuple of (index, open_entry) where open_entry is (timestamp, category,
+        body) of the latest entry, or None if the log has no entries.
+    """
+    index_path = get_index_path(log_file)
+    index = None
+    if not rebuild and os.path.exists(index_path):
+        try:
+            with open(index_path, 'rb') as f:
+                index = pickle.load(f)
+            if index.get('version') != INDEX_VERSION:
+                index = None
+        except Exception:
+            index = None
+
+    with open(log_file, 'rb') as f:
+        if index is not None:
+            offset = index['indexed_bytes']
+            start = max(0, offset - 256)
+            f.seek(start)
+            data = f.read()
+            if (offset - start > len(data)
+                    or _tail_digest(data, offset - start) != index['tail_digest']):
+                index = None
+        if index is None:
+            index = _empty_index()
+            f.seek(0)
+            start = 0
+            data = f.read()
+
+    offset = index['indexed_bytes']
+    tail = data[offset - start:].decode('utf-8')
+    entries, open_start = split_tail(tail)
+
+    for _, timestamp, category, body in entries:
+        _add_entry(index, timestamp, category, body)
+
+    open_entry = None
+    if open_start is not None:
+        match = HEADER_PATTERN.match(tail, open_start)
+        open_entry = (match.group(1), match.group(2).strip(), tail[match.end():])
+
+    if entries:
+        new_offset = offset + len(tail[:open_start].encode('utf-8'))
+        index['indexed_bytes'] = new_offset
+        index['tail_digest'] = _tail_digest(data, new_offset - start)
+        if len(index['entries']) >= index['norm_count'] * NORM_REFRESH_GROWTH:
+            _refresh_norms(index)
+        save_index(index, index_path)
+
+    return index, open_entry
+
+
+def save_index(index, index_path):
+    """Persist the index atomically."""
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    tmp_path = index_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, index_path)
+
+
+def find_related(index, text, top=5):
+    """
+    Rank indexed entries by cosine similarity to text.
+
+    Only the posting lists of the query's terms are visited, so the cost
+    depends on how common those terms are rather than on the log size.
+
+    Returns:
+        List of (score, timestamp, category, title) tuples, best first.
+    """
+    n = len(index['entries'])
+    if n == 0:
+        return []
+
+    postings = index['postings']
+    terms = []
+    query_norm_sq = 0.0
+    for term, tf in Counter(tokenize(text)).items():
+        posting = postings.get(term)
+        if posting is None:
+            continue
+        idf = _idf(len(posting[0]), n)
+        query_weight = (1.0 + math.log(tf)) * idf
+        query_norm_sq += query_weight * query_weight
+        terms.append((query_weight * idf, posting))
+
+    if n >= MAX_DF_MIN_ENTRIES:
+        selective = [t for t in terms if len(t[1][0]) <= n * MAX_DF_RATIO]
+        terms = selective or terms
+
+    scores = {}
+    get = scores.get
+    for factor, (docs, weights) in terms:
+        for doc, weight in zip(docs, weights):
+            scores[doc] = get(doc, 0.0) + factor * weight
+
+    if not scores:
+        return []
+
+    norms = index['norms']
+    query_norm = math.sqrt(query_norm_sq)
+    best = heapq.nlargest(top, scores.items(), key=lambda item: item[1] / norms[item[0]])
+    return [
+        (value / (norms[doc] * query_norm), *index['entries'][doc])
+        for doc, value in best
+    ]
+
+
+def display_related(related):
+    """Display related entries."""
+    print("\n🔗 関連する過去のエントリー")
+    print("-"*60)
+    if not related:
+        print("  (関連エントリーなし)")
+    for score, timestamp, category, title in related:
+        print(f"  {score:.2f}  [{category}] {timestamp}  {title}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find past learning log entries related to the latest entry"
+    )
+    parser.add_argument(
+        "--log-file",
+        default="docs/learning_log.md",
+        help="Path to learning log file (default: docs/learning_log.md)"
+    )
+    parser.add_argument(
+        "--query",
+        help="Text to match instead of the latest entry"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=5,
+        help="Number of related entries to show (default: 5)"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the index from scratch"
+    )
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.log_file):
+        print("❌ Log file not found", file=sys.stderr)
+        sys.exit(1)
+
+    index, open_entry = load_index(args.log_file, rebuild=args.rebuild)
+
+    if args.query:
+        query = args.query
+    elif open_entry is not None:
+        timestamp, category, body = open_entry
+        query = f"{category}\n{entry_text(body)}"
+    else:
+        print("❌ No entries found in log file", file=sys.stderr)
+        sys.exit(1)
+
+    display_related(find_related(index, query, args.top))
+
+
+if __name__ == "__main__":
+    main()
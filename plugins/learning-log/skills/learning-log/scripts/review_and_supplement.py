@@ -8,6 +8,7 @@ and allows appending AI-generated supplements marked with 🤖 AI補足:.
 
 Usage:
     python review_and_supplement.py [--log-file <path>] [--supplement <text>] [--reference <text>]
+    python review_and_supplement.py --review-only --related [--log-file <path>]
 """
 
 import argparse
@@ -23,15 +24,22 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
-def get_latest_entry(log_file: str):
+def get_latest_entry(log_file: str, include_archives: bool = True):
     """
     Get the latest entry from the learning log.
 
+    If every entry has been moved to archives (see archive_log.py) and
+    include_archives is set, the newest archive is read instead. Archived
+    entries are for review only; supplements are never appended for them.
+
     Args:
         log_file: Path to the learning log file
+        include_archives: Fall back to the newest archive
 
     Returns:
-        Tuple of (category, content, timestamp) or None if no entries
+        Tuple of (category, content, timestamp, archive) where archive is the
+        archive file name the entry came from (None for the live log), or
+        None if no entries
     """
     if not os.path.exists(log_file):
         return None
@@ -43,8 +51,22 @@ def get_latest_entry(log_file: str):
     pattern = r'### (\d{4}-\d{2}-\d{2} \d{2}:\d{2}) - (.+?)\n(.*?)(?=\n### |\Z)'
     matches = list(re.finditer(pattern, content, re.DOTALL))
 
+    archive = None
     if not matches:
-        return None
+        if not include_archives:
+            return None
+        from archive_log import get_archive_dir, load_archive_index, open_archive
+        archive_dir = get_archive_dir(log_file)
+        archives = load_archive_index(archive_dir)
+        if not archives:
+            return None
+        newest = max(archives, key=lambda a: a['last'])
+        with open_archive(os.path.join(archive_dir, newest['file']), newest['codec']) as f:
+            content = f.read()
+        matches = list(re.finditer(pattern, content, re.DOTALL))
+        if not matches:
+            return None
+        archive = newest['file']
 
     # Get the latest entry (last match)
     latest = matches[-1]
@@ -52,7 +74,7 @@ def get_latest_entry(log_file: str):
     category = latest.group(2).strip()
     entry_content = latest.group(3).strip()
 
-    return category, entry_content, timestamp
+    return category, entry_content, timestamp, archive
 
 
 def add_supplement(log_file: str, supplement: str, reference: str = None):
@@ -68,6 +90,11 @@ def add_supplement(log_file: str, supplement: str, reference: str = None):
         print("❌ Log file not found", file=sys.stderr)
         sys.exit(1)
 
+    # The supplement is appended to the end of the log, so it must end with an entry
+    if get_latest_entry(log_file, include_archives=False) is None:
+        print("❌ ログファイルにエントリーがないため、補足を追加できません", file=sys.stderr)
+        sys.exit(1)
+
     # Format supplement
     now = datetime.now()
     time_str = now.strftime("%H:%M")
@@ -85,7 +112,7 @@ def add_supplement(log_file: str, supplement: str, reference: str = None):
     print(f"   Time: {time_str}")
 
 
-def display_entry(category: str, content: str, timestamp: str):
+def display_entry(category: str, content: str, timestamp: str, archive: str = None):
     """
     Display an entry for review.
 
@@ -93,12 +120,15 @@ def display_entry(category: str, content: str, timestamp: str):
         category: Entry category
         content: Entry content
         timestamp: Entry timestamp
+        archive: Archive file name if the entry is archived
     """
     print("\n" + "="*60)
     print(f"📝 最新のエントリー")
     print("="*60)
     print(f"カテゴリ: {category}")
     print(f"時刻: {timestamp}")
+    if archive:
+        print(f"アーカイブ: {archive}")
     print("-"*60)
     print(content)
     print("="*60 + "\n")
@@ -121,6 +151,11 @@ def main():
         "--reference",
         help="Temporary reference material"
     )
+    parser.add_argument(
+        "--related",
+        action="store_true",
+        help="Also show the 5 most similar past entries"
+    )
     parser.add_argument(
         "--review-only",
         action="store_true",
@@ -136,10 +171,15 @@ def main():
         print("❌ No entries found in log file", file=sys.stderr)
         sys.exit(1)
 
-    category, content, timestamp = result
+    category, content, timestamp, archive = result
 
     # Display entry
-    display_entry(category, content, timestamp)
+    display_entry(category, content, timestamp, archive)
+
+    if args.related:
+        from related_entries import load_index, find_related, display_related, entry_text
+        index, _ = load_index(args.log_file)
+        display_related(find_related(index, f"{category}\n{entry_text(content)}"))
 
     # If review only, exit
     if args.review_only:
@@ -147,6 +187,10 @@ def main():
         return
 
     # Add supplement if provided
+    if args.supplement and archive:
+        print("❌ 最新のエントリーはアーカイブ済みのため、補足を追加できません。"
+              "新しいエントリーを記録してから実行してください。", file=sys.stderr)
+        sys.exit(1)
     if args.supplement:
         add_supplement(args.log_file, args.supplement, args.reference)
     else:
@@ -8,6 +8,8 @@ for creating summaries by topic, time period, or custom criteria.
 
 Usage:
     python summarize.py [--log-file <path>] [--output <path>] [--format <format>]
+    python summarize.py --since 2026-01-01 --until 2026-01-31 --list
+    python summarize.py --history [--log-file <path>]
 """
 
 import argparse
@@ -16,7 +18,8 @@ import os
 import sys
 import re
 import io
-from collections import defaultdict
+import subprocess
+from collections import Counter, defaultdict
 
 # Force UTF-8 encoding for stdout/stderr on Windows
 if sys.platform == 'win32':
@@ -35,81 +38,120 @@ class LogEntry:
         self.references = references
 
 
-def parse_log_file(log_file: str):
+def parse_log_file(log_file: str, since=None, until=None):
     """
-    Parse the learning log file and extract entries.
+    Parse the learning log file and its archives and extract entries.
+
+    Archived entries (see archive_log.py) are read first through streaming
+    decompression; archives outside [since, until] are skipped unopened.
+    Every file is parsed line by line and only entries inside the range are
+    kept.
 
     Args:
         log_file: Path to the learning log file
+        since: Optional datetime; drop entries before it
+        until: Optional datetime; drop entries after it
 
     Returns:
         List of LogEntry objects
     """
-    if not os.path.exists(log_file):
-        return []
+    from archive_log import iter_archive_streams
+
+    def in_range(entry):
+        return (since is None or entry.timestamp >= since) and (until is None or entry.timestamp <= until)
 
     entries = []
-    current_entry = None
+    for stream in iter_archive_streams(log_file, since, until):
+        entries.extend(e for e in iter_log_entries(stream) if in_range(e))
+
+    if os.path.exists(log_file):
+        with open(log_file, 'r', encoding='utf-8') as f:
+            entries.extend(e for e in iter_log_entries(f) if in_range(e))
 
-    with open(log_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    return entries
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].rstrip()
+
+def iter_log_entries(lines):
+    """
+    Yield entries from the lines of a learning log (or archive).
+
+    Lines are consumed one at a time, so a file object is parsed without
+    reading it into memory.
+
+    Args:
+        lines: Iterable of lines (e.g. an open file)
+
+    Yields:
+        LogEntry objects
+    """
+    current_entry = None
+    # What the following lines belong to: 'content' (the line after a
+    # header), 'supplement' or 'references'
+    mode = None
+    block = []
+
+    def finish_block():
+        if current_entry and mode in ('supplement', 'references'):
+            current_entry[mode] = '\n'.join(block).strip()
+
+    for raw_line in lines:
+        line = raw_line.rstrip()
+
+        if mode == 'content':
+            current_entry['content'] = line
+            mode = None
+            continue
+        if mode == 'supplement':
+            if not line.startswith('>') and not line.startswith('###'):
+                block.append(line)
+                continue
+            finish_block()
+            mode = None
+        elif mode == 'references':
+            if line.startswith('>'):
+                block.append(line.lstrip('> ').rstrip())
+                continue
+            finish_block()
+            mode = None
 
         # Match entry header: ### YYYY-MM-DD HH:MM - カテゴリ
         header_match = re.match(r'^### (\d{4}-\d{2}-\d{2} \d{2}:\d{2}) - (.+)$', line)
         if header_match:
-            # Save previous entry if exists
             if current_entry:
-                entries.append(current_entry)
-
-            timestamp_str = header_match.group(1)
-            category = header_match.group(2)
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M")
-
-            # Get content (next line)
-            i += 1
-            content = lines[i].rstrip() if i < len(lines) else ""
-
+                yield LogEntry(**current_entry)
             current_entry = {
-                'timestamp': timestamp,
-                'category': category,
-                'content': content,
+                'timestamp': datetime.strptime(header_match.group(1), "%Y-%m-%d %H:%M"),
+                'category': header_match.group(2),
+                'content': "",
                 'supplement': None,
                 'references': None
             }
+            mode = 'content'
 
         # Match AI supplement
         elif line.startswith('**🤖 AI補足'):
-            i += 1
-            supplement_lines = []
-            while i < len(lines) and not lines[i].startswith('>') and not lines[i].startswith('###'):
-                supplement_lines.append(lines[i].rstrip())
-                i += 1
-            if current_entry:
-                current_entry['supplement'] = '\n'.join(supplement_lines).strip()
-            i -= 1  # Back up one line
+            mode, block = 'supplement', []
 
         # Match references
         elif line.startswith('> 📚 参照:'):
-            i += 1
-            ref_lines = []
-            while i < len(lines) and lines[i].startswith('>'):
-                ref_lines.append(lines[i].lstrip('> ').rstrip())
-                i += 1
-            if current_entry:
-                current_entry['references'] = '\n'.join(ref_lines).strip()
-            i -= 1  # Back up one line
+            mode, block = 'references', []
 
-        i += 1
-
-    # Add last entry
+    finish_block()
     if current_entry:
-        entries.append(current_entry)
+        yield LogEntry(**current_entry)
+
+
+def parse_log_lines(lines):
+    """
+    Extract entries from the lines of a learning log (or archive).
+
+    Args:
+        lines: Iterable of lines
 
-    return [LogEntry(**e) for e in entries]
+    Returns:
+        List of LogEntry objects
+    """
+    return list(iter_log_entries(lines))
 
 
 def display_entries(entries, title="📝 ログエントリー"):
@@ -165,6 +207,155 @@ def group_by_date(entries, granularity='day'):
     return dict(groups)
 
 
+HISTORY_HEADER_PATTERN = re.compile(rb'^### \d{4}-\d{2}-\d{2} \d{2}:\d{2} - .*$', re.MULTILINE)
+
+
+def iter_log_versions(log_file):
+    """
+    Stream every committed version of the log file from git object storage.
+
+    Commits are listed with a single `git log` and blobs are read through one
+    long-running `git cat-file --batch` process, so no revision is checked out.
+
+    Args:
+        log_file: Path to the learning log file (inside a git work tree)
+
+    Yields:
+        Tuples of (commit, author, timestamp, content) oldest first; content
+        is the blob bytes, or None if the file was deleted in that commit
+    """
+    log_path = os.path.abspath(log_file)
+    root = subprocess.run(
+        ['git', 'rev-parse', '--show-toplevel'],
+        cwd=os.path.dirname(log_path), capture_output=True, text=True, check=True
+    ).stdout.strip()
+    rel_path = os.path.relpath(log_path, root).replace(os.sep, '/')
+
+    commits = subprocess.run(
+        ['git', 'log', '--reverse', '--format=%H%x00%an%x00%at', '--', rel_path],
+        cwd=root, capture_output=True, text=True, encoding='utf-8', check=True
+    ).stdout.splitlines()
+
+    with subprocess.Popen(['git', 'cat-file', '--batch'], cwd=root,
+                          stdin=subprocess.PIPE, stdout=subprocess.PIPE) as cat_file:
+        for line in commits:
+            commit, author, timestamp = line.split('\0')
+            cat_file.stdin.write(f"{commit}:{rel_path}\n".encode('utf-8'))
+            cat_file.stdin.flush()
+
+            header = cat_file.stdout.readline()
+            if header.endswith(b' missing\n'):
+                content = None
+            else:
+                size = int(header.split()[2])
+                content = cat_file.stdout.read(size)
+                cat_file.stdout.read(1)  # Trailing newline after each object
+
+            yield commit, author, datetime.fromtimestamp(int(timestamp)), content
+
+        cat_file.stdin.close()
+
+
+def _changed_range(old, new):
+    """
+    Locate the region that differs between two versions of the log.
+
+    Returns:
+        Tuple of (start, old_end, new_end): old[start:old_end] was replaced by
+        new[start:new_end]. start is backed up to a line boundary. For an
+        append-only change this is (len(old), len(old), len(new)).
+    """
+    if new.startswith(old):
+        return len(old), len(old), len(new)
+
+    def longest(matches, limit):
+        low, high = 0, limit
+        while low < high:
+            mid = (low + high + 1) // 2
+            if matches(mid):
+                low = mid
+            else:
+                high = mid - 1
+        return low
+
+    shortest = min(len(old), len(new))
+    prefix = longest(lambda n: old[:n] == new[:n], shortest)
+    start = old.rfind(b'\n', 0, prefix) + 1
+    suffix = longest(lambda n: old[len(old) - n:] == new[len(new) - n:], shortest - start)
+    return start, len(old) - suffix, len(new) - suffix
+
+
+def collect_history(log_file):
+    """
+    Count entries added and removed by each commit to the log file.
+
+    Only the region that changed since the previous version is scanned,
+    which for an append-only log is just the new tail. Entry headers in that
+    region are compared as a multiset, so an edited header counts as one
+    entry removed and one added.
+
+    Returns:
+        List of dicts with commit, author, timestamp, added and removed
+    """
+    history = []
+    previous = b''
+
+    for commit, author, timestamp, content in iter_log_versions(log_file):
+        content = content or b''
+        start, old_end, new_end = _changed_range(previous, content)
+        new_headers = Counter(HISTORY_HEADER_PATTERN.findall(content, start, new_end))
+        old_headers = Counter(HISTORY_HEADER_PATTERN.findall(previous, start, old_end))
+        added = sum((new_headers - old_headers).values())
+        removed = sum((old_headers - new_headers).values())
+        history.append({
+            'commit': commit,
+            'author': author,
+            'timestamp': timestamp,
+            'added': added,
+            'removed': removed
+        })
+        previous = content
+
+    return history
+
+
+def display_history(history):
+    """
+    Display entries added per commit and per author over time.
+
+    Args:
+        history: List of dicts from collect_history
+    """
+    print(f"\n{'='*60}")
+    print(f"📜 学習ログ履歴 ({len(history)}コミット)")
+    print(f"{'='*60}\n")
+
+    for item in history:
+        change = f"+{item['added']}"
+        if item['removed']:
+            change += f" -{item['removed']}"
+        print(f"{item['timestamp'].strftime('%Y-%m-%d %H:%M')} {item['commit'][:8]} "
+              f"{item['author']}: {change}")
+
+    by_author = defaultdict(lambda: defaultdict(int))
+    for item in history:
+        by_author[item['author']][item['timestamp'].strftime('%Y-%m')] += item['added']
+
+    print(f"\n👤 作者別（月ごとの追加エントリー数）:")
+    for author, months in sorted(by_author.items()):
+        print(f"  {author}: {sum(months.values())}件")
+        for month, count in sorted(months.items()):
+            print(f"    {month}: {count}件")
+
+
+def _parse_date(value):
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date: {value} (expected YYYY-MM-DD)")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Summarize learning log entries")
     parser.add_argument("--log-file", default="docs/learning_log.md",
@@ -175,11 +366,30 @@ def main():
                         help="Group by category")
     parser.add_argument("--by-date", choices=['day', 'week', 'month'],
                         help="Group by time period")
+    parser.add_argument("--since", type=_parse_date,
+                        help="Only include entries on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--until", type=_parse_date,
+                        help="Only include entries on or before this date (YYYY-MM-DD)")
+    parser.add_argument("--history", action="store_true",
+                        help="Show entries added per commit and author from git history")
 
     args = parser.parse_args()
 
-    # Parse log file
-    entries = parse_log_file(args.log_file)
+    if args.history:
+        try:
+            history = collect_history(args.log_file)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ git履歴を読み込めませんでした: {e}", file=sys.stderr)
+            sys.exit(1)
+        if not history:
+            print("❌ ログファイルのコミット履歴が見つかりませんでした")
+            return
+        display_history(history)
+        return
+
+    # Parse log file (and archives)
+    until = args.until.replace(hour=23, minute=59) if args.until else None
+    entries = parse_log_file(args.log_file, args.since, until)
 
     if not entries:
         print("❌ ログエントリーが見つかりませんでした")
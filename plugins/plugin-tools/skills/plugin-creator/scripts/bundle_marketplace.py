@@ -0,0 +1,666 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build content-addressed marketplace bundles for distribution.
+
+A bundle is a directory with a manifest.json and a blobs/ store. Every file
+of the marketplace (.claude-plugin/marketplace.json and plugins/) is stored
+once under the SHA-256 of its content (zlib-compressed), so identical files
+in different plugins share one blob. The manifest maps each relative path to
+[sha256, size, executable] and is identified by the hash of that mapping.
+
+A delta bundle describes the same target state but only carries the blobs
+its base does not already have; unpacking it over a tree that matches the
+base rewrites only the changed files.
+
+Usage:
+    python bundle_marketplace.py build <out-dir> [--root <root>] [--base <bundle>]
+    python bundle_marketplace.py delta <base-bundle> <target-bundle> <out-dir>
+    python bundle_marketplace.py unpack <bundle> <dest-dir>
+    python bundle_marketplace.py verify <bundle> [--dest <dest-dir>]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import stat
+import sys
+import zlib
+
+# Windows UTF-8 support
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+BUNDLE_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+BLOBS_DIR = 'blobs'
+# Written into an unpacked tree so later unpacks can skip re-hashing
+STATE_NAME = '.bundle-state.json'
+HASH_CACHE_VERSION = 1
+COMPRESS_LEVEL = 6
+
+IGNORED_DIRS = {'.cache', '__pycache__', '.git'}
+IGNORED_FILES = {'.DS_Store', STATE_NAME}
+IGNORED_SUFFIXES = ('.pyc', '.pyo', '.tmp', '.lock')
+DIGEST_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+# Below this many files to hash a thread pool costs more than it saves
+PARALLEL_HASH_THRESHOLD = 64
+
+
+def get_default_root():
+    """Get the marketplace root relative to this script."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(script_dir, '..', '..', '..', '..', '..'))
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _blob_path(bundle_dir, digest):
+    return os.path.join(bundle_dir, BLOBS_DIR, digest[:2], digest[2:])
+
+
+def _is_ignored_file(name):
+    return name in IGNORED_FILES or name.endswith(IGNORED_SUFFIXES)
+
+
+def iter_marketplace_files(root):
+    """
+    Yield (rel_path, abs_path, stat) for every file that belongs in a bundle.
+
+    Covers .claude-plugin/marketplace.json and everything under plugins/,
+    skipping caches, bytecode, temp/lock files and init_plugin staging dirs.
+    """
+    marketplace_json = os.path.join(root, '.claude-plugin', 'marketplace.json')
+    if os.path.isfile(marketplace_json):
+        yield '.claude-plugin/marketplace.json', marketplace_json, os.stat(marketplace_json)
+
+    stack = [(os.path.join(root, 'plugins'), 'plugins')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            continue
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORED_DIRS and not entry.name.startswith('.init-staging-'):
+                    stack.append((entry.path, rel_path))
+            elif entry.is_file() and not _is_ignored_file(entry.name):
+                yield rel_path, entry.path, entry.stat()
+
+
+def _hash_cache_path(root):
+    return os.path.join(root, 'plugins', '.cache', 'bundle_hashes.json')
+
+
+def _load_hash_cache(root):
+    try:
+        with open(_hash_cache_path(root), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != HASH_CACHE_VERSION:
+        return {}
+    return data.get('files', {})
+
+
+def _save_hash_cache(root, files):
+    cache_path = _hash_cache_path(root)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': HASH_CACHE_VERSION, 'files': files}, f, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _hash_files(paths):
+    """Hash several files, in a thread pool when there are enough of them."""
+    if len(paths) >= PARALLEL_HASH_THRESHOLD:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor() as pool:
+            return list(pool.map(_sha256_file, paths))
+    return [_sha256_file(path) for path in paths]
+
+
+def scan_tree(root, use_cache=True):
+    """
+    Describe the marketplace under root as a manifest file mapping.
+
+    Hashes are reused from plugins/.cache/bundle_hashes.json while a file's
+    mtime and size are unchanged.
+
+    Returns:
+        tuple: (files, paths) where files maps rel_path to [sha256, size, executable]
+        and paths maps rel_path to the absolute path
+    """
+    cache = _load_hash_cache(root) if use_cache else {}
+    files = {}
+    paths = {}
+    to_hash = []
+    new_cache = {}
+    for rel_path, abs_path, st in iter_marketplace_files(root):
+        paths[rel_path] = abs_path
+        executable = bool(st.st_mode & stat.S_IXUSR)
+        cached = cache.get(rel_path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            files[rel_path] = [cached[2], st.st_size, executable]
+            new_cache[rel_path] = cached
+        else:
+            files[rel_path] = [None, st.st_size, executable]
+            to_hash.append((rel_path, st))
+
+    for (rel_path, st), digest in zip(to_hash, _hash_files([paths[r] for r, _ in to_hash])):
+        files[rel_path][0] = digest
+        new_cache[rel_path] = [st.st_mtime_ns, st.st_size, digest]
+
+    if use_cache and (to_hash or len(new_cache) != len(cache)):
+        _save_hash_cache(root, new_cache)
+    return dict(sorted(files.items())), paths
+
+
+def manifest_id(files):
+    """Identify a marketplace state by the hash of its canonical file mapping."""
+    canonical = json.dumps(files, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def is_safe_rel_path(rel_path):
+    """
+    Whether a manifest path is a plain relative path.
+
+    Absolute paths, drive letters, backslashes and '.'/'..'/empty components
+    are rejected so a bundle can never address files outside its destination.
+    """
+    if not isinstance(rel_path, str) or not rel_path or '\\' in rel_path or '\0' in rel_path:
+        return False
+    if rel_path.startswith('/') or os.path.isabs(rel_path) or re.match(r'^[A-Za-z]:', rel_path):
+        return False
+    return all(part not in ('', '.', '..') for part in rel_path.split('/'))
+
+
+def _validate_manifest(manifest):
+    """Return an error message for a malformed or unsafe manifest, or None."""
+    files = manifest.get('files')
+    if not isinstance(files, dict):
+        return "Manifest has no file list"
+    for rel_path, entry in files.items():
+        if not is_safe_rel_path(rel_path):
+            return f"Unsafe path in manifest: {rel_path!r}"
+        if (not isinstance(entry, list) or len(entry) != 3 or not isinstance(entry[0], str)
+                or not DIGEST_PATTERN.match(entry[0])):
+            return f"Invalid file entry in manifest: {rel_path!r}"
+    for rel_path in manifest.get('removed', []):
+        if not is_safe_rel_path(rel_path):
+            return f"Unsafe path in manifest: {rel_path!r}"
+    for digest in manifest.get('blobs', []):
+        if not isinstance(digest, str) or not DIGEST_PATTERN.match(digest):
+            return f"Invalid blob digest in manifest: {digest!r}"
+    return None
+
+
+def _dest_path(dest, rel_path):
+    """
+    Resolve a manifest path under dest.
+
+    Raises:
+        ValueError: if the resolved path (following symlinks) leaves dest
+    """
+    root = os.path.realpath(dest)
+    path = os.path.join(root, *rel_path.split('/'))
+    if not os.path.realpath(path).startswith(root + os.sep):
+        raise ValueError(f"Path escapes the destination: {rel_path}")
+    return path
+
+
+def load_manifest(bundle):
+    """
+    Load a bundle manifest.
+
+    Manifests with absolute or parent-relative paths, or malformed entries,
+    are rejected.
+
+    Args:
+        bundle: Bundle directory or path to its manifest.json
+
+    Returns:
+        tuple: (manifest, error)
+    """
+    manifest_path = os.path.join(bundle, MANIFEST_NAME) if os.path.isdir(bundle) else bundle
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON in manifest: {e}"
+    except Exception as e:
+        return None, f"Error reading manifest: {e}"
+    if not isinstance(manifest, dict) or manifest.get('version') != BUNDLE_VERSION:
+        return None, f"Unsupported bundle version: {manifest.get('version') if isinstance(manifest, dict) else None}"
+    error = _validate_manifest(manifest)
+    if error:
+        return None, error
+    return manifest, None
+
+
+def _write_manifest(out_dir, manifest):
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def _write_blob(out_dir, digest, data, compressed=False):
+    blob_path = _blob_path(out_dir, digest)
+    if os.path.exists(blob_path):
+        return os.path.getsize(blob_path)
+    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+    payload = data if compressed else zlib.compress(data, COMPRESS_LEVEL)
+    tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, blob_path)
+    return len(payload)
+
+
+def _prepare_out_dir(out_dir):
+    if os.path.exists(os.path.join(out_dir, MANIFEST_NAME)):
+        return f"Bundle already exists: {out_dir}"
+    os.makedirs(os.path.join(out_dir, BLOBS_DIR), exist_ok=True)
+    return None
+
+
+def _make_manifest(files, blobs, base=None):
+    manifest = {
+        'version': BUNDLE_VERSION,
+        'id': manifest_id(files),
+        'base': None,
+        'files': files,
+        'removed': [],
+        'blobs': sorted(blobs),
+    }
+    if base is not None:
+        manifest['base'] = base['id']
+        manifest['removed'] = sorted(set(base['files']) - set(files))
+    return manifest
+
+
+def build_bundle(root, out_dir, base_bundle=None, use_cache=True):
+    """
+    Build a full (or, with base_bundle, delta) bundle from the tree under root.
+
+    Args:
+        root: Marketplace root
+        out_dir: Bundle directory to create
+        base_bundle: Bundle or manifest.json the delta is relative to
+        use_cache: Reuse file hashes from plugins/.cache/bundle_hashes.json
+
+    Returns:
+        tuple: (manifest, stats, error) where stats has files, blobs, raw_bytes,
+        unique_bytes and stored_bytes
+    """
+    base = None
+    if base_bundle:
+        base, error = load_manifest(base_bundle)
+        if error:
+            return None, None, error
+
+    files, paths = scan_tree(root, use_cache)
+    base_blobs = {entry[0] for entry in base['files'].values()} if base else set()
+
+    error = _prepare_out_dir(out_dir)
+    if error:
+        return None, None, error
+
+    stats = {'files': len(files), 'blobs': 0, 'raw_bytes': 0, 'unique_bytes': 0, 'stored_bytes': 0}
+    blobs = set()
+    for rel_path, (digest, size, _) in files.items():
+        stats['raw_bytes'] += size
+        if digest in blobs or digest in base_blobs:
+            continue
+        with open(paths[rel_path], 'rb') as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != digest:
+            return None, None, f"File changed while bundling: {rel_path}"
+        blobs.add(digest)
+        stats['unique_bytes'] += size
+        stats['stored_bytes'] += _write_blob(out_dir, digest, data)
+    stats['blobs'] = len(blobs)
+
+    manifest = _make_manifest(files, blobs, base)
+    _write_manifest(out_dir, manifest)
+    return manifest, stats, None
+
+
+def build_delta(base_bundle, target_bundle, out_dir):
+    """
+    Build a delta bundle between two existing bundles.
+
+    The delta has the target's file mapping and only the blobs that the
+    base's files do not reference. Blobs are copied without recompression.
+
+    Returns:
+        tuple: (manifest, stats, error)
+    """
+    base, error = load_manifest(base_bundle)
+    if error:
+        return None, None, error
+    target, error = load_manifest(target_bundle)
+    if error:
+        return None, None, error
+    if not os.path.isdir(target_bundle):
+        return None, None, "Target must be a bundle directory (its blobs are copied)"
+
+    base_blobs = {entry[0] for entry in base['files'].values()}
+    needed = sorted({entry[0] for entry in target['files'].values()} - base_blobs)
+
+    error = _prepare_out_dir(out_dir)
+    if error:
+        return None, None, error
+
+    stats = {'files': len(target['files']), 'blobs': len(needed), 'raw_bytes': 0,
+             'unique_bytes': 0, 'stored_bytes': 0}
+    sizes = {entry[0]: entry[1] for entry in target['files'].values()}
+    for digest in needed:
+        src = _blob_path(target_bundle, digest)
+        try:
+            with open(src, 'rb') as f:
+                payload = f.read()
+        except OSError:
+            return None, None, f"Target bundle is missing blob {digest} (is it a delta?)"
+        stats['unique_bytes'] += sizes[digest]
+        stats['stored_bytes'] += _write_blob(out_dir, digest, payload, compressed=True)
+
+    manifest = _make_manifest(target['files'], needed, base)
+    _write_manifest(out_dir, manifest)
+    return manifest, stats, None
+
+
+def _read_blob(bundle_dir, digest):
+    """Return the verified content of a blob, or None if absent or corrupt."""
+    try:
+        with open(_blob_path(bundle_dir, digest), 'rb') as f:
+            data = zlib.decompress(f.read())
+    except (OSError, zlib.error):
+        return None
+    if hashlib.sha256(data).hexdigest() != digest:
+        return None
+    return data
+
+
+def _load_state(dest):
+    try:
+        with open(os.path.join(dest, STATE_NAME), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != BUNDLE_VERSION:
+            return None
+        state['files'] = {rel_path: entry for rel_path, entry in state.get('files', {}).items()
+                          if is_safe_rel_path(rel_path)}
+        return state
+    except (OSError, ValueError):
+        return None
+
+
+def _current_hashes(dest, rel_paths, state):
+    """
+    Hash the given files under dest, trusting the unpack state for files
+    whose mtime and size match what was recorded.
+
+    Returns:
+        dict: rel_path -> sha256 (missing files are omitted)
+    """
+    recorded = state.get('files', {}) if state else {}
+    hashes = {}
+    to_hash = []
+    paths = {}
+    for rel_path in rel_paths:
+        try:
+            path = _dest_path(dest, rel_path)
+            st = os.stat(path)
+        except (OSError, ValueError):
+            continue
+        paths[rel_path] = path
+        entry = recorded.get(rel_path)
+        if entry and entry[1] == st.st_mtime_ns and entry[2] == st.st_size:
+            hashes[rel_path] = entry[0]
+        else:
+            to_hash.append(rel_path)
+    for rel_path, digest in zip(to_hash, _hash_files([paths[r] for r in to_hash])):
+        hashes[rel_path] = digest
+    return hashes
+
+
+def _set_executable(path, executable):
+    mode = os.stat(path).st_mode
+    exec_bits = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+    new_mode = (mode | (mode & 0o444) >> 2) if executable else mode & ~exec_bits
+    if new_mode != mode:
+        os.chmod(path, new_mode)
+
+
+def unpack_bundle(bundle_dir, dest):
+    """
+    Bring dest to the bundle's state, rewriting only files whose content differs.
+
+    A delta bundle needs dest to already hold the base state; content missing
+    from the bundle is taken from the matching files in dest. All new content
+    is staged as temp files before anything is replaced, so a missing blob
+    leaves dest untouched.
+
+    Returns:
+        tuple: (success, message)
+    """
+    manifest, error = load_manifest(bundle_dir)
+    if error:
+        return False, error
+
+    os.makedirs(dest, exist_ok=True)
+    state = _load_state(dest)
+    files = manifest['files']
+    previous = set(state['files']) if state else set()
+    removed = (previous | set(manifest.get('removed', []))) - set(files)
+
+    current = _current_hashes(dest, sorted(set(files) | previous), state)
+    local_sources = {}
+    for rel_path, digest in current.items():
+        local_sources.setdefault(digest, rel_path)
+
+    changed = [rel_path for rel_path, (digest, _, _) in files.items() if current.get(rel_path) != digest]
+    staged = []
+    try:
+        for rel_path in changed:
+            digest = files[rel_path][0]
+            data = _read_blob(bundle_dir, digest)
+            if data is None and digest in local_sources:
+                with open(_dest_path(dest, local_sources[digest]), 'rb') as f:
+                    data = f.read()
+                if hashlib.sha256(data).hexdigest() != digest:
+                    data = None
+            if data is None:
+                raise ValueError(f"Missing or corrupt blob {digest} for {rel_path}"
+                                 f"{' (unpack the base bundle first)' if manifest.get('base') else ''}")
+            path = _dest_path(dest, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Re-check once the parent directories exist (a symlinked parent may escape)
+            path = _dest_path(dest, rel_path)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            staged.append((tmp_path, path))
+    except (OSError, ValueError) as e:
+        for tmp_path, _ in staged:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return False, str(e)
+
+    for tmp_path, path in staged:
+        os.replace(tmp_path, path)
+    for rel_path, (_, _, executable) in files.items():
+        path = _dest_path(dest, rel_path)
+        if os.name != 'nt' and bool(os.stat(path).st_mode & stat.S_IXUSR) != executable:
+            _set_executable(path, executable)
+
+    for rel_path in sorted(removed):
+        try:
+            path = _dest_path(dest, rel_path)
+            os.remove(path)
+        except (OSError, ValueError):
+            continue
+        parent = os.path.dirname(path)
+        while os.path.abspath(parent) != os.path.abspath(dest):
+            try:
+                os.rmdir(parent)
+            except OSError:
+                break
+            parent = os.path.dirname(parent)
+
+    new_state = {'version': BUNDLE_VERSION, 'id': manifest['id'], 'files': {}}
+    for rel_path, (digest, _, _) in files.items():
+        st = os.stat(_dest_path(dest, rel_path))
+        new_state['files'][rel_path] = [digest, st.st_mtime_ns, st.st_size]
+    state_path = os.path.join(dest, STATE_NAME)
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(new_state, f, separators=(',', ':'))
+    os.replace(tmp_path, state_path)
+
+    return True, (f"Unpacked {manifest['id'][:12]} into {dest}: {len(changed)} file(s) written, "
+                  f"{len(files) - len(changed)} unchanged, {len(removed)} removed")
+
+
+def verify_bundle(bundle_dir, dest=None):
+    """
+    Check a bundle's integrity, and optionally that dest matches it.
+
+    Verifies the manifest id, that every listed blob decompresses to content
+    with its hash, and (with dest) that every file in dest hashes to its
+    manifest entry. Files in dest are always re-hashed.
+
+    Returns:
+        List of error messages (empty if everything matches)
+    """
+    manifest, error = load_manifest(bundle_dir)
+    if error:
+        return [error]
+
+    errors = []
+    if manifest_id(manifest['files']) != manifest['id']:
+        errors.append("Manifest id does not match its file list")
+    referenced = {entry[0] for entry in manifest['files'].values()}
+    for digest in manifest['blobs']:
+        if digest not in referenced:
+            errors.append(f"Blob {digest} is not referenced by any file")
+        elif _read_blob(bundle_dir, digest) is None:
+            errors.append(f"Missing or corrupt blob {digest}")
+    if manifest.get('base') is None:
+        for digest in sorted(referenced - set(manifest['blobs'])):
+            errors.append(f"Full bundle does not contain blob {digest}")
+
+    if dest:
+        rel_paths = sorted(manifest['files'])
+        hashes = _current_hashes(dest, rel_paths, None)
+        for rel_path in rel_paths:
+            if rel_path not in hashes:
+                errors.append(f"Missing in {dest}: {rel_path}")
+            elif hashes[rel_path] != manifest['files'][rel_path][0]:
+                errors.append(f"Content differs in {dest}: {rel_path}")
+    return errors
+
+
+def _format_size(num_bytes):
+    for unit in ('B', 'KiB', 'MiB'):
+        if num_bytes < 1024 or unit == 'MiB':
+            return f"{num_bytes:.0f} {unit}" if unit == 'B' else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+
+def print_build_stats(manifest, stats, out_dir):
+    """Print a build/delta summary."""
+    kind = 'Delta' if manifest['base'] else 'Bundle'
+    print(f"✅ {kind} written: {out_dir} ({manifest['id'][:12]})")
+    if manifest['base']:
+        print(f"   Base: {manifest['base'][:12]}, {len(manifest['removed'])} file(s) removed")
+    print(f"   {stats['files']} file(s), {stats['blobs']} blob(s) stored")
+    if stats['raw_bytes']:
+        print(f"   {_format_size(stats['raw_bytes'])} total, "
+              f"{_format_size(stats['unique_bytes'])} unique, "
+              f"{_format_size(stats['stored_bytes'])} compressed")
+    else:
+        print(f"   {_format_size(stats['unique_bytes'])} new, "
+              f"{_format_size(stats['stored_bytes'])} compressed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build content-addressed marketplace bundles')
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+
+    build_parser = subparsers.add_parser('build', help='Bundle the marketplace tree')
+    build_parser.add_argument('out_dir', help='Bundle directory to create')
+    build_parser.add_argument('--root', default=None, help='Marketplace root (default: auto-detected)')
+    build_parser.add_argument('--base', default=None,
+                              help='Build a delta against this bundle (or its manifest.json)')
+    build_parser.add_argument('--no-cache', action='store_true', help='Re-hash every file')
+
+    delta_parser = subparsers.add_parser('delta', help='Build a delta between two bundles')
+    delta_parser.add_argument('base', help='Base bundle (or its manifest.json)')
+    delta_parser.add_argument('target', help='Target bundle directory')
+    delta_parser.add_argument('out_dir', help='Delta bundle directory to create')
+
+    unpack_parser = subparsers.add_parser('unpack', help='Unpack a bundle into a directory')
+    unpack_parser.add_argument('bundle', help='Bundle directory')
+    unpack_parser.add_argument('dest', help='Destination marketplace root')
+
+    verify_parser = subparsers.add_parser('verify', help='Verify a bundle (and an unpacked tree)')
+    verify_parser.add_argument('bundle', help='Bundle directory')
+    verify_parser.add_argument('--dest', default=None, help='Also verify this unpacked tree')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        root = os.path.abspath(args.root or get_default_root())
+        manifest, stats, error = build_bundle(root, args.out_dir, args.base, not args.no_cache)
+        if error:
+            print(f"❌ {error}", file=sys.stderr)
+            sys.exit(1)
+        print_build_stats(manifest, stats, args.out_dir)
+    elif args.command == 'delta':
+        manifest, stats, error = build_delta(args.base, args.target, args.out_dir)
+        if error:
+            print(f"❌ {error}", file=sys.stderr)
+            sys.exit(1)
+        print_build_stats(manifest, stats, args.out_dir)
+    elif args.command == 'unpack':
+        success, message = unpack_bundle(args.bundle, args.dest)
+        print(f"{'✅' if success else '❌'} {message}")
+        sys.exit(0 if success else 1)
+    elif args.command == 'verify':
+        errors = verify_bundle(args.bundle, args.dest)
+        if errors:
+            print(f"❌ Verification failed ({len(errors)} problem(s))")
+            for error in errors[:20]:
+                print(f"  - {error}")
+            sys.exit(1)
+        print("✅ Bundle verified" + (f" and {args.dest} matches" if args.dest else ""))
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
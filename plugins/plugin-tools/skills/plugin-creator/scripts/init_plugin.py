@@ -7,12 +7,21 @@ Usage:
     python init_plugin.py <plugin-name> --path <plugins-dir>
     python init_plugin.py my-plugin --path ./plugins
     python init_plugin.py my-plugin --path ./plugins --description "My plugin description"
+    python init_plugin.py --manifest plugins.json --path ./plugins [--no-register]
+
+Manifest format (JSON):
+    {"plugins": [
+        {"name": "my-plugin", "description": "...", "version": "1.0.0",
+         "skills": ["skill-a", {"name": "skill-b", "description": "..."}]}
+    ]}
 """
 
 import argparse
 import json
 import os
+import shutil
 import sys
+import textwrap
 import io
 
 # Windows UTF-8 support
@@ -41,6 +50,206 @@ def validate_plugin_name(name):
     return True, None
 
 
+SKILL_MD_TEMPLATE = """---
+name: {name}
+description: |
+{description}
+---
+
+# {title}
+
+TODO: Describe the workflow of this skill.
+"""
+
+
+def load_manifest(manifest_path):
+    """
+    Load a scaffolding manifest.
+
+    Returns:
+        tuple: (plugins, error) where plugins is a list of dicts with name,
+        description, version and skills (list of dicts with name and
+        description)
+    """
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        return None, f"Invalid JSON in manifest: {e}"
+    except Exception as e:
+        return None, f"Error reading manifest: {e}"
+
+    entries = data.get('plugins', []) if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return None, "Manifest must be a list of plugins or an object with a 'plugins' list"
+
+    plugins = []
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {'name': entry}
+        if not isinstance(entry, dict):
+            return None, f"Invalid plugin entry in manifest: {entry!r}"
+        skills = []
+        for skill in entry.get('skills', []):
+            if isinstance(skill, str):
+                skill = {'name': skill}
+            if not isinstance(skill, dict):
+                return None, f"Invalid skill entry for plugin {entry.get('name')!r}: {skill!r}"
+            skills.append({'name': skill.get('name', ''), 'description': skill.get('description', '')})
+        plugins.append({
+            'name': entry.get('name', ''),
+            'description': entry.get('description', ''),
+            'version': entry.get('version', '1.0.0'),
+            'skills': skills,
+        })
+    return plugins, None
+
+
+def validate_manifest(plugins, plugins_path, registered=()):
+    """
+    Check every plugin and skill name before anything is created.
+
+    Args:
+        plugins: Plugins from load_manifest
+        plugins_path: Path to the plugins directory
+        registered: Names already in marketplace.json (to be rejected)
+
+    Returns:
+        List of error messages (empty if the manifest is valid)
+    """
+    errors = []
+    seen = set()
+    for plugin in plugins:
+        name = plugin['name']
+        is_valid, error = validate_plugin_name(name)
+        if not is_valid:
+            errors.append(f"{name or '(empty)'}: {error}")
+            continue
+        if name in seen:
+            errors.append(f"{name}: Duplicate plugin in manifest")
+        seen.add(name)
+        if os.path.exists(os.path.join(plugins_path, name)):
+            errors.append(f"{name}: Plugin directory already exists")
+        if name in registered:
+            errors.append(f"{name}: Plugin is already registered in marketplace.json")
+
+        skill_names = set()
+        for skill in plugin['skills']:
+            is_valid, error = validate_plugin_name(skill['name'])
+            if not is_valid:
+                errors.append(f"{name}/{skill['name'] or '(empty)'}: {error.replace('Plugin name', 'Skill name')}")
+            elif skill['name'] in skill_names:
+                errors.append(f"{name}/{skill['name']}: Duplicate skill in manifest")
+            skill_names.add(skill['name'])
+    return errors
+
+
+def make_plugin_json(plugin):
+    """plugin.json contents for a manifest plugin entry."""
+    plugin_json = PLUGIN_JSON_TEMPLATE.copy()
+    plugin_json['name'] = plugin['name']
+    plugin_json['description'] = plugin['description'] or f"{plugin['name']} plugin"
+    plugin_json['version'] = plugin['version']
+    return plugin_json
+
+
+def _write_plugin_tree(plugin_dir, plugin):
+    """Create one plugin's directories, plugin.json and SKILL.md stubs."""
+    os.makedirs(os.path.join(plugin_dir, '.claude-plugin'))
+    os.makedirs(os.path.join(plugin_dir, 'skills'))
+    with open(os.path.join(plugin_dir, '.claude-plugin', 'plugin.json'), 'w', encoding='utf-8') as f:
+        json.dump(make_plugin_json(plugin), f, ensure_ascii=False, indent=2)
+    for skill in plugin['skills']:
+        skill_dir = os.path.join(plugin_dir, 'skills', skill['name'])
+        os.makedirs(skill_dir)
+        with open(os.path.join(skill_dir, 'SKILL.md'), 'w', encoding='utf-8') as f:
+            f.write(SKILL_MD_TEMPLATE.format(
+                name=skill['name'],
+                # Every line must be indented to stay inside the block scalar
+                description=textwrap.indent(
+                    skill['description'].rstrip() or f"TODO: Describe when to use {skill['name']}.", '  '),
+                title=skill['name'].replace('-', ' ').title()
+            ))
+
+
+def init_from_manifest(manifest_path, plugins_path, marketplace_path=None, register=True):
+    """
+    Scaffold every plugin in a manifest and register them with one write.
+
+    All names are validated before anything is created. The plugin trees are
+    built in a staging directory inside plugins_path, then renamed into
+    place; if any step (including registration) fails, everything created
+    is removed again.
+
+    Args:
+        manifest_path: Path to the manifest JSON
+        plugins_path: Path to the plugins directory
+        marketplace_path: Path to marketplace.json (auto-detected if None)
+        register: Whether to register the plugins in marketplace.json
+
+    Returns:
+        tuple: (success, messages)
+    """
+    from register_plugin import apply_batch, get_default_marketplace_path, load_marketplace
+
+    plugins, error = load_manifest(manifest_path)
+    if error:
+        return False, [error]
+    if not plugins:
+        return False, ["Manifest contains no plugins"]
+
+    plugins_path = os.path.abspath(plugins_path)
+    if not os.path.isdir(plugins_path):
+        return False, [f"Plugins directory not found: {plugins_path}"]
+
+    registered = set()
+    if register:
+        if marketplace_path is None:
+            marketplace_path = os.path.join(os.path.dirname(plugins_path), '.claude-plugin', 'marketplace.json')
+            if not os.path.exists(marketplace_path):
+                marketplace_path = get_default_marketplace_path()
+        marketplace, error = load_marketplace(marketplace_path)
+        if error:
+            return False, [error]
+        registered = {p.get('name') for p in marketplace.get('plugins', [])}
+
+    errors = validate_manifest(plugins, plugins_path, registered)
+    if errors:
+        return False, errors
+
+    staging_dir = os.path.join(plugins_path, f".init-staging-{os.getpid()}")
+    moved = []
+    try:
+        os.makedirs(staging_dir)
+        for plugin in plugins:
+            _write_plugin_tree(os.path.join(staging_dir, plugin['name']), plugin)
+        for plugin in plugins:
+            target = os.path.join(plugins_path, plugin['name'])
+            os.rename(os.path.join(staging_dir, plugin['name']), target)
+            moved.append(target)
+
+        if register:
+            reports, error = apply_batch(
+                [('register', p['name']) for p in plugins], marketplace_path,
+                plugins_path, all_or_nothing=True,
+                plugin_infos={p['name']: (make_plugin_json(p), None) for p in plugins})
+            failures = [message for _, _, ok, message in reports if not ok]
+            if error or failures:
+                raise RuntimeError('; '.join(failures + ([error] if error else [])))
+    except Exception as e:
+        for target in moved:
+            shutil.rmtree(target, ignore_errors=True)
+        return False, [f"Scaffolding failed, rolled back: {e}"]
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    skill_count = sum(len(p['skills']) for p in plugins)
+    messages = [f"Created {len(plugins)} plugin(s) with {skill_count} skill(s) in {plugins_path}"]
+    if register:
+        messages.append(f"Registered {len(plugins)} plugin(s) in {marketplace_path}")
+    return True, messages
+
+
 def init_plugin(plugin_name, plugins_path, description=None):
     """
     Initialize a new plugin directory structure.
@@ -123,12 +332,28 @@ def init_plugin(plugin_name, plugins_path, description=None):
 
 def main():
     parser = argparse.ArgumentParser(description='Initialize a new plugin')
-    parser.add_argument('plugin_name', help='Name of the plugin (lowercase, hyphen-separated)')
+    parser.add_argument('plugin_name', nargs='?', help='Name of the plugin (lowercase, hyphen-separated)')
     parser.add_argument('--path', required=True, help='Path to plugins directory')
     parser.add_argument('--description', '-d', help='Plugin description')
+    parser.add_argument('--manifest', help='JSON manifest of plugins (and skills) to create in bulk')
+    parser.add_argument('--marketplace', '-m', default=None,
+                        help='Path to marketplace.json (with --manifest)')
+    parser.add_argument('--no-register', action='store_true',
+                        help='With --manifest, do not register the plugins in marketplace.json')
 
     args = parser.parse_args()
 
+    if args.manifest:
+        success, messages = init_from_manifest(args.manifest, args.path, args.marketplace,
+                                               register=not args.no_register)
+        for message in messages:
+            print(f"{'Success' if success else 'Error'}: {message}")
+        sys.exit(0 if success else 1)
+
+    if not args.plugin_name:
+        parser.print_help()
+        sys.exit(1)
+
     print(f"Initializing plugin: {args.plugin_name}")
     print(f"Location: {args.path}")
     print()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Build a precompiled marketplace index for fast tool startup.
+
+marketplace.json, every plugin.json, every SKILL.md frontmatter and every
+config/language_packs.json are compiled into .claude-plugin/marketplace.index.json.
+Each file source is recorded with its mtime, size and SHA-256. Directories are
+recorded with their mtime and a hash of their entry names, so added or removed
+plugins and skills are noticed while cache files written next to them are not.
+update_skill.py list / search loads the skills section only when it is fresh
+and falls back to scanning otherwise. Tools that need a single file (e.g.
+register_plugin.py --list, list_standards.py) read that file directly.
+
+Freshness is checked per section with stat calls only; a file whose mtime
+changed but whose size did not (e.g. after a git checkout), or a directory
+whose mtime changed, is re-hashed before the index is declared stale.
+
+Usage:
+    python marketplace_index.py [--root <marketplace-root>]
+    python marketplace_index.py --check [--root <marketplace-root>]
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+
+# Windows UTF-8 support
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+INDEX_VERSION = 2
+INDEX_NAME = 'marketplace.index.json'
+SECTIONS = ['marketplace', 'plugins', 'skills', 'language_packs']
+
+# Directory entries that never affect the index (caches, temp files)
+IGNORED_ENTRIES = {'.cache', '__pycache__', '.DS_Store'}
+
+
+def get_default_root():
+    """Get the marketplace root relative to this script."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(script_dir, '..', '..', '..', '..', '..'))
+
+
+def get_index_path(root):
+    """Get the index path (<root>/.claude-plugin/marketplace.index.json)."""
+    return os.path.join(root, '.claude-plugin', INDEX_NAME)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _listing_hash(path):
+    names = sorted(name for name in os.listdir(path)
+                   if name not in IGNORED_ENTRIES and not name.endswith('.tmp'))
+    return 'dir:' + hashlib.sha256('\0'.join(names).encode('utf-8')).hexdigest()
+
+
+class _Sources:
+    """Collects [rel_path, mtime_ns, size, digest] per section (size None for directories)."""
+
+    def __init__(self, root):
+        self.root = root
+        self.sections = {name: [] for name in SECTIONS}
+
+    def add_dir(self, section, path):
+        st = os.stat(path)
+        self.sections[section].append([self._rel(path), st.st_mtime_ns, None, _listing_hash(path)])
+
+    def read_json(self, section, path):
+        """Record a JSON file and return its parsed content."""
+        st = os.stat(path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.sections[section].append(
+            [self._rel(path), st.st_mtime_ns, st.st_size, hashlib.sha256(data).hexdigest()])
+        return json.loads(data.decode('utf-8'))
+
+    def add_file(self, section, path, st):
+        self.sections[section].append([self._rel(path), st.st_mtime_ns, st.st_size, _sha256(path)])
+
+    def _rel(self, path):
+        return os.path.relpath(path, self.root).replace(os.sep, '/')
+
+
+def _load_skill_md():
+    """Import the shared frontmatter reader from skill-updater (same plugin)."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    skill_updater_scripts = os.path.normpath(os.path.join(script_dir, '..', '..', 'skill-updater', 'scripts'))
+    if skill_updater_scripts not in sys.path:
+        sys.path.insert(0, skill_updater_scripts)
+    from frontmatter import load_skill_md
+    return load_skill_md
+
+
+def build_index(root):
+    """
+    Compile the marketplace sources under root into an index dict.
+
+    Raises:
+        OSError, ValueError: if marketplace.json or a plugin.json cannot be read
+    """
+    load_skill_md = _load_skill_md()
+    sources = _Sources(root)
+
+    marketplace = sources.read_json(
+        'marketplace', os.path.join(root, '.claude-plugin', 'marketplace.json'))
+
+    plugins_dir = os.path.join(root, 'plugins')
+    plugins = {}
+    language_packs = {}
+    for section in ('plugins', 'skills', 'language_packs'):
+        sources.add_dir(section, plugins_dir)
+
+    for plugin_entry in sorted(os.scandir(plugins_dir), key=lambda e: e.name):
+        if not plugin_entry.is_dir() or plugin_entry.name.startswith('.'):
+            continue
+        name = plugin_entry.name
+        for section in ('plugins', 'skills', 'language_packs'):
+            sources.add_dir(section, plugin_entry.path)
+
+        # Directories are only tracked where a file the index needs could
+        # appear; existing files are tracked themselves
+        manifest = None
+        manifest_dir = os.path.join(plugin_entry.path, '.claude-plugin')
+        manifest_path = os.path.join(manifest_dir, 'plugin.json')
+        if os.path.isfile(manifest_path):
+            manifest = sources.read_json('plugins', manifest_path)
+        elif os.path.isdir(manifest_dir):
+            sources.add_dir('plugins', manifest_dir)
+
+        skills = {}
+        skills_dir = os.path.join(plugin_entry.path, 'skills')
+        if os.path.isdir(skills_dir):
+            sources.add_dir('skills', skills_dir)
+            for skill_entry in sorted(os.scandir(skills_dir), key=lambda e: e.name):
+                if not skill_entry.is_dir():
+                    continue
+                skill_md = os.path.join(skill_entry.path, 'SKILL.md')
+                try:
+                    st = os.stat(skill_md)
+                except OSError:
+                    sources.add_dir('skills', skill_entry.path)
+                    continue
+                frontmatter, lines = load_skill_md(skill_md, st)
+                sources.add_file('skills', skill_md, st)
+                skills[skill_entry.name] = {'frontmatter': frontmatter, 'lines': lines}
+
+        config_dir = os.path.join(plugin_entry.path, 'config')
+        packs_path = os.path.join(config_dir, 'language_packs.json')
+        if os.path.isfile(packs_path):
+            language_packs[name] = sources.read_json('language_packs', packs_path)
+        elif os.path.isdir(config_dir):
+            sources.add_dir('language_packs', config_dir)
+
+        plugins[name] = {'manifest': manifest, 'skills': skills}
+
+    return {
+        'version': INDEX_VERSION,
+        'sources': sources.sections,
+        'marketplace': marketplace,
+        'plugins': plugins,
+        'language_packs': language_packs,
+    }
+
+
+def write_index(root, index):
+    """Write the index atomically."""
+    index_path = get_index_path(root)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def stale_sources(root, index, sections=None):
+    """
+    List the recorded sources that no longer match the tree.
+
+    Args:
+        root: Marketplace root
+        index: Loaded index dict
+        sections: Sections to check (default: all)
+
+    Returns:
+        List of relative paths that changed or disappeared
+    """
+    stale = []
+    checked = set()
+    for section in sections or SECTIONS:
+        for rel_path, mtime_ns, size, digest in index['sources'].get(section, []):
+            if rel_path in checked:
+                continue
+            checked.add(rel_path)
+            path = os.path.join(root, rel_path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                stale.append(rel_path)
+                continue
+            if st.st_mtime_ns == mtime_ns and (size is None or st.st_size == size):
+                continue
+            if size is None:
+                if _listing_hash(path) != digest:
+                    stale.append(rel_path)
+            elif st.st_size != size or _sha256(path) != digest:
+                stale.append(rel_path)
+    return stale
+
+
+def load_index(root, sections=None):
+    """
+    Load the index if it exists and the given sections are fresh.
+
+    Args:
+        root: Marketplace root
+        sections: Sections the caller will use (default: all)
+
+    Returns:
+        Index dict, or None if missing, unreadable, another version or stale
+    """
+    try:
+        with open(get_index_path(root), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != INDEX_VERSION:
+        return None
+    try:
+        if stale_sources(root, index, sections):
+            return None
+    except OSError:
+        return None
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the precompiled marketplace index')
+    parser.add_argument('--root', default=None, help='Marketplace root (default: auto-detected)')
+    parser.add_argument('--check', action='store_true',
+                        help='Only check whether the index is up to date (exit 1 if stale)')
+
+    args = parser.parse_args()
+    root = os.path.abspath(args.root or get_default_root())
+
+    if args.check:
+        try:
+            with open(get_index_path(root), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            print(f"❌ Index not found or unreadable: {get_index_path(root)}")
+            sys.exit(1)
+        stale = stale_sources(root, index) if index.get('version') == INDEX_VERSION else ['(version)']
+        if stale:
+            print(f"❌ Index is stale ({len(stale)} source(s) changed)")
+            for rel_path in stale[:20]:
+                print(f"  - {rel_path}")
+            sys.exit(1)
+        print("✅ Index is up to date")
+        return
+
+    try:
+        index = build_index(root)
+    except (OSError, ValueError) as e:
+        print(f"❌ Failed to build index: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    index_path = write_index(root, index)
+    skill_count = sum(len(p['skills']) for p in index['plugins'].values())
+    source_count = sum(len(s) for s in index['sources'].values())
+    print(f"✅ Index written: {index_path}")
+    print(f"   {len(index['plugins'])} plugin(s), {skill_count} skill(s), "
+          f"{len(index['language_packs'])} language pack config(s), {source_count} source(s)")
+
+
+if __name__ == '__main__':
+    main()
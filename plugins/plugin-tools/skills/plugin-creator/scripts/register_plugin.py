@@ -6,13 +6,29 @@ Register a plugin to marketplace.json.
 Usage:
     python register_plugin.py <plugin-name> [--marketplace <path>]
     python register_plugin.py my-plugin --marketplace ./.claude-plugin/marketplace.json
+    python register_plugin.py plugin-a plugin-b plugin-c       # Batch, one write
+    python register_plugin.py --from-file plugins.txt [--unregister | --update]
+    python register_plugin.py --sync [--apply]                  # Reconcile with plugins/
+
+Writes go through a temp file, fsync and rename while holding an advisory
+lock on <marketplace.json>.lock, so concurrent runs never lose each other's
+changes and a crash never leaves truncated JSON.
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import hashlib
 import json
 import os
 import sys
 import io
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
 
 # Windows UTF-8 support
 if sys.platform == 'win32':
@@ -29,27 +45,109 @@ def get_default_marketplace_path():
     return os.path.normpath(marketplace_path)
 
 
-def load_marketplace(marketplace_path):
-    """Load marketplace.json."""
+LOCK_TIMEOUT = 30
+LOCK_POLL_INTERVAL = 0.05
+
+MANIFEST_CACHE_VERSION = 1
+# Below this many plugin.json reads a thread pool costs more than it saves
+PARALLEL_READ_THRESHOLD = 32
+
+
+@contextmanager
+def marketplace_lock(marketplace_path, timeout=LOCK_TIMEOUT):
+    """
+    Hold an exclusive advisory lock on <marketplace_path>.lock.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows.
+
+    Raises:
+        TimeoutError: if the lock cannot be acquired within timeout seconds
+    """
+    lock_file = open(f"{marketplace_path}.lock", 'a+b')
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if os.name == 'nt':
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for lock on {marketplace_path}")
+                time.sleep(LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        lock_file.close()
+
+
+def _revision(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_marketplace_with_revision(marketplace_path):
+    """
+    Load marketplace.json together with its revision token.
+
+    The revision is a hash of the file content, so no field has to be added
+    to marketplace.json; any concurrent write changes it.
+
+    Returns:
+        tuple: (data, revision, error)
+    """
     if not os.path.exists(marketplace_path):
-        return None, f"Marketplace file not found: {marketplace_path}"
+        return None, None, f"Marketplace file not found: {marketplace_path}"
 
     try:
-        with open(marketplace_path, 'r', encoding='utf-8') as f:
-            return json.load(f), None
-    except json.JSONDecodeError as e:
-        return None, f"Invalid JSON in marketplace file: {e}"
+        with open(marketplace_path, 'rb') as f:
+            content = f.read()
+        return json.loads(content.decode('utf-8')), _revision(content), None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        return None, None, f"Invalid JSON in marketplace file: {e}"
     except Exception as e:
-        return None, f"Error reading marketplace file: {e}"
+        return None, None, f"Error reading marketplace file: {e}"
+
+
+def load_marketplace(marketplace_path):
+    """Load marketplace.json."""
+    data, _, error = load_marketplace_with_revision(marketplace_path)
+    return data, error
 
 
 def save_marketplace(marketplace_path, data):
-    """Save marketplace.json."""
+    """
+    Save marketplace.json durably: write a temp file, fsync, then rename.
+
+    Callers that may race with other writers should hold marketplace_lock
+    (commit_marketplace does).
+    """
+    tmp_path = f"{marketplace_path}.{os.getpid()}.tmp"
     try:
-        with open(marketplace_path, 'w', encoding='utf-8') as f:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, marketplace_path)
+        if os.name != 'nt':
+            # Persist the rename itself
+            dir_fd = os.open(os.path.dirname(os.path.abspath(marketplace_path)), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
         return True, None
     except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         return False, f"Error writing marketplace file: {e}"
 
 
@@ -73,57 +171,184 @@ def find_plugin_info(plugin_name, plugins_path):
         return None, f"Error reading plugin.json: {e}"
 
 
-def register_plugin(plugin_name, marketplace_path, plugins_path=None):
+def get_default_plugins_path(marketplace_path):
+    """Get the plugins directory next to a marketplace's .claude-plugin directory."""
+    marketplace_dir = os.path.dirname(os.path.dirname(marketplace_path))
+    return os.path.join(marketplace_dir, 'plugins')
+
+
+def make_plugin_entry(plugin_name, plugin_info):
+    """Create a marketplace.json plugin entry from plugin.json contents."""
+    return {
+        "name": plugin_name,
+        "source": f"./plugins/{plugin_name}",
+        "description": plugin_info.get('description', ''),
+        "version": plugin_info.get('version', '1.0.0')
+    }
+
+
+def apply_operations(marketplace, operations, plugins_path, plugin_infos=None):
     """
-    Register a plugin to marketplace.json.
+    Apply register/unregister/update operations to a loaded marketplace in memory.
+
+    Duplicates are found through a name -> position map built once, so a
+    batch of n operations costs O(n) instead of one list scan each.
 
     Args:
-        plugin_name: Name of the plugin to register
+        marketplace: Loaded marketplace.json data (modified in place)
+        operations: List of (action, plugin_name); action is 'register',
+            'unregister' or 'update'
+        plugins_path: Path to plugins directory
+        plugin_infos: Optional dict caching find_plugin_info results by name,
+            so that re-applying after a concurrent write reads nothing again
+
+    Returns:
+        List of (plugin_name, action, success, message), one per operation
+    """
+    if plugin_infos is None:
+        plugin_infos = {}
+    plugins = marketplace.get('plugins', [])
+    positions = {p.get('name'): i for i, p in enumerate(plugins)}
+    removed = set()
+    reports = []
+
+    for action, plugin_name in operations:
+        position = positions.get(plugin_name)
+        registered = position is not None and position not in removed
+
+        if action == 'unregister':
+            if not registered:
+                reports.append((plugin_name, action, False,
+                                f"Plugin '{plugin_name}' not found in marketplace"))
+                continue
+            removed.add(position)
+            reports.append((plugin_name, action, True,
+                            f"Plugin '{plugin_name}' unregistered successfully"))
+            continue
+
+        if action == 'register' and registered:
+            reports.append((plugin_name, action, False,
+                            f"Plugin '{plugin_name}' is already registered"))
+            continue
+        if action == 'update' and not registered:
+            reports.append((plugin_name, action, False,
+                            f"Plugin '{plugin_name}' not found in marketplace"))
+            continue
+
+        if plugin_name not in plugin_infos:
+            plugin_infos[plugin_name] = find_plugin_info(plugin_name, plugins_path)
+        plugin_info, error = plugin_infos[plugin_name]
+        if error:
+            reports.append((plugin_name, action, False, error))
+            continue
+
+        if action == 'register':
+            positions[plugin_name] = len(plugins)
+            plugins.append(make_plugin_entry(plugin_name, plugin_info))
+            reports.append((plugin_name, action, True,
+                            f"Plugin '{plugin_name}' registered successfully"))
+        else:
+            entry = plugins[position]
+            old = (entry.get('description'), entry.get('version'))
+            entry['description'] = plugin_info.get('description', '')
+            entry['version'] = plugin_info.get('version', '1.0.0')
+            changed = old != (entry['description'], entry['version'])
+            reports.append((plugin_name, action, True,
+                            f"Plugin '{plugin_name}' updated" if changed
+                            else f"Plugin '{plugin_name}' is up to date"))
+
+    marketplace['plugins'] = [p for i, p in enumerate(plugins) if i not in removed]
+    return reports
+
+
+def apply_batch(operations, marketplace_path, plugins_path=None, all_or_nothing=False,
+                plugin_infos=None):
+    """
+    Apply a batch of operations to marketplace.json with one load and one write.
+
+    Concurrency is optimistic: operations are applied outside the lock to
+    the loaded data, and the write only happens under the lock if the file's
+    revision is unchanged. Otherwise the operations are re-applied to the
+    current file under the lock (a merge), and any operation whose outcome
+    changed because of the concurrent write is reported as a conflict.
+
+    Args:
+        operations: List of (action, plugin_name); action is 'register',
+            'unregister' or 'update'
         marketplace_path: Path to marketplace.json
         plugins_path: Path to plugins directory (auto-detected if None)
+        all_or_nothing: If True, write nothing when any operation fails
+        plugin_infos: Optional dict of plugin name -> (plugin_info, error)
+            already read by the caller
 
     Returns:
-        tuple: (success, message)
+        tuple: (reports, error) where reports is a list of
+        (plugin_name, action, success, message) and error is a message if
+        marketplace.json could not be loaded or saved
     """
-    # Load marketplace
-    marketplace, error = load_marketplace(marketplace_path)
+    marketplace, revision, error = load_marketplace_with_revision(marketplace_path)
     if error:
-        return False, error
+        return [], error
 
-    # Auto-detect plugins path
     if plugins_path is None:
-        marketplace_dir = os.path.dirname(os.path.dirname(marketplace_path))
-        plugins_path = os.path.join(marketplace_dir, 'plugins')
+        plugins_path = get_default_plugins_path(marketplace_path)
 
-    # Find plugin info
-    plugin_info, error = find_plugin_info(plugin_name, plugins_path)
-    if error:
-        return False, error
+    plugin_infos = dict(plugin_infos or {})
+    reports = apply_operations(marketplace, operations, plugins_path, plugin_infos)
+    succeeded = [r for r in reports if r[2]]
+    if not succeeded or (all_or_nothing and len(succeeded) != len(reports)):
+        return reports, None
 
-    # Check if already registered
-    plugins = marketplace.get('plugins', [])
-    for existing in plugins:
-        if existing.get('name') == plugin_name:
-            return False, f"Plugin '{plugin_name}' is already registered"
+    try:
+        with marketplace_lock(marketplace_path):
+            current, current_revision, error = load_marketplace_with_revision(marketplace_path)
+            if error:
+                return reports, error
+
+            if current_revision != revision:
+                # Another writer committed since we loaded: merge by
+                # re-applying our operations to the current content
+                merged = apply_operations(current, operations, plugins_path, plugin_infos)
+                reports = [
+                    new if new[2] == old[2] else
+                    (new[0], new[1], new[2], f"{new[3]} (changed by a concurrent update)")
+                    for old, new in zip(reports, merged)
+                ]
+                marketplace = current
+                succeeded = [r for r in reports if r[2]]
+                if not succeeded or (all_or_nothing and len(succeeded) != len(reports)):
+                    return reports, None
+
+            success, error = save_marketplace(marketplace_path, marketplace)
+    except TimeoutError as e:
+        return reports, str(e)
 
-    # Create plugin entry
-    plugin_entry = {
-        "name": plugin_name,
-        "source": f"./plugins/{plugin_name}",
-        "description": plugin_info.get('description', ''),
-        "version": plugin_info.get('version', '1.0.0')
-    }
+    if not success:
+        return reports, error
+    return reports, None
 
-    # Add to marketplace
-    plugins.append(plugin_entry)
-    marketplace['plugins'] = plugins
 
-    # Save marketplace
-    success, error = save_marketplace(marketplace_path, marketplace)
-    if not success:
+def _single(action, plugin_name, marketplace_path, plugins_path=None):
+    reports, error = apply_batch([(action, plugin_name)], marketplace_path, plugins_path)
+    if error:
         return False, error
+    _, _, success, message = reports[0]
+    return success, message
 
-    return True, f"Plugin '{plugin_name}' registered successfully"
+
+def register_plugin(plugin_name, marketplace_path, plugins_path=None):
+    """
+    Register a plugin to marketplace.json.
+
+    Args:
+        plugin_name: Name of the plugin to register
+        marketplace_path: Path to marketplace.json
+        plugins_path: Path to plugins directory (auto-detected if None)
+
+    Returns:
+        tuple: (success, message)
+    """
+    return _single('register', plugin_name, marketplace_path, plugins_path)
 
 
 def unregister_plugin(plugin_name, marketplace_path):
@@ -137,28 +362,213 @@ def unregister_plugin(plugin_name, marketplace_path):
     Returns:
         tuple: (success, message)
     """
-    # Load marketplace
+    return _single('unregister', plugin_name, marketplace_path)
+
+
+def update_plugin(plugin_name, marketplace_path, plugins_path=None):
+    """
+    Refresh a registered plugin's description and version from its plugin.json.
+
+    Returns:
+        tuple: (success, message)
+    """
+    return _single('update', plugin_name, marketplace_path, plugins_path)
+
+
+def _read_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f), None
+    except Exception as e:
+        return None, f"Error reading plugin.json: {e}"
+
+
+def scan_plugin_manifests(plugins_path, use_cache=True):
+    """
+    Read every plugins/*/.claude-plugin/plugin.json.
+
+    With use_cache, parsed manifests are kept in
+    <plugins-dir>/.cache/plugin_manifests.json and only files whose mtime or
+    size changed are re-read, so a no-op scan costs one stat per plugin.
+    Files that do need reading are read concurrently.
+
+    Returns:
+        Dict of plugin name -> (plugin_info, error) for every plugin
+        directory that has a .claude-plugin/plugin.json
+    """
+    cache_path = os.path.join(plugins_path, '.cache', 'plugin_manifests.json')
+    cached = {}
+    if use_cache:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_CACHE_VERSION:
+                cached = data['plugins']
+        except (OSError, ValueError, KeyError):
+            cached = {}
+
+    manifests = {}
+    new_cache = {}
+    to_read = []
+    for entry in os.scandir(plugins_path):
+        if not entry.is_dir() or entry.name.startswith('.'):
+            continue
+        manifest_path = os.path.join(entry.path, '.claude-plugin', 'plugin.json')
+        try:
+            st = os.stat(manifest_path)
+        except OSError:
+            continue
+        hit = cached.get(entry.name)
+        if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            manifests[entry.name] = (hit[2], None)
+            new_cache[entry.name] = hit
+        else:
+            to_read.append((entry.name, manifest_path, st))
+
+    paths = [path for _, path, _ in to_read]
+    if len(paths) >= PARALLEL_READ_THRESHOLD:
+        with ThreadPoolExecutor() as pool:
+            results = list(pool.map(_read_manifest, paths))
+    else:
+        results = [_read_manifest(path) for path in paths]
+
+    for (name, _, st), (info, error) in zip(to_read, results):
+        manifests[name] = (info, error)
+        if info is not None:
+            new_cache[name] = [st.st_mtime_ns, st.st_size, info]
+
+    if use_cache and (to_read or set(new_cache) != set(cached)):
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_CACHE_VERSION, 'plugins': new_cache}, f,
+                          ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    return manifests
+
+
+def compute_sync_diff(marketplace, manifests):
+    """
+    Compare marketplace.json entries with the plugin.json files on disk.
+
+    Returns:
+        Dict with 'missing' (names on disk but not registered), 'stale'
+        (registered names without a plugin.json), 'changed' (list of
+        (name, [(field, registered, on_disk), ...])) and 'errors' (list of
+        (name, message) for unreadable plugin.json files)
+    """
+    registered = {p.get('name'): p for p in marketplace.get('plugins', [])}
+    diff = {'missing': [], 'stale': [], 'changed': [], 'errors': []}
+
+    for name in sorted(manifests):
+        info, error = manifests[name]
+        if error:
+            diff['errors'].append((name, error))
+            continue
+        entry = registered.get(name)
+        if entry is None:
+            diff['missing'].append(name)
+            continue
+        fields = []
+        for field, default in (('version', '1.0.0'), ('description', '')):
+            on_disk = info.get(field, default)
+            if entry.get(field) != on_disk:
+                fields.append((field, entry.get(field), on_disk))
+        if fields:
+            diff['changed'].append((name, fields))
+
+    diff['stale'] = sorted(name for name in registered if name not in manifests)
+    return diff
+
+
+def print_sync_diff(diff):
+    """Print a sync diff."""
+    print("\n## Marketplace Sync\n")
+    for name in diff['missing']:
+        print(f"+ {name} (not registered)")
+    for name in diff['stale']:
+        print(f"- {name} (plugin.json not found)")
+    for name, fields in diff['changed']:
+        for field, registered, on_disk in fields:
+            if field == 'description':
+                print(f"~ {name}: description changed")
+            else:
+                print(f"~ {name}: {field} {registered} -> {on_disk}")
+    for name, error in diff['errors']:
+        print(f"! {name}: {error}")
+
+    total = len(diff['missing']) + len(diff['stale']) + len(diff['changed'])
+    if total == 0:
+        print("Already in sync.")
+    else:
+        print(f"\n{len(diff['missing'])} missing, {len(diff['stale'])} stale, "
+              f"{len(diff['changed'])} changed")
+
+
+def sync_marketplace(marketplace_path, plugins_path=None, apply=False, use_cache=True):
+    """
+    Reconcile marketplace.json with the plugins on disk.
+
+    Args:
+        marketplace_path: Path to marketplace.json
+        plugins_path: Path to plugins directory (auto-detected if None)
+        apply: Write the changes (one locked, atomic write) instead of only
+            reporting them
+        use_cache: Whether to use the plugin.json mtime cache
+
+    Returns:
+        tuple: (diff, reports, error); reports is empty unless apply is set
+    """
     marketplace, error = load_marketplace(marketplace_path)
     if error:
-        return False, error
+        return None, [], error
 
-    # Find and remove plugin
-    plugins = marketplace.get('plugins', [])
-    original_count = len(plugins)
+    if plugins_path is None:
+        plugins_path = get_default_plugins_path(marketplace_path)
 
-    plugins = [p for p in plugins if p.get('name') != plugin_name]
+    manifests = scan_plugin_manifests(plugins_path, use_cache)
+    diff = compute_sync_diff(marketplace, manifests)
 
-    if len(plugins) == original_count:
-        return False, f"Plugin '{plugin_name}' not found in marketplace"
+    operations = ([('register', name) for name in diff['missing']]
+                  + [('unregister', name) for name in diff['stale']]
+                  + [('update', name) for name, _ in diff['changed']])
+    if not apply or not operations:
+        return diff, [], None
 
-    marketplace['plugins'] = plugins
+    reports, error = apply_batch(operations, marketplace_path, plugins_path,
+                                 plugin_infos=manifests)
+    return diff, reports, error
 
-    # Save marketplace
-    success, error = save_marketplace(marketplace_path, marketplace)
-    if not success:
-        return False, error
 
-    return True, f"Plugin '{plugin_name}' unregistered successfully"
+def read_names_file(path):
+    """
+    Read plugin names from a file: one per line ('#' comments allowed) or a JSON list.
+
+    Returns:
+        tuple: (names, error)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        return None, f"Error reading {path}: {e}"
+
+    if content.lstrip().startswith('['):
+        try:
+            return [str(name) for name in json.loads(content)], None
+        except json.JSONDecodeError as e:
+            return None, f"Invalid JSON in {path}: {e}"
+
+    names = []
+    for line in content.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if line:
+            names.append(line)
+    return names, None
 
 
 def list_registered_plugins(marketplace_path):
@@ -191,35 +601,80 @@ def list_registered_plugins(marketplace_path):
 
 def main():
     parser = argparse.ArgumentParser(description='Register/unregister plugins to marketplace')
-    parser.add_argument('plugin_name', nargs='?', help='Name of the plugin')
+    parser.add_argument('plugin_names', nargs='*', metavar='plugin_name',
+                        help='Name(s) of the plugin(s)')
+    parser.add_argument('--from-file', '-f', metavar='PATH',
+                        help='Read plugin names from a file (one per line, or a JSON list)')
     parser.add_argument('--marketplace', '-m', default=None,
                         help='Path to marketplace.json')
     parser.add_argument('--unregister', '-u', action='store_true',
                         help='Unregister the plugin instead of registering')
+    parser.add_argument('--update', action='store_true',
+                        help="Refresh registered plugins' description/version from plugin.json")
+    parser.add_argument('--all-or-nothing', action='store_true',
+                        help='Write nothing if any plugin in the batch fails')
     parser.add_argument('--list', '-l', action='store_true',
                         help='List all registered plugins')
+    parser.add_argument('--sync', action='store_true',
+                        help='Show differences between marketplace.json and plugins/*/plugin.json')
+    parser.add_argument('--apply', action='store_true',
+                        help='With --sync, write the differences to marketplace.json')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='With --sync, re-read every plugin.json')
 
     args = parser.parse_args()
 
     marketplace_path = args.marketplace or get_default_marketplace_path()
 
+    if args.sync:
+        diff, reports, error = sync_marketplace(marketplace_path, apply=args.apply,
+                                                use_cache=not args.no_cache)
+        if diff is not None:
+            print_sync_diff(diff)
+        for _, _, success, message in reports:
+            print(f"{'Success' if success else 'Error'}: {message}")
+        if error:
+            print(f"Error: {error}")
+            sys.exit(1)
+        in_sync = not (diff['missing'] or diff['stale'] or diff['changed'])
+        if not in_sync and not args.apply:
+            print("Run with --apply to update marketplace.json.")
+        if diff['errors'] or any(not r[2] for r in reports) or (not in_sync and not args.apply):
+            sys.exit(1)
+        return
+
     if args.list:
         list_registered_plugins(marketplace_path)
         return
 
-    if not args.plugin_name:
+    names = list(args.plugin_names)
+    if args.from_file:
+        file_names, error = read_names_file(args.from_file)
+        if error:
+            print(f"Error: {error}")
+            sys.exit(1)
+        names.extend(file_names)
+
+    if not names:
         parser.print_help()
         return
 
-    if args.unregister:
-        success, message = unregister_plugin(args.plugin_name, marketplace_path)
-    else:
-        success, message = register_plugin(args.plugin_name, marketplace_path)
+    action = 'unregister' if args.unregister else 'update' if args.update else 'register'
+    reports, error = apply_batch([(action, name) for name in names], marketplace_path,
+                                 all_or_nothing=args.all_or_nothing)
 
-    if success:
-        print(f"Success: {message}")
-    else:
-        print(f"Error: {message}")
+    for _, _, success, message in reports:
+        print(f"{'Success' if success else 'Error'}: {message}")
+    failed = sum(1 for r in reports if not r[2])
+
+    if error:
+        print(f"Error: {error}")
+        sys.exit(1)
+    if len(reports) > 1:
+        print(f"\nTotal: {len(reports) - failed} succeeded, {failed} failed")
+        if failed and args.all_or_nothing:
+            print("No changes were written (--all-or-nothing)")
+    if failed:
         sys.exit(1)
 
 
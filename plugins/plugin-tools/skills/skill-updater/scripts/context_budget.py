@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Estimate how many tokens each skill loads into the model context.
+
+A skill is loaded in stages:
+1. description - frontmatter name and description, loaded at startup for every skill
+2. skill_md    - the full SKILL.md, loaded when the skill triggers
+3. references  - files linked from SKILL.md with relative markdown links
+                 (followed recursively within the skill directory)
+
+Tokens are estimated offline with a CJK-aware heuristic (no tokenizer
+download). Skills and markdown sections are ranked by size, and budgets can be
+enforced for CI: the exit status is 1 when any skill exceeds one.
+
+Usage:
+    python context_budget.py [--path <plugins-dir>] [--top N] [--sections N]
+    python context_budget.py --max-description 300 --max-skill-md 6000 --max-total 30000
+    python context_budget.py --config context_budget.json --json
+"""
+
+import argparse
+import io
+import json
+import math
+import os
+import re
+import sys
+
+from tokenizer import CJK_CHARS, CJK_PUNCTUATION
+from update_skill import find_skills, get_default_plugins_path
+
+# Windows UTF-8 support
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+STAGES = ['description', 'skill_md', 'references']
+
+# Heuristic token costs: kana/kanji and full-width punctuation are roughly one
+# token per character; English averages about four characters per token,
+# digits about three, and runs of ASCII symbols (markdown tables, rules) about
+# two.
+TOKEN_PATTERN = re.compile(
+    rf'(?P<cjk>[{CJK_PUNCTUATION}{CJK_CHARS}])'
+    r'|(?P<word>[A-Za-z]+)'
+    r'|(?P<digits>[0-9]+)'
+    r'|(?P<symbols>[!-/:-@\[-`{-~]+)'
+    r'|(?P<other>[^\sA-Za-z0-9!-/:-@\[-`{-~])'
+)
+CHARS_PER_TOKEN = {'word': 4, 'digits': 3, 'symbols': 2}
+
+LINK_PATTERN = re.compile(r'\[[^\]]*\]\(([^)\s]+)(?:\s+"[^"]*")?\)')
+INLINE_CODE_PATTERN = re.compile(r'`[^`]*`')
+HEADING_PATTERN = re.compile(r'^(#{1,3})\s+(.+?)\s*#*\s*$')
+
+
+def estimate_tokens(text):
+    """
+    Estimate the token count of text without a tokenizer.
+
+    Each CJK character counts as one token; ASCII words, digit runs and symbol
+    runs count as ceil(length / chars-per-token).
+    """
+    tokens = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind in CHARS_PER_TOKEN:
+            tokens += math.ceil(len(match.group(0)) / CHARS_PER_TOKEN[kind])
+        else:
+            tokens += 1
+    return tokens
+
+
+def split_sections(text):
+    """
+    Split markdown into sections at '#', '##' and '###' headings outside code fences.
+
+    Returns:
+        List of (heading, text); text before the first heading has heading ''
+    """
+    sections = []
+    heading = ''
+    lines = []
+    in_code = False
+    for line in text.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        elif not in_code:
+            match = HEADING_PATTERN.match(line)
+            if match:
+                if lines:
+                    sections.append((heading, '\n'.join(lines)))
+                heading = f"{match.group(1)} {match.group(2)}"
+                lines = []
+        lines.append(line)
+    if lines:
+        sections.append((heading, '\n'.join(lines)))
+    return sections
+
+
+def find_links(text):
+    """Relative link targets in markdown text (outside code), without anchors."""
+    targets = []
+    in_code = False
+    for line in text.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        for target in LINK_PATTERN.findall(INLINE_CODE_PATTERN.sub('', line)):
+            if re.match(r'^[a-z][a-z0-9+.-]*:', target, re.IGNORECASE) or target.startswith(('#', '/')):
+                continue
+            target = target.split('#', 1)[0]
+            if target:
+                targets.append(target)
+    return targets
+
+
+def _read_text(path):
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if b'\0' in data[:8192]:
+        return None
+    return data.decode('utf-8', errors='replace')
+
+
+def _file_sections(rel_path, text):
+    return [(f"{rel_path} {heading}".rstrip(), estimate_tokens(body))
+            for heading, body in split_sections(text)]
+
+
+def analyze_skill(skill):
+    """
+    Estimate the context load of one skill at each stage.
+
+    Args:
+        skill: Skill dict from find_skills (name, plugin, path, frontmatter)
+
+    Returns:
+        Dict with plugin, skill, path, description, skill_md, references,
+        total, files (list of (rel_path, tokens)), sections (list of
+        (label, tokens)) and external (links leaving the skill directory)
+    """
+    skill_path = os.path.abspath(skill['path'])
+    frontmatter = skill['frontmatter'] or {}
+    result = {
+        'plugin': skill['plugin'],
+        'skill': skill['name'],
+        'path': skill['path'],
+        'description': estimate_tokens(
+            f"name: {frontmatter.get('name', skill['name'])}\n"
+            f"description: {frontmatter.get('description', '')}"),
+        'skill_md': 0,
+        'references': 0,
+        'files': [],
+        'sections': [],
+        'external': [],
+        'missing': [],
+    }
+
+    skill_md = os.path.join(skill_path, 'SKILL.md')
+    text = _read_text(skill_md)
+    if text is None:
+        result['total'] = result['description']
+        return result
+
+    result['skill_md'] = estimate_tokens(text)
+    result['files'].append(('SKILL.md', result['skill_md']))
+    result['sections'].extend(_file_sections('SKILL.md', text))
+
+    seen = {skill_md}
+    queue = [(skill_md, text)]
+    while queue:
+        source, source_text = queue.pop(0)
+        for target in find_links(source_text):
+            path = os.path.normpath(os.path.join(os.path.dirname(source), target))
+            if path in seen:
+                continue
+            seen.add(path)
+            if os.path.commonpath([path, skill_path]) != skill_path:
+                result['external'].append(os.path.relpath(path, skill_path))
+                continue
+            rel_path = os.path.relpath(path, skill_path).replace(os.sep, '/')
+            if not os.path.isfile(path):
+                result['missing'].append(rel_path)
+                continue
+            ref_text = _read_text(path)
+            if ref_text is None:
+                continue
+            tokens = estimate_tokens(ref_text)
+            result['references'] += tokens
+            result['files'].append((rel_path, tokens))
+            if path.endswith('.md'):
+                result['sections'].extend(_file_sections(rel_path, ref_text))
+                queue.append((path, ref_text))
+
+    result['total'] = result['description'] + result['skill_md'] + result['references']
+    return result
+
+
+def load_budgets(config_path=None, overrides=None):
+    """
+    Load budgets from a JSON config and command-line overrides.
+
+    Config format:
+        {"description": 300, "skill_md": 6000, "references": 20000, "total": 30000,
+         "skills": {"dev-workflow/coding-standards": {"references": 40000}}}
+
+    Returns:
+        Tuple of (defaults, per_skill) where defaults maps stage (or 'total')
+        to a token limit
+    """
+    defaults = {}
+    per_skill = {}
+    if config_path:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        defaults = {k: v for k, v in config.items() if k in STAGES + ['total']}
+        per_skill = config.get('skills', {})
+    for key, value in (overrides or {}).items():
+        if value is not None:
+            defaults[key] = value
+    return defaults, per_skill
+
+
+def check_budgets(results, defaults, per_skill):
+    """
+    Compare results against budgets.
+
+    Returns:
+        List of (label, stage, tokens, limit) for every exceeded budget
+    """
+    violations = []
+    for result in results:
+        label = f"{result['plugin']}/{result['skill']}"
+        limits = dict(defaults)
+        limits.update(per_skill.get(label, {}))
+        for stage in STAGES + ['total']:
+            limit = limits.get(stage)
+            if limit is not None and result[stage] > limit:
+                violations.append((label, stage, result[stage], limit))
+    return violations
+
+
+def print_report(results, top=10, sections=10):
+    """Print the heaviest skills and sections."""
+    ranked = sorted(results, key=lambda r: r['total'], reverse=True)
+    startup = sum(r['description'] for r in results)
+
+    print(f"\n📊 コンテキスト負荷（推定トークン数）: {len(results)}スキル")
+    print(f"   起動時に常に読み込まれるdescription合計: {startup:,} tokens")
+    print("-"*60)
+    print(f"  {'description':>11} {'SKILL.md':>9} {'references':>10} {'total':>8}  skill")
+    for result in ranked[:top]:
+        print(f"  {result['description']:>11,} {result['skill_md']:>9,} "
+              f"{result['references']:>10,} {result['total']:>8,}  "
+              f"{result['plugin']}/{result['skill']}")
+    if len(ranked) > top:
+        print(f"  ... 他{len(ranked) - top}件")
+
+    if sections:
+        all_sections = [(tokens, f"{r['plugin']}/{r['skill']}: {label}")
+                        for r in results for label, tokens in r['sections']]
+        all_sections.sort(key=lambda item: item[0], reverse=True)
+        print(f"\n📑 大きいセクション（上位{min(sections, len(all_sections))}件）")
+        print("-"*60)
+        for tokens, label in all_sections[:sections]:
+            print(f"  {tokens:>8,}  {label}")
+
+    missing = [(r, m) for r in results for m in r['missing']]
+    if missing:
+        print("\n⚠️  リンク先が存在しません")
+        for result, path in missing:
+            print(f"  {result['plugin']}/{result['skill']}: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Estimate the context tokens each skill loads')
+    parser.add_argument('--path', default=None, help='Plugins directory path')
+    parser.add_argument('--top', type=int, default=10, help='Number of skills to show (default: 10)')
+    parser.add_argument('--sections', type=int, default=10,
+                        help='Number of heaviest sections to show (default: 10, 0 to hide)')
+    parser.add_argument('--config', help='JSON file with token budgets')
+    parser.add_argument('--max-description', type=int, help='Budget for the frontmatter description')
+    parser.add_argument('--max-skill-md', type=int, help='Budget for SKILL.md')
+    parser.add_argument('--max-references', type=int, help='Budget for linked reference files')
+    parser.add_argument('--max-total', type=int, help='Budget for all stages together')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+
+    args = parser.parse_args()
+
+    path = args.path or get_default_plugins_path()
+    results = [analyze_skill(skill) for skill in find_skills(path)]
+
+    try:
+        defaults, per_skill = load_budgets(args.config, {
+            'description': args.max_description,
+            'skill_md': args.max_skill_md,
+            'references': args.max_references,
+            'total': args.max_total,
+        })
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Failed to load budget config: {e}", file=sys.stderr)
+        sys.exit(2)
+    violations = check_budgets(results, defaults, per_skill)
+
+    if args.json:
+        print(json.dumps({
+            'skills': sorted(results, key=lambda r: r['total'], reverse=True),
+            'violations': [
+                {'skill': label, 'stage': stage, 'tokens': tokens, 'limit': limit}
+                for label, stage, tokens, limit in violations
+            ]
+        }, ensure_ascii=False, indent=2))
+    else:
+        print_report(results, args.top, args.sections)
+        if violations:
+            print(f"\n❌ 予算超過: {len(violations)}件")
+            for label, stage, tokens, limit in violations:
+                print(f"  {label}: {stage} {tokens:,} > {limit:,}")
+        elif defaults or per_skill:
+            print("\n✅ すべてのスキルが予算内です")
+
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared SKILL.md frontmatter parsing for the skill-updater scripts.
+
+load_skill_md() parses only the frontmatter block of a SKILL.md (the rest of
+the file is streamed to count lines and check that it is valid UTF-8) and
+memoizes the result by (path, mtime_ns, size): in memory with an LRU, and,
+for skills laid out as <plugins-dir>/<plugin>/skills/<skill>/SKILL.md, on
+disk in <plugins-dir>/.cache/frontmatter.json so that list, search, validate
+and the marketplace index share parses across processes. Entries for files
+that no longer exist are dropped when a changed memo is saved, or by
+prune_memo() after a full scan.
+
+Usage (as a module):
+    from frontmatter import parse_frontmatter, load_skill_md
+    frontmatter, line_count = load_skill_md('path/to/SKILL.md')
+"""
+
+import atexit
+import codecs
+import functools
+import json
+import os
+import re
+import threading
+
+
+MEMO_VERSION = 2
+READ_CHUNK_SIZE = 1 << 16
+LRU_SIZE = 4096
+
+# Memo path -> {'entries': {path: [mtime_ns, size, frontmatter, lines]}, 'dirty': bool}
+_memos = {}
+_memo_lock = threading.Lock()
+
+
+def parse_frontmatter(content):
+    """Parse YAML frontmatter from SKILL.md content."""
+    pattern = r'^---\s*\n(.*?)\n---\s*\n'
+    match = re.match(pattern, content, re.DOTALL)
+    if not match:
+        return None
+
+    frontmatter = {}
+    lines = match.group(1).strip().split('\n')
+    current_key = None
+    current_value = []
+
+    for line in lines:
+        if line.startswith('  ') and current_key:
+            # Continuation of multiline value
+            current_value.append(line.strip())
+        elif ':' in line:
+            # Save previous key-value
+            if current_key:
+                frontmatter[current_key] = '\n'.join(current_value).strip()
+
+            key, _, value = line.partition(':')
+            current_key = key.strip()
+            value = value.strip()
+
+            if value == '|':
+                current_value = []
+            else:
+                current_value = [value] if value else []
+        else:
+            if current_key:
+                current_value.append(line.strip())
+
+    # Save last key-value
+    if current_key:
+        frontmatter[current_key] = '\n'.join(current_value).strip()
+
+    return frontmatter
+
+
+def count_lines(path):
+    """
+    Count the lines of a text file in binary chunks.
+
+    Lines are counted like `wc -l`, plus a final line without a newline.
+
+    Returns:
+        Line count, or None for binary files (NUL byte in the first chunk)
+    """
+    lines = 0
+    last = b''
+    with open(path, 'rb') as f:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if b'\0' in chunk:
+            return None
+        while chunk:
+            lines += chunk.count(b'\n')
+            last = chunk
+            chunk = f.read(READ_CHUNK_SIZE)
+    if last and not last.endswith(b'\n'):
+        lines += 1
+    return lines
+
+
+def scan_skill_md(path):
+    """
+    Parse a SKILL.md's frontmatter and count its lines in one pass.
+
+    Only the lines up to the closing frontmatter '---' are parsed; the rest
+    of the file is streamed in binary chunks to count lines (as count_lines
+    does) and is run through an incremental UTF-8 decoder so invalid bodies
+    are still rejected.
+
+    Returns:
+        Tuple of (frontmatter, line_count)
+
+    Raises:
+        OSError, UnicodeDecodeError: if the file cannot be read
+    """
+    with open(path, 'rb') as f:
+        head = [f.readline()]
+        if head[0].rstrip() == b'---':
+            for line in f:
+                head.append(line)
+                if line.rstrip() == b'---':
+                    break
+        lines = sum(line.count(b'\n') for line in head)
+        last = head[-1]
+        head_text = b''.join(head).decode('utf-8')
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        chunk = f.read(READ_CHUNK_SIZE)
+        while chunk:
+            lines += chunk.count(b'\n')
+            last = chunk
+            decoder.decode(chunk)
+            chunk = f.read(READ_CHUNK_SIZE)
+        decoder.decode(b'', final=True)
+    if last and not last.endswith(b'\n'):
+        lines += 1
+    return parse_frontmatter(head_text), lines
+
+
+def memo_path_for(path):
+    """
+    Get the on-disk memo path for an absolute SKILL.md path.
+
+    Returns:
+        <plugins-dir>/.cache/frontmatter.json, or None when the file is not
+        laid out as <plugins-dir>/<plugin>/skills/<skill>/SKILL.md
+    """
+    # String split rather than four dirname calls: this runs for every SKILL.md
+    parts = path.rsplit(os.sep, 4)
+    if len(parts) != 5 or parts[2] != 'skills' or not parts[0]:
+        return None
+    return parts[0] + os.sep + os.path.join('.cache', 'frontmatter.json')
+
+
+def _get_memo(memo_path):
+    """Get the on-disk memo for memo_path, loading it once (call with the lock held)."""
+    memo = _memos.get(memo_path)
+    if memo is None:
+        entries = {}
+        try:
+            with open(memo_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MEMO_VERSION:
+                entries = data['entries']
+        except (OSError, ValueError, KeyError):
+            pass
+        memo = _memos[memo_path] = {'entries': entries, 'dirty': False}
+    return memo
+
+
+def prune_memo(plugins_dir, paths):
+    """
+    Drop memo entries under plugins_dir whose SKILL.md is not in paths.
+
+    Meant for callers that have just scanned every skill of plugins_dir, so
+    deleted skills are forgotten without another stat per entry.
+
+    Args:
+        plugins_dir: Plugins directory whose memo to prune
+        paths: Paths of every SKILL.md that currently exists under it
+    """
+    memo_path = os.path.join(os.path.abspath(plugins_dir), '.cache', 'frontmatter.json')
+    keep = {os.path.abspath(path) for path in paths}
+    with _memo_lock:
+        memo = _memos.get(memo_path)
+        if memo is None:
+            return
+        entries = memo['entries']
+        for path in [path for path in entries if path not in keep]:
+            del entries[path]
+            memo['dirty'] = True
+
+
+def save_memo():
+    """
+    Write every changed on-disk memo (also registered with atexit).
+
+    Entries whose SKILL.md no longer exists are dropped first; unchanged
+    memos are neither checked nor written.
+    """
+    with _memo_lock:
+        for memo_path, memo in _memos.items():
+            if not memo['dirty']:
+                continue
+            entries = memo['entries']
+            for path in [path for path in entries if not os.path.exists(path)]:
+                del entries[path]
+            try:
+                os.makedirs(os.path.dirname(memo_path), exist_ok=True)
+                tmp_path = f"{memo_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'version': MEMO_VERSION, 'entries': entries}, f, ensure_ascii=False)
+                os.replace(tmp_path, memo_path)
+                memo['dirty'] = False
+            except OSError:
+                pass
+
+
+atexit.register(save_memo)
+
+
+def peek_skill_md(path, st):
+    """
+    Get a SKILL.md's memoized (frontmatter, line_count) without reading it.
+
+    Args:
+        path: Path to SKILL.md
+        st: os.stat_result for path
+
+    Returns:
+        Tuple of (frontmatter, line_count), or None if it is not memoized
+        for the current mtime and size
+    """
+    path = os.path.abspath(path)
+    memo_path = memo_path_for(path)
+    if memo_path is None:
+        return None
+    with _memo_lock:
+        cached = _get_memo(memo_path)['entries'].get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+    return None
+
+
+@functools.lru_cache(maxsize=LRU_SIZE)
+def _load(path, mtime_ns, size):
+    memo_path = memo_path_for(path)
+    if memo_path is not None:
+        with _memo_lock:
+            cached = _get_memo(memo_path)['entries'].get(path)
+        if cached and cached[0] == mtime_ns and cached[1] == size:
+            return cached[2], cached[3]
+
+    frontmatter, lines = scan_skill_md(path)
+    if memo_path is not None:
+        with _memo_lock:
+            memo = _get_memo(memo_path)
+            memo['entries'][path] = [mtime_ns, size, frontmatter, lines]
+            memo['dirty'] = True
+    return frontmatter, lines
+
+
+def load_skill_md(path, st=None):
+    """
+    Memoized scan_skill_md keyed by (path, mtime_ns, size).
+
+    Args:
+        path: Path to SKILL.md
+        st: Optional os.stat_result for path, if the caller already has it
+
+    Returns:
+        Tuple of (frontmatter, line_count); frontmatter is None when missing
+
+    Raises:
+        OSError, UnicodeDecodeError: if the file cannot be read
+    """
+    path = os.path.abspath(path)
+    if st is None:
+        st = os.stat(path)
+    return _load(path, st.st_mtime_ns, st.st_size)
+
+
+def load_frontmatter(path):
+    """Memoized frontmatter of a SKILL.md (None if missing or unreadable)."""
+    try:
+        return load_skill_md(path)[0]
+    except (OSError, UnicodeDecodeError):
+        return None
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Static and import-cost analysis of skill scripts.
+
+Every scripts/*.py is parsed with ast (in a process pool when there are many)
+and checked for:
+- syntax errors (errors)
+- top-level imports of heavy modules (warnings)
+- module-level work such as calls, loops and file access that runs on every
+  import (warnings); the standard Windows stdout wrapper, the __main__ guard
+  and cheap constructors such as re.compile are not flagged
+
+Skill scripts run on every trigger, so their startup cost is on the hot path.
+With --import-time each script is also run as `python -X importtime <script>
+--help` in a sandboxed subprocess (temporary working directory, CPU/memory
+limits, timeout) and scripts are ranked by import latency.
+
+Usage:
+    python script_analysis.py <skill-or-plugins-dir>... [--import-time] [--workers N]
+"""
+
+import argparse
+import ast
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+# Windows UTF-8 support
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+# Below this many files a pool costs more to start than it saves
+PARALLEL_THRESHOLD = 16
+
+IMPORT_TIME_TIMEOUT = 10
+IMPORT_TIME_CPU_SECONDS = 10
+IMPORT_TIME_MEMORY_BYTES = 1 << 30
+
+# Modules that take tens to hundreds of milliseconds to import
+HEAVY_MODULES = {
+    'numpy', 'pandas', 'scipy', 'matplotlib', 'sklearn', 'torch', 'tensorflow',
+    'transformers', 'requests', 'httpx', 'aiohttp', 'boto3', 'botocore', 'PIL',
+    'cv2', 'sympy', 'nltk', 'spacy', 'yaml', 'jinja2', 'openai', 'anthropic',
+    'asyncio', 'multiprocessing', 'email', 'http.server', 'xml.dom.minidom',
+}
+
+# Calls that are cheap enough to run at import time
+CHEAP_CALLS = {
+    're.compile', 'set', 'frozenset', 'dict', 'list', 'tuple', 'object', 'len',
+    'range', 'int', 'float', 'str', 'bytes', 'sorted', 'max', 'min',
+    'struct.Struct', 'threading.Lock', 'threading.RLock', 'threading.Event',
+    'collections.namedtuple', 'namedtuple', 'typing.NamedTuple', 'NamedTuple',
+    'TypeVar', 'typing.TypeVar', 'logging.getLogger', 'atexit.register',
+    'sys.path.insert', 'sys.path.append', 'os.getenv', 'os.environ.get',
+    'os.fsencode', 'os.fsdecode', 'Path', 'pathlib.Path', 'field',
+    'dataclasses.field', 'functools.partial', 'partial',
+}
+CHEAP_CALL_PREFIXES = ('os.path.',)
+
+
+def _dotted_name(node):
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+        return '.'.join(reversed(parts))
+    return None
+
+
+def _is_main_guard(node):
+    """if __name__ == '__main__':"""
+    test = node.test
+    return (isinstance(test, ast.Compare) and isinstance(test.left, ast.Name)
+            and test.left.id == '__name__')
+
+
+def _is_platform_guard(node):
+    """if sys.platform == 'win32': (the stdout/stderr UTF-8 wrapper)"""
+    names = {_dotted_name(n) for n in ast.walk(node.test)}
+    return 'sys.platform' in names or 'platform.system' in names
+
+
+def _is_cheap_call(call):
+    name = _dotted_name(call.func)
+    return name is not None and (name in CHEAP_CALLS or name.startswith(CHEAP_CALL_PREFIXES))
+
+
+def _module_statements(body):
+    """Yield statements that run at import time, descending into if/try blocks."""
+    for node in body:
+        if isinstance(node, ast.If):
+            if _is_main_guard(node) or _is_platform_guard(node):
+                continue
+            yield from _module_statements(node.body)
+            yield from _module_statements(node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from _module_statements(node.body)
+            for handler in node.handlers:
+                yield from _module_statements(handler.body)
+            yield from _module_statements(node.orelse)
+            yield from _module_statements(node.finalbody)
+        else:
+            yield node
+
+
+def _heavy_module(name):
+    for heavy in HEAVY_MODULES:
+        if name == heavy or name.startswith(heavy + '.'):
+            return heavy
+    return None
+
+
+def analyze_source(source, label):
+    """
+    Analyze the source of one script.
+
+    Args:
+        source: Script source text
+        label: Name used in messages (e.g. 'scripts/foo.py')
+
+    Returns:
+        tuple: (errors, warnings)
+    """
+    errors = []
+    warnings = []
+
+    if 'encoding' not in source and 'utf-8' not in source.lower():
+        warnings.append(f"{label}: Consider adding UTF-8 encoding declaration")
+
+    try:
+        tree = ast.parse(source, filename=label)
+    except SyntaxError as e:
+        errors.append(f"{label}:{e.lineno}: Syntax error: {e.msg}")
+        return errors, warnings
+
+    for node in _module_statements(tree.body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            if isinstance(node, ast.ImportFrom):
+                names = [node.module] if node.module and not node.level else []
+            else:
+                names = [alias.name for alias in node.names]
+            for name in names:
+                heavy = _heavy_module(name)
+                if heavy:
+                    warnings.append(
+                        f"{label}:{node.lineno}: Top-level import of '{heavy}' slows startup; "
+                        f"import it inside the function that needs it")
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        elif isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+            warnings.append(f"{label}:{node.lineno}: Module-level loop runs on every import; "
+                            f"move it into a function")
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            warnings.append(f"{label}:{node.lineno}: Module-level 'with' block runs on every import; "
+                            f"move it into a function")
+        else:
+            for child in ast.walk(node):
+                if isinstance(child, ast.Call) and not _is_cheap_call(child):
+                    name = _dotted_name(child.func) or 'call'
+                    warnings.append(f"{label}:{node.lineno}: Module-level call to '{name}()' "
+                                    f"runs on every import; move it into main()")
+                    break
+
+    return errors, warnings
+
+
+def analyze_script(path):
+    """
+    Analyze one script file.
+
+    Returns:
+        tuple: (errors, warnings); messages are prefixed with scripts/<name>
+    """
+    label = f"scripts/{os.path.basename(path)}"
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return [], [f"{label}: Failed to read: {e}"]
+    return analyze_source(source, label)
+
+
+def analyze_scripts(paths, workers=None):
+    """
+    Analyze scripts, in a process pool when there are many.
+
+    Args:
+        paths: Script paths
+        workers: Process count (default: os.cpu_count(); 1 disables the pool)
+
+    Returns:
+        List of (errors, warnings), in the order of paths
+    """
+    paths = list(paths)
+    if len(paths) < PARALLEL_THRESHOLD or workers == 1:
+        return [analyze_script(p) for p in paths]
+
+    # Imported here: concurrent.futures.process alone costs ~30 ms at startup
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_script, paths, chunksize=chunksize))
+
+
+def skill_scripts(skill_path):
+    """Sorted paths of a skill's scripts/*.py."""
+    scripts_path = os.path.join(skill_path, 'scripts')
+    try:
+        entries = os.scandir(scripts_path)
+    except OSError:
+        return []
+    return sorted(e.path for e in entries if e.name.endswith('.py') and e.is_file())
+
+
+def _limit_resources():
+    import resource
+    resource.setrlimit(resource.RLIMIT_CPU, (IMPORT_TIME_CPU_SECONDS, IMPORT_TIME_CPU_SECONDS))
+    resource.setrlimit(resource.RLIMIT_AS, (IMPORT_TIME_MEMORY_BYTES, IMPORT_TIME_MEMORY_BYTES))
+
+
+def _run_importtime(args, cwd):
+    env = {'PYTHONDONTWRITEBYTECODE': '1', 'PYTHONIOENCODING': 'utf-8'}
+    for key in ('PATH', 'SYSTEMROOT', 'TEMP', 'TMP'):
+        if key in os.environ:
+            env[key] = os.environ[key]
+    return subprocess.run(
+        [sys.executable, '-E', '-s', '-X', 'importtime'] + args,
+        cwd=cwd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, timeout=IMPORT_TIME_TIMEOUT,
+        preexec_fn=_limit_resources if os.name == 'posix' else None
+    )
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        Dict of top-level module name -> cumulative import time (us)
+    """
+    modules = {}
+    for line in stderr.decode('utf-8', errors='replace').splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|', 2)
+        except ValueError:
+            continue
+        # Nesting is shown by indentation after the single separator space
+        if name.startswith('  '):
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+_baseline = None
+
+
+def _baseline_modules(cwd):
+    """Modules the interpreter imports at startup, excluded from script totals."""
+    global _baseline
+    if _baseline is None:
+        _baseline = set(parse_importtime(_run_importtime(['-c', 'pass'], cwd).stderr))
+    return _baseline
+
+
+def measure_import_time(path):
+    """
+    Run `python -X importtime <script> --help` in a sandbox.
+
+    The script runs in a temporary working directory with a minimal
+    environment, CPU and memory limits (POSIX) and a timeout.
+
+    Returns:
+        Dict with path, total_us, modules (list of (name, us), slowest
+        first) and error (None on success)
+    """
+    result = {'path': path, 'total_us': 0, 'modules': [], 'error': None}
+    with tempfile.TemporaryDirectory(prefix='skill-importtime-') as cwd:
+        try:
+            baseline = _baseline_modules(cwd)
+            proc = _run_importtime([os.path.abspath(path), '--help'], cwd)
+        except subprocess.TimeoutExpired:
+            result['error'] = f"timed out after {IMPORT_TIME_TIMEOUT}s"
+            return result
+        except OSError as e:
+            result['error'] = str(e)
+            return result
+
+    modules = {name: us for name, us in parse_importtime(proc.stderr).items()
+               if name not in baseline}
+    result['total_us'] = sum(modules.values())
+    result['modules'] = sorted(modules.items(), key=lambda item: item[1], reverse=True)
+    if proc.returncode not in (0, 2):
+        result['error'] = f"exited with status {proc.returncode}"
+    return result
+
+
+def rank_import_times(paths, workers=1):
+    """
+    Measure the import time of scripts.
+
+    Args:
+        paths: Script paths
+        workers: Concurrent measurements; more than 1 is faster but inflates
+            timings when CPUs are contended
+
+    Returns:
+        List of measure_import_time() results, slowest first
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = list(paths)
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=workers or 1) as pool:
+        results = list(pool.map(measure_import_time, paths))
+    return sorted(results, key=lambda r: r['total_us'], reverse=True)
+
+
+def print_import_ranking(results, base_path=None, limit=20, top_modules=3):
+    """Print scripts ranked by import latency."""
+    print(f"\n{'='*50}")
+    print("Import time (python -X importtime <script> --help)")
+    print(f"{'='*50}\n")
+    for result in results[:limit]:
+        label = os.path.relpath(result['path'], base_path) if base_path else result['path']
+        print(f"{result['total_us'] / 1000:8.1f} ms  {label}")
+        modules = ', '.join(f"{name} {us / 1000:.1f}ms" for name, us in result['modules'][:top_modules])
+        if modules:
+            print(f"             {modules}")
+        if result['error']:
+            print(f"             ⚠ {result['error']}")
+    if len(results) > limit:
+        print(f"  ... {len(results) - limit} more")
+
+
+def _collect_scripts(paths):
+    scripts = []
+    for path in paths:
+        if os.path.isfile(path):
+            scripts.append(path)
+        elif os.path.isdir(os.path.join(path, 'scripts')):
+            scripts.extend(skill_scripts(path))
+        else:
+            for root, dirs, files in os.walk(path):
+                dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+                if os.path.basename(root) == 'scripts':
+                    scripts.extend(os.path.join(root, f) for f in sorted(files) if f.endswith('.py'))
+    return scripts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze skill scripts for errors and startup cost')
+    parser.add_argument('paths', nargs='+', help='Skill directories, plugins directories or scripts')
+    parser.add_argument('--import-time', action='store_true',
+                        help='Also measure import time with python -X importtime (runs each script)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes for parsing (default: CPU count)')
+    parser.add_argument('--import-time-workers', type=int, default=1,
+                        help='Concurrent --import-time measurements (default: 1, most accurate)')
+
+    args = parser.parse_args()
+
+    scripts = _collect_scripts(args.paths)
+    if not scripts:
+        print("No scripts found")
+        sys.exit(0)
+
+    failed = 0
+    warning_count = 0
+    for path, (errors, warnings) in zip(scripts, analyze_scripts(scripts, args.workers)):
+        if not errors and not warnings:
+            continue
+        print(f"\n{path}")
+        for error in errors:
+            print(f"  ✗ {error}")
+        for warning in warnings:
+            print(f"  ⚠ {warning}")
+        failed += bool(errors)
+        warning_count += len(warnings)
+
+    print(f"\n{'✓' if not failed else '✗'} {len(scripts)} script(s): "
+          f"{failed} with errors, {warning_count} warning(s)")
+
+    if args.import_time:
+        print_import_ranking(rank_import_times(scripts, args.import_time_workers), os.getcwd())
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
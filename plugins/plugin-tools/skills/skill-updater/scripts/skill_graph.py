@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cross-skill reference graph with impact queries.
+
+Every SKILL.md, and every markdown file under a skill's references/, is
+parsed for three kinds of edges:
+
+- mention: another skill's name (hyphenated names anywhere as a whole word;
+           single-word names only as "name skill", "nameスキル" or a
+           "| name |" table cell, so inline-code examples are not edges)
+- link:    relative markdown links outside code fences
+- script:  `python scripts/...py` invocations (code fences included)
+
+The graph is persisted in <plugins-dir>/.cache/skill_graph.json. Updates are
+incremental: a document is only re-parsed when its mtime or size changed, and
+a skill's file listing only when a directory mtime under it changed. Every
+document is re-parsed when the set of skill names changes, since mentions
+depend on it.
+
+Usage:
+    python skill_graph.py build [--path <plugins-dir>] [--rebuild]
+    python skill_graph.py dependents <skill-or-path> [--transitive]
+    python skill_graph.py deps <skill-or-path>
+    python skill_graph.py broken-links
+    python skill_graph.py orphans
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+
+from context_budget import INLINE_CODE_PATTERN, LINK_PATTERN
+from update_skill import find_skills, get_cache_dir, get_default_plugins_path, get_plugins_dir
+
+# Windows UTF-8 support
+if sys.platform == 'win32':
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
+
+
+GRAPH_VERSION = 2
+EDGE_KINDS = ['mention', 'link', 'script']
+SKIP_DIRS = {'__pycache__', '.cache'}
+
+SCRIPT_PATTERN = re.compile(r'\bpython3?\s+((?:[\w.-]+/)*scripts/[\w./-]+\.py)\b')
+URL_SCHEME_PATTERN = re.compile(r'^[a-z][a-z0-9+.-]*:', re.IGNORECASE)
+
+
+def get_graph_path(plugins_path):
+    """Get the persisted graph path (<plugins-dir>/.cache/skill_graph.json)."""
+    return os.path.join(get_cache_dir(plugins_path), 'skill_graph.json')
+
+
+def _mention_pattern(names):
+    """Compile one alternation matching any skill name in a mention context."""
+    hyphenated = sorted((n for n in names if '-' in n), key=len, reverse=True)
+    single = sorted((n for n in names if '-' not in n), key=len, reverse=True)
+    parts = []
+    if hyphenated:
+        parts.append(r'(?<![\w/-])(?P<h>' + '|'.join(map(re.escape, hyphenated)) + r')(?![\w-])')
+    if single:
+        alternation = '|'.join(map(re.escape, single))
+        parts.append(r'(?<![\w/-])`?(?P<s>' + alternation + r')`?(?=\s*(?:skill|スキル))')
+        parts.append(r'\|\s*(?P<t>' + alternation + r')\s*(?=\|)')
+    return re.compile('|'.join(parts)) if parts else None
+
+
+def _rel(path, plugins_dir):
+    return os.path.relpath(path, plugins_dir).replace(os.sep, '/')
+
+
+def parse_document(path, plugins_dir, skill_dir, mention_pattern, skill_keys):
+    """
+    Extract edges from one markdown document.
+
+    Args:
+        path: Absolute path of the document
+        plugins_dir: Directory containing the plugin directories
+        skill_dir: Directory of the skill owning the document
+        mention_pattern: Compiled pattern from _mention_pattern (or None)
+        skill_keys: Skill name -> list of "plugin/skill" keys
+
+    Returns:
+        List of [kind, target, line]; link and script targets are paths
+        relative to plugins_dir, mention targets are "plugin/skill" keys
+    """
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = f.read().split('\n')
+    except OSError:
+        return []
+
+    own_key = '/'.join(_rel(skill_dir, plugins_dir).split('/')[::2])
+    own_plugin = own_key.split('/', 1)[0]
+    edges = []
+    seen = set()
+
+    def add(kind, target, line_no):
+        if (kind, target) not in seen:
+            seen.add((kind, target))
+            edges.append([kind, target, line_no])
+
+    in_code = False
+    for line_no, line in enumerate(lines, 1):
+        for match in SCRIPT_PATTERN.finditer(line):
+            add('script', _rel(os.path.normpath(os.path.join(skill_dir, match.group(1))), plugins_dir),
+                line_no)
+
+        if mention_pattern:
+            for match in mention_pattern.finditer(line):
+                name = next(group for group in match.groups() if group)
+                keys = skill_keys.get(name, [])
+                # Prefer the skill in the same plugin when a name is ambiguous
+                same_plugin = [k for k in keys if k.startswith(own_plugin + '/')]
+                for key in same_plugin or keys:
+                    if key != own_key:
+                        add('mention', key, line_no)
+
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        for target in LINK_PATTERN.findall(INLINE_CODE_PATTERN.sub('', line)):
+            if URL_SCHEME_PATTERN.match(target) or target.startswith(('#', '/')):
+                continue
+            target = target.split('#', 1)[0]
+            if target:
+                resolved = os.path.normpath(os.path.join(os.path.dirname(path), target))
+                add('link', _rel(resolved, plugins_dir), line_no)
+    return edges
+
+
+def _walk_skill(skill_dir):
+    """
+    List a skill's files and directory mtimes in one scandir traversal.
+
+    Returns:
+        tuple: (files, dirs) with paths relative to skill_dir
+    """
+    files = []
+    dirs = {}
+    stack = [(skill_dir, '')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            dirs[rel_dir] = os.stat(dir_path).st_mtime_ns
+            entries = list(os.scandir(dir_path))
+        except OSError:
+            continue
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir():
+                if entry.name not in SKIP_DIRS:
+                    stack.append((entry.path, rel_path))
+            elif entry.is_file():
+                files.append(rel_path)
+    return sorted(files), dirs
+
+
+def _dirs_changed(skill_dir, dirs):
+    for rel_dir, mtime_ns in dirs.items():
+        try:
+            if os.stat(os.path.join(skill_dir, rel_dir)).st_mtime_ns != mtime_ns:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def load_graph(plugins_path):
+    """Load the persisted graph, or None if missing or another version."""
+    try:
+        with open(get_graph_path(plugins_path), 'r', encoding='utf-8') as f:
+            graph = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return graph if graph.get('version') == GRAPH_VERSION else None
+
+
+def save_graph(plugins_path, graph):
+    """Persist the graph atomically."""
+    graph_path = get_graph_path(plugins_path)
+    os.makedirs(os.path.dirname(graph_path), exist_ok=True)
+    tmp_path = f"{graph_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(graph, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, graph_path)
+
+
+def update_graph(plugins_path, rebuild=False, stats=None):
+    """
+    Bring the persisted graph up to date and return it.
+
+    Args:
+        plugins_path: Marketplace root or plugins directory
+        rebuild: Ignore the persisted graph
+        stats: Optional dict; 'parsed' and 'reused' documents are counted
+
+    Returns:
+        Graph dict: {version, names, skills: {key: {path, files, dirs, docs}}}
+        where docs maps a path relative to the skill to {mtime_ns, size, edges}
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('parsed', 0)
+    stats.setdefault('reused', 0)
+
+    plugins_dir = get_plugins_dir(plugins_path)
+    skills = find_skills(plugins_path)
+    skill_keys = {}
+    for skill in skills:
+        skill_keys.setdefault(skill['name'], []).append(f"{skill['plugin']}/{skill['name']}")
+    all_keys = sorted(key for keys in skill_keys.values() for key in keys)
+    names_hash = hashlib.sha256('\0'.join(all_keys).encode('utf-8')).hexdigest()
+
+    old = None if rebuild else load_graph(plugins_path)
+    if old and old.get('names') != names_hash:
+        old = None
+    old_skills = old['skills'] if old else {}
+    mention_pattern = _mention_pattern(skill_keys)
+
+    new_skills = {}
+    changed = old is None
+    for skill in skills:
+        key = f"{skill['plugin']}/{skill['name']}"
+        skill_dir = os.path.abspath(skill['path'])
+        entry = old_skills.get(key)
+        if entry is None or _dirs_changed(skill_dir, entry['dirs']):
+            files, dirs = _walk_skill(skill_dir)
+            entry = {'path': _rel(skill_dir, plugins_dir), 'files': files, 'dirs': dirs,
+                     'docs': entry['docs'] if entry else {}}
+            changed = True
+
+        docs = {}
+        for rel_path in entry['files']:
+            if rel_path != 'SKILL.md' and not (rel_path.startswith('references/') and rel_path.endswith('.md')):
+                continue
+            path = os.path.join(skill_dir, rel_path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            doc = entry['docs'].get(rel_path)
+            if doc and doc['mtime_ns'] == st.st_mtime_ns and doc['size'] == st.st_size:
+                stats['reused'] += 1
+            else:
+                doc = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                       'edges': parse_document(path, plugins_dir, skill_dir, mention_pattern, skill_keys)}
+                stats['parsed'] += 1
+                changed = True
+            docs[rel_path] = doc
+        entry['docs'] = docs
+        new_skills[key] = entry
+
+    graph = {'version': GRAPH_VERSION, 'names': names_hash, 'skills': new_skills}
+    if changed or set(new_skills) != set(old_skills):
+        save_graph(plugins_path, graph)
+    return graph
+
+
+def iter_edges(graph):
+    """Yield (source_skill, source_doc, kind, target, line) for every edge."""
+    for key, entry in graph['skills'].items():
+        for doc, info in entry['docs'].items():
+            for kind, target, line in info['edges']:
+                yield key, f"{entry['path']}/{doc}", kind, target, line
+
+
+def owner_of(graph, target):
+    """Skill key whose directory contains a plugins-relative path (or None)."""
+    for key, entry in graph['skills'].items():
+        if target == entry['path'] or target.startswith(entry['path'] + '/'):
+            return key
+    return None
+
+
+def resolve_node(graph, query):
+    """
+    Resolve a query to ('skill', key) or ('path', plugins-relative path).
+
+    Accepts "plugin/skill", a bare skill name (if unique), or a file path
+    (absolute, relative to the cwd, or relative to the plugins directory).
+    """
+    if query in graph['skills']:
+        return 'skill', query
+    matches = [key for key in graph['skills'] if key.split('/', 1)[1] == query]
+    if len(matches) == 1:
+        return 'skill', matches[0]
+    return 'path', query.replace(os.sep, '/').strip('/')
+
+
+def _normalize_path(plugins_dir, query):
+    if os.path.exists(query):
+        return _rel(os.path.abspath(query), plugins_dir)
+    return query.replace(os.sep, '/').strip('/')
+
+
+def dependents(graph, kind, node, transitive=False):
+    """
+    Edges pointing at a skill (any path inside it, or a mention) or a file.
+
+    With transitive (skills only), dependents of dependents are followed.
+
+    Returns:
+        List of (depth, source_skill, source_doc, kind, target, line)
+    """
+    reverse = {}
+    for edge in iter_edges(graph):
+        _, _, edge_kind, target, _ = edge
+        target_key = target if edge_kind == 'mention' else owner_of(graph, target)
+        reverse.setdefault(target_key, []).append(edge)
+        if edge_kind != 'mention':
+            reverse.setdefault(target, []).append(edge)
+
+    if kind == 'path':
+        return [(1,) + edge for edge in reverse.get(node, [])]
+
+    results = []
+    seen = {node}
+    frontier = [node]
+    depth = 1
+    while frontier:
+        next_frontier = []
+        for key in frontier:
+            for edge in reverse.get(key, []):
+                # Skills already reached at a shallower depth add nothing new
+                if edge[0] in seen:
+                    continue
+                results.append((depth,) + edge)
+                if transitive and edge[0] not in next_frontier:
+                    next_frontier.append(edge[0])
+        seen.update(next_frontier)
+        frontier = next_frontier
+        depth += 1
+    return results
+
+
+def dependencies(graph, kind, node):
+    """Edges leaving a skill (all its documents) or a single document."""
+    if kind == 'skill':
+        return [edge for edge in iter_edges(graph) if edge[0] == node]
+    return [edge for edge in iter_edges(graph) if edge[1] == node]
+
+
+def broken_links(graph, plugins_dir):
+    """Link and script edges whose target does not exist (stat only)."""
+    return [edge for edge in iter_edges(graph)
+            if edge[2] != 'mention' and not os.path.exists(os.path.join(plugins_dir, edge[3]))]
+
+
+def orphans(graph):
+    """
+    Markdown files under a skill's references/ that no document links to.
+
+    Other reference files (e.g. metadata.json) are loaded by scripts rather
+    than linked, so they are never reported.
+    """
+    targets = {edge[3] for edge in iter_edges(graph) if edge[2] != 'mention'}
+    results = []
+    for key, entry in sorted(graph['skills'].items()):
+        for rel_path in entry['files']:
+            if rel_path.startswith('references/') and rel_path.endswith('.md') \
+                    and f"{entry['path']}/{rel_path}" not in targets:
+                results.append((key, rel_path))
+    return results
+
+
+def _print_edges(edges, empty_message):
+    if not edges:
+        print(empty_message)
+        return
+    for edge in edges:
+        depth = ''
+        if len(edge) == 6:
+            depth, edge = (f"[{edge[0]}] " if edge[0] > 1 else ''), edge[1:]
+        _, doc, kind, target, line = edge
+        print(f"  {depth}{doc}:{line}  {kind} -> {target}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cross-skill reference graph')
+    parser.add_argument('--path', default=None, help='Plugins directory path')
+    parser.add_argument('--no-update', action='store_true',
+                        help='Query the persisted graph without checking for changes')
+    subparsers = parser.add_subparsers(dest='command', help='Command to run')
+
+    build_parser = subparsers.add_parser('build', help='Update (or rebuild) the persisted graph')
+    build_parser.add_argument('--rebuild', action='store_true', help='Ignore the persisted graph')
+
+    dependents_parser = subparsers.add_parser('dependents', help='What depends on a skill or file')
+    dependents_parser.add_argument('node', help='Skill (name or plugin/skill) or file path')
+    dependents_parser.add_argument('--transitive', action='store_true',
+                                   help='Also list dependents of dependents (skills only)')
+
+    deps_parser = subparsers.add_parser('deps', help='What a skill or document references')
+    deps_parser.add_argument('node', help='Skill (name or plugin/skill) or document path')
+
+    subparsers.add_parser('broken-links', help='Links and script invocations to missing files')
+    subparsers.add_parser('orphans', help='Markdown reference files no document links to')
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return
+
+    plugins_path = args.path or get_default_plugins_path()
+    plugins_dir = get_plugins_dir(plugins_path)
+    stats = {}
+    graph = None
+    if args.no_update and args.command != 'build':
+        graph = load_graph(plugins_path)
+        if graph is None:
+            print("Graph not built yet; run: python skill_graph.py build")
+            sys.exit(1)
+    if graph is None:
+        graph = update_graph(plugins_path, getattr(args, 'rebuild', False), stats)
+
+    if args.command == 'build':
+        edge_counts = {kind: 0 for kind in EDGE_KINDS}
+        for edge in iter_edges(graph):
+            edge_counts[edge[2]] += 1
+        print(f"Graph: {len(graph['skills'])} skills, "
+              + ', '.join(f"{count} {kind}" for kind, count in edge_counts.items()) + " edge(s)")
+        print(f"Documents: {stats['parsed']} parsed, {stats['reused']} unchanged")
+        print(f"Graph file: {get_graph_path(plugins_path)}")
+    elif args.command in ('dependents', 'deps'):
+        kind, node = resolve_node(graph, args.node)
+        if kind == 'path':
+            node = _normalize_path(plugins_dir, args.node)
+        if args.command == 'dependents':
+            edges = dependents(graph, kind, node, args.transitive)
+            print(f"\n## Dependents of {node}\n")
+            _print_edges(edges, "  (none)")
+            sources = sorted({edge[1] for edge in edges})
+            if sources:
+                print(f"\nAffected skills: {', '.join(sources)}")
+        else:
+            print(f"\n## References from {node}\n")
+            _print_edges(dependencies(graph, kind, node), "  (none)")
+    elif args.command == 'broken-links':
+        edges = broken_links(graph, plugins_dir)
+        print(f"\n## Broken links ({len(edges)})\n")
+        _print_edges(edges, "  (none)")
+        if edges:
+            sys.exit(1)
+    elif args.command == 'orphans':
+        results = orphans(graph)
+        print(f"\n## Orphaned references ({len(results)})\n")
+        if not results:
+            print("  (none)")
+        for key, rel_path in results:
+            print(f"  {key}: {rel_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel regex search over the files of every skill (update_skill.py grep).
+
+Files are grouped into per-skill batches that are submitted to a process
+pool while the tree is still being walked; results are reported in walk
+order as soon as the batches ahead of them have finished, so each skill's
+matches stay together. Binary files (NUL byte in the first 8 KiB) and files
+above the size limit are skipped.
+
+Usage (as a module):
+    from skill_grep import grep_skills
+    for plugin, skill, matches in grep_skills(plugins_path, r'DYNAMIC_CONTENT_START'):
+        ...
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import os
+import re
+
+
+DEFAULT_MAX_SIZE = 1 << 20
+BINARY_SNIFF_SIZE = 8192
+BATCH_SIZE = 256
+# Batches in flight per worker before the walk waits for the oldest one
+MAX_PENDING_PER_WORKER = 4
+
+# Below this many files a pool costs more to start than it saves
+PARALLEL_THRESHOLD = 200
+
+SKIP_DIRS = {'__pycache__', 'node_modules'}
+
+_pattern = None
+
+
+def iter_skill_files(plugins_dir, max_size=DEFAULT_MAX_SIZE, stats=None):
+    """
+    Walk every skill directory and yield its searchable files.
+
+    Args:
+        plugins_dir: Directory that contains plugin directories
+        max_size: Files larger than this (bytes) are skipped
+        stats: Optional dict; 'oversized' count is incremented
+
+    Yields:
+        Tuples of (plugin, skill, relative_path, absolute_path)
+    """
+    for plugin_entry in sorted(os.scandir(plugins_dir), key=lambda e: e.name):
+        skills_dir = os.path.join(plugin_entry.path, 'skills')
+        if not plugin_entry.is_dir() or not os.path.isdir(skills_dir):
+            continue
+        for skill_entry in sorted(os.scandir(skills_dir), key=lambda e: e.name):
+            if not skill_entry.is_dir():
+                continue
+            stack = [(skill_entry.path, '')]
+            while stack:
+                dir_path, rel_dir = stack.pop()
+                for entry in os.scandir(dir_path):
+                    if entry.name.startswith('.') or entry.name in SKIP_DIRS:
+                        continue
+                    rel_path = f"{rel_dir}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, rel_path + '/'))
+                    elif entry.is_file():
+                        if entry.stat().st_size > max_size:
+                            if stats is not None:
+                                stats['oversized'] = stats.get('oversized', 0) + 1
+                            continue
+                        yield plugin_entry.name, skill_entry.name, rel_path, entry.path
+
+
+def _init_worker(pattern, flags):
+    global _pattern
+    _pattern = re.compile(pattern, flags)
+
+
+def search_file(path, pattern=None):
+    """
+    Search one file.
+
+    Returns:
+        List of (line_number, line) for matching lines, or None if the file
+        is binary or unreadable
+    """
+    pattern = pattern or _pattern
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if b'\0' in data[:BINARY_SNIFF_SIZE]:
+        return None
+
+    text = data.decode('utf-8', errors='replace')
+    if pattern.search(text) is None:
+        return []
+
+    matches = []
+    line_no = 1
+    pos = 0
+    last_line = 0
+    for match in pattern.finditer(text):
+        line_no += text.count('\n', pos, match.start())
+        pos = match.start()
+        if line_no == last_line:
+            continue
+        last_line = line_no
+        start = text.rfind('\n', 0, match.start()) + 1
+        end = text.find('\n', match.start())
+        matches.append((line_no, text[start:end if end != -1 else len(text)].rstrip('\r')))
+    return matches
+
+
+def _search_batch(batch, pattern=None):
+    """Search a batch of (plugin, skill, rel_path, path) from one skill."""
+    plugin, skill = batch[0][0], batch[0][1]
+    found = []
+    skipped = 0
+    for _, _, rel_path, path in batch:
+        matches = search_file(path, pattern)
+        if matches is None:
+            skipped += 1
+        elif matches:
+            found.append((rel_path, matches))
+    return plugin, skill, found, skipped
+
+
+def _batches(files):
+    batch = []
+    for item in files:
+        if batch and (len(batch) >= BATCH_SIZE or batch[-1][:2] != item[:2]):
+            yield batch
+            batch = []
+        batch.append(item)
+    if batch:
+        yield batch
+
+
+def grep_skills(plugins_dir, pattern, flags=0, workers=None, max_size=DEFAULT_MAX_SIZE, stats=None):
+    """
+    Search every skill file for a regex, yielding results in walk order.
+
+    Args:
+        plugins_dir: Directory that contains plugin directories
+        pattern: Regular expression (str)
+        flags: re flags
+        workers: Process count (default: os.cpu_count())
+        max_size: Skip files larger than this many bytes
+        stats: Optional dict; receives 'files', 'binary' and 'oversized' counts
+
+    Yields:
+        Tuples of (plugin, skill, [(rel_path, [(line_no, line), ...]), ...])
+        for batches that had matches; a skill with many files may be reported
+        in several consecutive batches
+    """
+    if stats is None:
+        stats = {}
+    stats.update(files=0, binary=0, oversized=0)
+
+    def counted(items):
+        for item in items:
+            stats['files'] += 1
+            yield item
+
+    def report(result):
+        plugin, skill, found, skipped = result
+        stats['binary'] += skipped
+        if found:
+            yield plugin, skill, found
+
+    # Only the first PARALLEL_THRESHOLD files are walked before deciding
+    files = iter_skill_files(plugins_dir, max_size, stats)
+    head = list(itertools.islice(files, PARALLEL_THRESHOLD))
+    files = counted(itertools.chain(head, files))
+
+    if len(head) < PARALLEL_THRESHOLD or workers == 1:
+        compiled = re.compile(pattern, flags)
+        for batch in _batches(files):
+            yield from report(_search_batch(batch, compiled))
+        return
+
+    max_pending = (workers or os.cpu_count() or 1) * MAX_PENDING_PER_WORKER
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(pattern, flags)) as pool:
+        pending = deque()
+        for batch in _batches(files):
+            pending.append(pool.submit(_search_batch, batch))
+            while pending and (len(pending) >= max_pending or pending[0].done()):
+                yield from report(pending.popleft().result())
+        while pending:
+            yield from report(pending.popleft().result())
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ranked full-text index over SKILL.md files for update_skill.py search.
+
+Each skill is indexed by field (name, trigger phrases, description, headings,
+body) with CJK bigram + ASCII word tokens and ranked with BM25 over
+field-weighted term frequencies. The index is kept in
+plugins/.cache/skill_search_index.pickle and only SKILL.md files whose mtime or
+size changed are re-tokenized.
+
+A character-trigram index over plugin/skill names and trigger phrases backs
+typo-tolerant lookups (search --fuzzy), e.g. "skil-updater".
+
+Usage (as a module):
+    from skill_index import load_search_index, search_index
+    index = load_search_index(plugins_path)
+    results = search_index(index, 'コーディング規約')
+    candidates = fuzzy_lookup(index, 'skil-updater')
+"""
+
+from array import array
+from collections import Counter
+import heapq
+import math
+import os
+import pickle
+import re
+import unicodedata
+
+from frontmatter import parse_frontmatter
+from tokenizer import tokenize
+
+
+INDEX_VERSION = 2
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Added to the BM25 score when the query matches one of a skill's trigger
+# phrases (「...」 in the description) exactly
+TRIGGER_PHRASE_BONUS = 5.0
+
+# Fuzzy candidates are first ranked by shared trigram count (counted by
+# Counter in C); this many per requested result are re-scored by Dice
+# similarity and those below FUZZY_MIN_SCORE are dropped.
+FUZZY_RERANK_FACTOR = 20
+FUZZY_MIN_SCORE = 0.3
+
+# Term frequencies are multiplied by these weights per field
+FIELD_WEIGHTS = {
+    'name': 3.0,
+    'triggers': 2.5,
+    'description': 2.0,
+    'headings': 1.5,
+    'body': 1.0,
+}
+
+TRIGGER_PATTERN = re.compile(r'「([^」]+)」|"([^"]+)"')
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n.*?\n---\s*\n', re.DOTALL)
+
+
+def _normalize(text):
+    return ' '.join(unicodedata.normalize('NFKC', text).lower().split())
+
+
+def extract_fields(skill_name, content):
+    """
+    Split SKILL.md content into the indexed fields.
+
+    Returns:
+        Tuple of (fields, frontmatter) where fields maps field name to text
+    """
+    frontmatter = parse_frontmatter(content) or {}
+    description = frontmatter.get('description', '')
+
+    triggers = [a or b for a, b in TRIGGER_PATTERN.findall(description)]
+
+    match = FRONTMATTER_PATTERN.match(content)
+    body_text = content[match.end():] if match else content
+    headings = []
+    body = []
+    in_code = False
+    for line in body_text.split('\n'):
+        if line.lstrip().startswith('```'):
+            in_code = not in_code
+        elif not in_code and line.startswith('#'):
+            headings.append(line.lstrip('#').strip())
+            continue
+        body.append(line)
+
+    fields = {
+        'name': f"{skill_name} {frontmatter.get('name', '')}",
+        'triggers': '\n'.join(triggers),
+        'description': description,
+        'headings': '\n'.join(headings),
+        'body': '\n'.join(body),
+    }
+    return fields, frontmatter
+
+
+def _weighted_tf(fields):
+    tf = Counter()
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for token in tokenize(text):
+            tf[token] += weight
+    return tf
+
+
+def get_index_path(plugins_path):
+    """Get the search index path (<plugins-dir>/.cache/skill_search_index.pickle)."""
+    from update_skill import get_cache_dir
+    return os.path.join(get_cache_dir(plugins_path), 'skill_search_index.pickle')
+
+
+def _empty_index():
+    return {'version': INDEX_VERSION, 'docs': {}, 'postings': {}, 'phrases': {}, 'total_len': 0.0,
+            'fuzzy': build_fuzzy_index([])}
+
+
+def _remove_doc(index, key):
+    doc = index['docs'].pop(key)
+    postings = index['postings']
+    for term in doc['tf']:
+        posting = postings[term]
+        del posting[key]
+        if not posting:
+            del postings[term]
+    for phrase in doc['triggers']:
+        keys = index['phrases'][phrase]
+        keys.discard(key)
+        if not keys:
+            del index['phrases'][phrase]
+    index['total_len'] -= doc['len']
+
+
+def _add_doc(index, key, skill, st, content):
+    fields, frontmatter = extract_fields(skill['name'], content)
+    tf = _weighted_tf(fields)
+    length = sum(tf.values())
+    index['docs'][key] = {
+        'mtime': st.st_mtime_ns,
+        'size': st.st_size,
+        'plugin': skill['plugin'],
+        'name': skill['name'],
+        'path': skill['path'],
+        'description': frontmatter.get('description', ''),
+        'triggers': [_normalize(t) for t in fields['triggers'].split('\n') if t],
+        'tf': dict(tf),
+        'len': length,
+    }
+    postings = index['postings']
+    for term, freq in tf.items():
+        postings.setdefault(term, {})[key] = freq
+    for phrase in index['docs'][key]['triggers']:
+        index['phrases'].setdefault(phrase, set()).add(key)
+    index['total_len'] += length
+
+
+def load_search_index(plugins_path, use_cache=True, stats=None):
+    """
+    Load the search index and bring it up to date with the SKILL.md files.
+
+    Args:
+        plugins_path: Marketplace root or plugins directory
+        use_cache: Whether to read and persist the index file
+        stats: Optional dict; receives find_skills cache hits/misses and the
+            'reindexed' and 'removed' counts
+
+    Returns:
+        Index dict
+    """
+    from update_skill import find_skills
+
+    index_path = get_index_path(plugins_path)
+    index = None
+    if use_cache:
+        try:
+            with open(index_path, 'rb') as f:
+                index = pickle.load(f)
+            if index.get('version') != INDEX_VERSION:
+                index = None
+        except Exception:
+            index = None
+    if index is None:
+        index = _empty_index()
+
+    reindexed = 0
+    seen = set()
+    for skill in find_skills(plugins_path, use_cache, stats):
+        key = os.path.join(skill['path'], 'SKILL.md')
+        try:
+            st = os.stat(key)
+        except OSError:
+            continue
+        seen.add(key)
+
+        doc = index['docs'].get(key)
+        if doc and doc['mtime'] == st.st_mtime_ns and doc['size'] == st.st_size:
+            continue
+        try:
+            with open(key, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception:
+            continue
+        if doc:
+            _remove_doc(index, key)
+        _add_doc(index, key, skill, st, content)
+        reindexed += 1
+
+    removed = [key for key in index['docs'] if key not in seen]
+    for key in removed:
+        _remove_doc(index, key)
+
+    if reindexed or removed:
+        index['fuzzy'] = build_fuzzy_index(_fuzzy_names(index['docs']))
+
+    if stats is not None:
+        stats['reindexed'] = reindexed
+        stats['removed'] = len(removed)
+
+    if use_cache and (reindexed or removed):
+        try:
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            tmp_path = index_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass
+
+    return index
+
+
+def search_index(index, query, limit=None):
+    """
+    Rank skills for a query with BM25.
+
+    Args:
+        index: Search index from load_search_index
+        query: Search query
+        limit: Maximum number of results (None for all matches)
+
+    Returns:
+        List of (score, doc) tuples, best first; doc has plugin, name, path
+        and description
+    """
+    docs = index['docs']
+    n = len(docs)
+    if n == 0:
+        return []
+
+    avg_len = index['total_len'] / n or 1.0
+    scores = {}
+    for term in set(tokenize(query)):
+        posting = index['postings'].get(term)
+        if not posting:
+            continue
+        df = len(posting)
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for key, tf in posting.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * docs[key]['len'] / avg_len)
+            scores[key] = scores.get(key, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+    for key in index['phrases'].get(_normalize(query), ()):
+        scores[key] = scores.get(key, 0.0) + TRIGGER_PHRASE_BONUS
+
+    if limit is None:
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    else:
+        ranked = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+    return [(score, docs[key]) for key, score in ranked]
+
+
+def normalize_name(text):
+    """Normalize a name for fuzzy matching: NFKC, lowercase, '-' separators."""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return '-'.join(re.split(r'[\s_/-]+', text.strip()))
+
+
+def trigrams(name):
+    """Character trigrams of a normalized name, padded at both ends."""
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _fuzzy_names(docs):
+    """Yield (name, key) pairs to put in the fuzzy index."""
+    for key, doc in docs.items():
+        yield doc['name'], key
+        yield f"{doc['plugin']}/{doc['name']}", key
+        yield doc['plugin'], key
+        for phrase in doc['triggers']:
+            yield phrase, key
+
+
+def build_fuzzy_index(names):
+    """
+    Build a trigram index over names.
+
+    Args:
+        names: Iterable of (name, key); key identifies what the name resolves to
+
+    Returns:
+        Dict with 'names' (list of (normalized, original, key, trigram count))
+        and 'postings' (trigram -> array of name ids)
+    """
+    entries = []
+    postings = {}
+    seen = set()
+    for name, key in names:
+        normalized = normalize_name(name)
+        if not normalized or (normalized, key) in seen:
+            continue
+        seen.add((normalized, key))
+        grams = trigrams(normalized)
+        name_id = len(entries)
+        entries.append((normalized, name, key, len(grams)))
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('I')
+            posting.append(name_id)
+    return {'names': entries, 'postings': postings}
+
+
+def fuzzy_lookup(index, query, limit=5):
+    """
+    Find the names most similar to query by trigram Dice similarity.
+
+    Only names sharing at least one trigram with the query are touched.
+
+    Args:
+        index: Search index (its 'fuzzy' section comes from build_fuzzy_index)
+        query: Possibly misspelled name
+        limit: Number of distinct keys to return
+
+    Returns:
+        List of (score, matched_name, key), best first
+    """
+    fuzzy = index['fuzzy']
+    query_grams = trigrams(normalize_name(query))
+    if not query_grams:
+        return []
+
+    counts = Counter()
+    postings = fuzzy['postings']
+    for gram in query_grams:
+        posting = postings.get(gram)
+        if posting is not None:
+            counts.update(posting)
+
+    names = fuzzy['names']
+    query_len = len(query_grams)
+    scored = []
+    for name_id, common in counts.most_common(limit * FUZZY_RERANK_FACTOR):
+        _, original, key, gram_count = names[name_id]
+        scored.append((2.0 * common / (query_len + gram_count), original, key))
+    scored.sort(key=lambda item: item[0], reverse=True)
+
+    results = []
+    seen = set()
+    for score, original, key in scored:
+        if score < FUZZY_MIN_SCORE or key in seen:
+            continue
+        seen.add(key)
+        results.append((score, original, key))
+        if len(results) == limit:
+            break
+    return results
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Change detection for skill directories (validate_skill.py --watch).
+
+Two backends report which skills changed since the last call:
+
+- PollWatcher: a periodic os.scandir stat sweep; each skill is summarized by
+  the names, sizes and mtimes of its files. The interval grows with the
+  sweep time so polling stays under 5% of one CPU.
+- InotifyWatcher: Linux inotify through ctypes; blocks in select() so an idle
+  watch costs no CPU. New directories are watched as they appear.
+
+Usage (as a module):
+    from skill_watch import create_watcher
+    watcher = create_watcher(plugins_dir, backend='auto')
+    while True:
+        for skill_path in watcher.wait(interval=1.0):
+            ...
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+
+
+# Directories whose changes never affect validation
+IGNORED_DIRS = {'__pycache__', '.cache'}
+
+# After the first change, keep collecting events for this long so an editor's
+# save (write + rename + chmod) is handled as one change
+DEBOUNCE_SECONDS = 0.2
+
+# The poll backend stretches its interval so that sweeps take at most this
+# fraction of wall time on very large trees
+MAX_POLL_DUTY = 0.05
+
+
+def skill_of(plugins_dir, path):
+    """Map a path under plugins_dir to its skill directory, or None."""
+    parts = os.path.relpath(path, plugins_dir).split(os.sep)
+    if len(parts) < 3 or parts[1] != 'skills' or parts[0] in IGNORED_DIRS:
+        return None
+    return os.path.join(plugins_dir, parts[0], 'skills', parts[2])
+
+
+def iter_skill_dirs(plugins_dir):
+    """Yield every skill directory (plugins/<plugin>/skills/<skill>)."""
+    for plugin_entry in os.scandir(plugins_dir):
+        if not plugin_entry.is_dir() or plugin_entry.name in IGNORED_DIRS:
+            continue
+        skills_dir = os.path.join(plugin_entry.path, 'skills')
+        if not os.path.isdir(skills_dir):
+            continue
+        for skill_entry in os.scandir(skills_dir):
+            if skill_entry.is_dir():
+                yield skill_entry.path
+
+
+class PollWatcher:
+    """Detect changes with a scandir stat sweep every interval."""
+
+    name = 'poll'
+
+    def __init__(self, plugins_dir):
+        self.plugins_dir = plugins_dir
+        self.sweep_time = 0.0
+        self.snapshot = self._sweep()
+
+    def _signature(self, skill_path):
+        items = []
+        stack = [skill_path]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name in IGNORED_DIRS:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        items.append((entry.path, -1, -1))
+                        stack.append(entry.path)
+                    else:
+                        st = entry.stat()
+                        items.append((entry.path, st.st_mtime_ns, st.st_size))
+                except OSError:
+                    continue
+        items.sort()
+        return hash(tuple(items))
+
+    def _sweep(self):
+        start = time.perf_counter()
+        try:
+            snapshot = {p: self._signature(p) for p in iter_skill_dirs(self.plugins_dir)}
+        except OSError:
+            snapshot = {}
+        self.sweep_time = time.perf_counter() - start
+        return snapshot
+
+    def _changes(self):
+        current = self._sweep()
+        changed = {p for p, sig in current.items() if self.snapshot.get(p) != sig}
+        changed.update(p for p in self.snapshot if p not in current)
+        self.snapshot = current
+        return changed
+
+    def wait(self, interval=1.0):
+        """
+        Block until at least one skill changes.
+
+        Returns:
+            Set of changed skill directory paths (including removed ones)
+        """
+        while True:
+            time.sleep(max(interval, self.sweep_time / MAX_POLL_DUTY))
+            changed = self._changes()
+            if changed:
+                time.sleep(DEBOUNCE_SECONDS)
+                return changed | self._changes()
+
+    def close(self):
+        pass
+
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_libc():
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify (no polling)."""
+
+    name = 'inotify'
+
+    def __init__(self, plugins_dir):
+        self.libc = _load_libc()
+        if self.libc is None:
+            raise OSError("inotify is not available on this platform")
+        self.plugins_dir = plugins_dir
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches = {}
+        self._overflowed = False
+        try:
+            self._add_tree(plugins_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(err, f"inotify_add_watch failed for {path}: {os.strerror(err)}")
+        self.watches[wd] = path
+
+    def _add_tree(self, root):
+        """Watch root and every directory below it (except ignored ones)."""
+        stack = [root]
+        while stack:
+            dir_path = stack.pop()
+            self._add_watch(dir_path)
+            try:
+                entries = list(os.scandir(dir_path))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name not in IGNORED_DIRS and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+    def _read_events(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self._overflowed = True
+                    continue
+                dir_path = self.watches.get(wd)
+                if dir_path is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self.watches[wd]
+                    continue
+
+                path = os.path.join(dir_path, os.fsdecode(name)) if name else dir_path
+                if os.path.basename(path) in IGNORED_DIRS:
+                    continue
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_tree(path)
+                skill_path = skill_of(self.plugins_dir, path)
+                if skill_path:
+                    changed.add(skill_path)
+
+    def wait(self, interval=None):
+        """
+        Block until at least one skill changes.
+
+        Returns:
+            Set of changed skill directory paths (including removed ones)
+        """
+        while True:
+            select.select([self.fd], [], [])
+            changed = self._read_events()
+            time.sleep(DEBOUNCE_SECONDS)
+            changed |= self._read_events()
+            if self._overflowed:
+                # Events were dropped: re-watch the tree and treat every
+                # skill as changed
+                self._overflowed = False
+                self._add_tree(self.plugins_dir)
+                changed |= set(iter_skill_dirs(self.plugins_dir))
+            if changed:
+                return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(plugins_dir, backend='auto'):
+    """
+    Create a watcher for a plugins directory.
+
+    Args:
+        plugins_dir: Directory that contains plugin directories
+        backend: 'auto' (inotify when available, else poll), 'poll' or 'inotify'
+
+    Returns:
+        PollWatcher or InotifyWatcher
+
+    Raises:
+        OSError: if backend is 'inotify' and inotify cannot be used
+    """
+    if backend == 'poll':
+        return PollWatcher(plugins_dir)
+    if backend == 'inotify':
+        return InotifyWatcher(plugins_dir)
+    try:
+        return InotifyWatcher(plugins_dir)
+    except OSError:
+        # Not Linux, or the inotify watch limit is exhausted
+        return PollWatcher(plugins_dir)
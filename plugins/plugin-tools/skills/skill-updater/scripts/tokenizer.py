@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared CJK-aware tokenization for the skill-updater scripts.
+
+tokenize() splits text into search terms: ASCII runs become lowercase words
+and runs of kana/kanji become overlapping character bigrams. The character
+classes are also used by context_budget.py to estimate token costs.
+
+Usage (as a module):
+    from tokenizer import tokenize
+    tokens = tokenize('スキル更新 skill-updater')
+"""
+
+import re
+import unicodedata
+
+
+# Kana and CJK ideographs (incl. extension A and compatibility ideographs)
+CJK_CHARS = '\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff'
+# CJK symbols/punctuation and half-width/full-width forms
+CJK_PUNCTUATION = '\u3000-\u303f\uff00-\uffef'
+
+TOKEN_PATTERN = re.compile(
+    r'[a-z0-9][a-z0-9_+#.-]*'
+    rf'|[{CJK_CHARS}]+'
+)
+
+
+def tokenize(text):
+    """
+    Split text into index terms.
+
+    ASCII runs become lowercase words (also split on '-' and '_' so that
+    'skill-updater' matches 'skill updater'); runs of kana/kanji become
+    overlapping character bigrams.
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(unicodedata.normalize('NFKC', text).lower()):
+        word = match.group(0)
+        if word[0] < '\u3040':
+            word = word.rstrip('.-')
+            if len(word) > 1:
+                tokens.append(word)
+                parts = re.split(r'[-_]', word)
+                if len(parts) > 1:
+                    tokens.extend(p for p in parts if len(p) > 1)
+        elif len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
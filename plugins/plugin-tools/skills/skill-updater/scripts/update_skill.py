@@ -4,9 +4,12 @@
 Skill management utilities - list, search, and inspect skills.
 
 Usage:
-    python update_skill.py list [--path <plugins-dir>]
-    python update_skill.py search <keyword> [--path <plugins-dir>]
-    python update_skill.py info <skill-path>
+    python update_skill.py list [--path <plugins-dir>] [--no-cache] [--cache-stats]
+    python update_skill.py search <keyword> [--path <plugins-dir>] [--limit <n>] [--fuzzy]
+                                            [--no-cache] [--cache-stats]
+    python update_skill.py grep <regex> [--path <plugins-dir>] [-i] [-l] [--workers <n>]
+    python update_skill.py info <skill-path> [--json]
+    python update_skill.py info --all [--path <plugins-dir>] [--json]
 """
 
 import argparse
@@ -15,6 +18,9 @@ import sys
 import io
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+from frontmatter import count_lines, load_skill_md, peek_skill_md, prune_memo, scan_skill_md
 
 # Windows UTF-8 support
 if sys.platform == 'win32':
@@ -30,93 +36,237 @@ def get_default_plugins_path():
     return os.path.normpath(plugins_path)
 
 
-def parse_frontmatter(content):
-    """Parse YAML frontmatter from SKILL.md content."""
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, content, re.DOTALL)
-    if not match:
-        return None
+CATALOG_VERSION = 2
+PARALLEL_READ_THRESHOLD = 32
+FUZZY_LIMIT = 10
 
-    frontmatter = {}
-    lines = match.group(1).strip().split('\n')
-    current_key = None
-    current_value = []
-
-    for line in lines:
-        if line.startswith('  ') and current_key:
-            current_value.append(line.strip())
-        elif ':' in line:
-            if current_key:
-                frontmatter[current_key] = '\n'.join(current_value).strip()
-            key, _, value = line.partition(':')
-            current_key = key.strip()
-            value = value.strip()
-            if value == '|':
-                current_value = []
-            else:
-                current_value = [value] if value else []
-        else:
-            if current_key:
-                current_value.append(line.strip())
 
-    if current_key:
-        frontmatter[current_key] = '\n'.join(current_value).strip()
+def get_plugins_dir(plugins_path):
+    """Resolve the directory that directly contains plugin directories."""
+    plugins_dir = os.path.join(plugins_path, 'plugins')
+    if not os.path.exists(plugins_dir):
+        plugins_dir = plugins_path
+    return plugins_dir
 
-    return frontmatter
 
+def get_cache_dir(plugins_path):
+    """Get the cache directory for a plugins tree (<plugins-dir>/.cache)."""
+    return os.path.join(get_plugins_dir(plugins_path), '.cache')
 
-def find_skills(plugins_path):
-    """Find all skills in the plugins directory."""
-    skills = []
 
-    if not os.path.exists(plugins_path):
-        return skills
+def load_catalog(plugins_path):
+    """Load the persistent skill catalog, or an empty one."""
+    catalog_path = os.path.join(get_cache_dir(plugins_path), 'skill_catalog.json')
+    try:
+        with open(catalog_path, 'r', encoding='utf-8') as f:
+            catalog = json.load(f)
+        if catalog.get('version') == CATALOG_VERSION:
+            return catalog
+    except (OSError, ValueError):
+        pass
+    return {'version': CATALOG_VERSION, 'plugins': {}}
+
+
+def save_catalog(plugins_path, catalog):
+    """Persist the skill catalog atomically."""
+    cache_dir = get_cache_dir(plugins_path)
+    catalog_path = os.path.join(cache_dir, 'skill_catalog.json')
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = catalog_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, ensure_ascii=False)
+        os.replace(tmp_path, catalog_path)
+    except OSError:
+        pass
+
+
+def read_skill_md(skill_md, st=None, use_cache=True):
+    """
+    Read a SKILL.md's frontmatter and line count; (None, 0) if unreadable.
+
+    With use_cache the shared frontmatter memo is used (and filled);
+    otherwise the file is always scanned and the memo is left untouched.
+    """
+    try:
+        return load_skill_md(skill_md, st) if use_cache else scan_skill_md(skill_md)
+    except Exception:
+        return None, 0
+
+
+def _read_skill_mds(items, use_cache=True):
+    """Read many (path, stat) SKILL.md items, over a thread pool when there are enough."""
+    if len(items) < PARALLEL_READ_THRESHOLD:
+        return [read_skill_md(path, st, use_cache) for path, st in items]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+        return list(pool.map(lambda item: read_skill_md(*item, use_cache), items))
+
+
+def load_skills_from_index(plugins_path):
+    """
+    Load the skill list from the precompiled marketplace index.
+
+    The index is built by plugin-creator/scripts/marketplace_index.py into
+    <root>/.claude-plugin/marketplace.index.json.
+
+    Returns:
+        List of skill dicts like find_skills, or None if there is no index
+        or it is stale
+    """
+    plugins_dir = os.path.abspath(get_plugins_dir(plugins_path))
+    root = os.path.dirname(plugins_dir)
+    if os.path.basename(plugins_dir) != 'plugins' or not os.path.exists(
+            os.path.join(root, '.claude-plugin', 'marketplace.index.json')):
+        return None
 
-    # Look for plugins
-    plugins_dir = os.path.join(plugins_path, 'plugins')
-    if not os.path.exists(plugins_dir):
-        plugins_dir = plugins_path
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    index_scripts = os.path.normpath(os.path.join(script_dir, '..', '..', 'plugin-creator', 'scripts'))
+    if index_scripts not in sys.path:
+        sys.path.insert(0, index_scripts)
+    try:
+        from marketplace_index import load_index
+    except ImportError:
+        return None
+
+    index = load_index(root, ['skills'])
+    if index is None:
+        return None
+    return [
+        {
+            'name': skill_name,
+            'plugin': plugin_name,
+            'path': os.path.join(plugins_dir, plugin_name, 'skills', skill_name),
+            'frontmatter': skill['frontmatter'],
+            'lines': skill['lines']
+        }
+        for plugin_name, plugin in index['plugins'].items()
+        for skill_name, skill in plugin['skills'].items()
+    ]
+
+
+def find_skills(plugins_path, use_cache=True, stats=None):
+    """
+    Find all skills in the plugins directory.
+
+    With use_cache, a fresh precompiled marketplace index is used as is;
+    otherwise the skill names of each plugin are kept in
+    <plugins-dir>/.cache/skill_catalog.json and a skills directory is only
+    re-listed when its mtime changed. SKILL.md contents come from the shared
+    frontmatter memo (see frontmatter.py), so a SKILL.md is only re-read when
+    its mtime or size changed; those that do need reading are read in parallel.
+    Without use_cache every SKILL.md is read and neither cache is touched.
+
+    Args:
+        plugins_path: Marketplace root or plugins directory
+        use_cache: Whether to read and update the catalog cache
+        stats: Optional dict; 'hits' and 'misses' are incremented per SKILL.md,
+            'index' is set when the marketplace index was used
+
+    Returns:
+        List of skill dicts (name, plugin, path, frontmatter, lines)
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('hits', 0)
+    stats.setdefault('misses', 0)
 
-    for plugin_name in os.listdir(plugins_dir):
-        plugin_path = os.path.join(plugins_dir, plugin_name)
-        if not os.path.isdir(plugin_path):
+    if not os.path.exists(plugins_path):
+        return []
+
+    if use_cache:
+        skills = load_skills_from_index(plugins_path)
+        if skills is not None:
+            stats['index'] = True
+            stats['hits'] += len(skills)
+            return skills
+
+    plugins_dir = get_plugins_dir(plugins_path)
+    catalog = load_catalog(plugins_path) if use_cache else {'plugins': {}}
+    old_plugins = catalog['plugins']
+    new_plugins = {}
+    changed = False
+
+    # Pass 1: stat everything and decide which SKILL.md files must be read
+    found = []
+    to_read = []
+    for plugin_entry in os.scandir(plugins_dir):
+        if not plugin_entry.is_dir():
             continue
 
-        skills_dir = os.path.join(plugin_path, 'skills')
-        if not os.path.exists(skills_dir):
+        plugin_name = plugin_entry.name
+        skills_dir = os.path.join(plugin_entry.path, 'skills')
+        try:
+            skills_mtime = os.stat(skills_dir).st_mtime_ns
+        except OSError:
             continue
 
-        for skill_name in os.listdir(skills_dir):
+        cached_plugin = old_plugins.get(plugin_name)
+        if cached_plugin and cached_plugin['skills_mtime'] == skills_mtime:
+            skill_names = cached_plugin['skills']
+        else:
+            skill_names = [e.name for e in os.scandir(skills_dir) if e.is_dir()]
+            changed = True
+
+        for skill_name in skill_names:
             skill_path = os.path.join(skills_dir, skill_name)
             skill_md = os.path.join(skill_path, 'SKILL.md')
 
-            if os.path.exists(skill_md):
-                try:
-                    with open(skill_md, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    frontmatter = parse_frontmatter(content)
-                    skills.append({
-                        'name': skill_name,
-                        'plugin': plugin_name,
-                        'path': skill_path,
-                        'frontmatter': frontmatter,
-                        'lines': len(content.split('\n'))
-                    })
-                except Exception:
-                    skills.append({
-                        'name': skill_name,
-                        'plugin': plugin_name,
-                        'path': skill_path,
-                        'frontmatter': None,
-                        'lines': 0
-                    })
-
-    return skills
-
-
-def list_skills(plugins_path):
+            try:
+                st = os.stat(skill_md)
+            except OSError:
+                continue
+
+            cached = peek_skill_md(skill_md, st) if use_cache else None
+            if cached is not None:
+                stats['hits'] += 1
+                entry = {'frontmatter': cached[0], 'lines': cached[1]}
+            else:
+                stats['misses'] += 1
+                entry = {}
+                to_read.append((entry, skill_md, st))
+            found.append((plugin_name, skill_name, skill_path, entry))
+
+        new_plugins[plugin_name] = {'skills_mtime': skills_mtime, 'skills': skill_names}
+
+    # Pass 2: read the changed SKILL.md files
+    results = _read_skill_mds([(skill_md, st) for _, skill_md, st in to_read], use_cache)
+    for (entry, _, _), (frontmatter, lines) in zip(to_read, results):
+        entry['frontmatter'] = frontmatter
+        entry['lines'] = lines
+
+    if use_cache:
+        prune_memo(plugins_dir, [os.path.join(skill_path, 'SKILL.md')
+                                 for _, _, skill_path, _ in found])
+        if changed or set(new_plugins) != set(old_plugins):
+            save_catalog(plugins_path, {'version': CATALOG_VERSION, 'plugins': new_plugins})
+
+    return [
+        {
+            'name': skill_name,
+            'plugin': plugin_name,
+            'path': skill_path,
+            'frontmatter': entry['frontmatter'],
+            'lines': entry['lines']
+        }
+        for plugin_name, skill_name, skill_path, entry in found
+    ]
+
+
+def print_cache_stats(stats):
+    """Print catalog cache hit rate."""
+    if stats.get('index'):
+        print(f"\nCache: {stats['hits']} skill(s) from marketplace index (.claude-plugin/marketplace.index.json)")
+        return
+    total = stats['hits'] + stats['misses']
+    rate = (stats['hits'] / total * 100) if total else 0.0
+    print(f"\nCache: {stats['hits']}/{total} SKILL.md hits ({rate:.1f}%), "
+          f"{stats['misses']} re-read")
+
+
+def list_skills(plugins_path, use_cache=True, show_cache_stats=False):
     """List all skills."""
-    skills = find_skills(plugins_path)
+    stats = {}
+    skills = find_skills(plugins_path, use_cache, stats)
 
     if not skills:
         print("No skills found.")
@@ -140,64 +290,239 @@ def list_skills(plugins_path):
         print(f"| {plugin} | {name} | {desc} | {lines} |")
 
     print(f"\nTotal: {len(skills)} skills")
+    if show_cache_stats:
+        print_cache_stats(stats)
+
+
+def search_skills(keyword, plugins_path, use_cache=True, show_cache_stats=False, limit=None,
+                  fuzzy=False):
+    """
+    Search skills by keyword, ranked with BM25.
+
+    Uses the inverted index from skill_index.py (name, trigger phrases,
+    description, headings and body). Falls back to a substring match over
+    names and descriptions when no indexed term matches, e.g. for partial words.
+    All matches are shown unless limit is given. With fuzzy, names are
+    instead matched by trigram similarity so that misspelled skill names
+    still resolve (FUZZY_LIMIT candidates unless limit is given).
+    """
+    from skill_index import load_search_index, search_index
+
+    stats = {}
+    index = load_search_index(plugins_path, use_cache, stats)
+
+    if fuzzy:
+        if show_cache_stats:
+            print_cache_stats(stats)
+        show_fuzzy_matches(index, keyword, limit or FUZZY_LIMIT)
+        return
 
+    results = search_index(index, keyword, limit)
 
-def search_skills(keyword, plugins_path):
-    """Search skills by keyword."""
-    skills = find_skills(plugins_path)
-    keyword_lower = keyword.lower()
-
-    matches = []
-    for skill in skills:
-        # Search in name
-        if keyword_lower in skill['name'].lower():
-            matches.append(skill)
-            continue
+    if not results:
+        keyword_lower = keyword.lower()
+        for doc in index['docs'].values():
+            if keyword_lower in doc['name'].lower() or keyword_lower in doc['description'].lower():
+                results.append((0.0, doc))
+        results = results[:limit]
 
-        # Search in description
-        if skill['frontmatter'] and 'description' in skill['frontmatter']:
-            if keyword_lower in skill['frontmatter']['description'].lower():
-                matches.append(skill)
+    if show_cache_stats:
+        print_cache_stats(stats)
+        print(f"Index: {stats['reindexed']} SKILL.md re-indexed, {stats['removed']} removed")
 
-    if not matches:
+    if not results:
         print(f"No skills found matching '{keyword}'")
+        show_fuzzy_matches(index, keyword, 3, title='Did you mean?')
         return
 
     print(f"\n## Skills matching '{keyword}'\n")
-    for skill in matches:
-        print(f"**{skill['plugin']}/{skill['name']}**")
-        print(f"  Path: {skill['path']}")
-        if skill['frontmatter'] and 'description' in skill['frontmatter']:
-            desc = skill['frontmatter']['description'][:100]
+    for score, doc in results:
+        print(f"**{doc['plugin']}/{doc['name']}** (score: {score:.2f})")
+        print(f"  Path: {doc['path']}")
+        if doc['description']:
+            desc = doc['description'][:100]
             print(f"  Description: {desc}...")
         print()
 
 
-def show_skill_info(skill_path):
-    """Show detailed information about a skill."""
-    if not os.path.exists(skill_path):
-        print(f"Error: Path not found: {skill_path}")
-        return
+def show_fuzzy_matches(index, keyword, limit, title=None):
+    """Print the skills whose names are most similar to keyword."""
+    from skill_index import fuzzy_lookup
 
-    skill_md = os.path.join(skill_path, 'SKILL.md')
-    if not os.path.exists(skill_md):
-        print(f"Error: SKILL.md not found in {skill_path}")
+    matches = fuzzy_lookup(index, keyword, limit)
+    if not matches:
+        if title is None:
+            print(f"No skills found similar to '{keyword}'")
         return
 
-    skill_name = os.path.basename(skill_path)
+    print(f"\n## {title or f'Skills similar to {keyword!r}'}\n")
+    for score, matched, key in matches:
+        doc = index['docs'][key]
+        print(f"**{doc['plugin']}/{doc['name']}** (similarity: {score:.2f}, matched: {matched})")
+        print(f"  Path: {doc['path']}")
+    print()
+
 
+def grep_skills(pattern, plugins_path, ignore_case=False, files_only=False, workers=None,
+                max_size=None):
+    """Search the text of every skill file for a regex, printing matches as they arrive."""
+    import skill_grep
+
+    flags = re.IGNORECASE if ignore_case else 0
+    try:
+        re.compile(pattern, flags)
+    except re.error as e:
+        print(f"Error: Invalid regex: {e}")
+        sys.exit(2)
+
+    stats = {}
+    total = 0
+    matched_files = 0
+    last_skill = None
+    for plugin, skill, found in skill_grep.grep_skills(
+            get_plugins_dir(plugins_path), pattern, flags, workers,
+            max_size or skill_grep.DEFAULT_MAX_SIZE, stats):
+        if (plugin, skill) != last_skill:
+            print(f"\n## {plugin}/{skill}")
+            last_skill = (plugin, skill)
+        for rel_path, matches in found:
+            total += len(matches)
+            matched_files += 1
+            if files_only:
+                print(f"  {rel_path}")
+                continue
+            for line_no, line in matches:
+                print(f"  {rel_path}:{line_no}: {line.strip()[:200]}")
+        sys.stdout.flush()
+
+    print(f"\n{total} matching line(s) in {matched_files} file(s); {stats['files']} searched "
+          f"({stats['binary']} binary, {stats['oversized']} oversized skipped)")
+
+
+RESOURCE_DIRS = ('scripts', 'references', 'assets')
+INVENTORY_SKIP_DIRS = {'__pycache__', '.cache'}
+
+
+def collect_skill_inventory(skill_path):
+    """
+    Inventory a skill directory in a single os.scandir traversal.
+
+    Every file's size comes from its directory entry; line counts are taken
+    from a chunked byte scan (frontmatter.count_lines; SKILL.md uses the
+    memoized frontmatter reader, which counts the same way).
+    Totals are aggregated per resource directory (scripts/references/assets,
+    recursively) as the tree is walked.
+
+    Args:
+        skill_path: Path to the skill directory
+
+    Returns:
+        tuple: (inventory, error) where inventory has name, path, frontmatter,
+        skill_md_lines, files (list of {path, bytes, lines}), resources
+        ({dir: {files, bytes, lines}}) and totals
+    """
+    if not os.path.isdir(skill_path):
+        return None, f"Path not found: {skill_path}"
+
+    resources = {name: None for name in RESOURCE_DIRS}
+    totals = {'files': 0, 'bytes': 0, 'lines': 0}
+    files = []
+    skill_md_st = None
+
+    stack = [(skill_path, '')]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            entries = sorted(os.scandir(dir_path), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir():
+                if entry.name in INVENTORY_SKIP_DIRS:
+                    continue
+                if not rel_dir and entry.name in resources:
+                    resources[entry.name] = {'files': 0, 'bytes': 0, 'lines': 0}
+                stack.append((entry.path, rel_path))
+                continue
+            if not entry.is_file():
+                continue
+
+            st = entry.stat()
+            if rel_path == 'SKILL.md':
+                skill_md_st = st
+                continue
+            try:
+                lines = count_lines(entry.path)
+            except OSError:
+                lines = None
+            files.append({'path': rel_path, 'bytes': st.st_size, 'lines': lines})
+
+            top = rel_path.split('/', 1)[0]
+            for bucket in (resources.get(top) if rel_dir else None, totals):
+                if bucket is not None:
+                    bucket['files'] += 1
+                    bucket['bytes'] += st.st_size
+                    bucket['lines'] += lines or 0
+
+    if skill_md_st is None:
+        return None, f"SKILL.md not found in {skill_path}"
     try:
-        with open(skill_md, 'r', encoding='utf-8') as f:
-            content = f.read()
+        frontmatter, skill_md_lines = load_skill_md(os.path.join(skill_path, 'SKILL.md'), skill_md_st)
     except Exception as e:
-        print(f"Error reading SKILL.md: {e}")
-        return
+        return None, f"Error reading SKILL.md: {e}"
+
+    files.insert(0, {'path': 'SKILL.md', 'bytes': skill_md_st.st_size, 'lines': skill_md_lines})
+    files.sort(key=lambda f: (f['path'] != 'SKILL.md', f['path']))
+    totals['files'] += 1
+    totals['bytes'] += skill_md_st.st_size
+    totals['lines'] += skill_md_lines
+
+    return {
+        'name': os.path.basename(os.path.normpath(skill_path)),
+        'path': skill_path,
+        'frontmatter': frontmatter,
+        'skill_md_lines': skill_md_lines,
+        'files': files,
+        'resources': {name: counts for name, counts in resources.items() if counts is not None},
+        'totals': totals,
+    }, None
+
+
+def format_size(num_bytes):
+    """Human-readable byte size (B / KB / MB)."""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    if num_bytes < 1024 * 1024:
+        return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+def _format_resource(counts):
+    return f"{counts['files']} file(s), {format_size(counts['bytes'])}, {counts['lines']} lines"
 
-    frontmatter = parse_frontmatter(content)
-    lines = len(content.split('\n'))
+
+def show_skill_info(skill_path, as_json=False):
+    """
+    Show detailed information about a skill.
+
+    Returns:
+        bool: False if the skill could not be inventoried
+    """
+    inventory, error = collect_skill_inventory(skill_path)
+    if error:
+        # Keep stdout parseable for --json consumers
+        print(f"Error: {error}", file=sys.stderr if as_json else sys.stdout)
+        return False
+
+    if as_json:
+        print(json.dumps(inventory, ensure_ascii=False, indent=2))
+        return True
+
+    frontmatter = inventory['frontmatter']
 
     print(f"\n{'='*50}")
-    print(f"Skill: {skill_name}")
+    print(f"Skill: {inventory['name']}")
     print(f"{'='*50}\n")
 
     if frontmatter:
@@ -210,36 +535,73 @@ def show_skill_info(skill_path):
     else:
         print("Warning: No valid frontmatter found")
 
-    print(f"\nSKILL.md: {lines} lines")
+    print(f"\nSKILL.md: {inventory['skill_md_lines']} lines")
 
-    # List files
     print("\nFiles:")
-    for root, dirs, files in os.walk(skill_path):
-        rel_root = os.path.relpath(root, skill_path)
-        if rel_root == '.':
-            rel_root = ''
-
-        for f in files:
-            if rel_root:
-                print(f"  {rel_root}/{f}")
-            else:
-                print(f"  {f}")
-
-    # Count by type
-    scripts_path = os.path.join(skill_path, 'scripts')
-    refs_path = os.path.join(skill_path, 'references')
-    assets_path = os.path.join(skill_path, 'assets')
+    for f in inventory['files']:
+        lines = f"{f['lines']} lines, " if f['lines'] is not None else ''
+        print(f"  {f['path']} ({lines}{format_size(f['bytes'])})")
 
     print("\nResource counts:")
-    if os.path.exists(scripts_path):
-        count = len([f for f in os.listdir(scripts_path) if os.path.isfile(os.path.join(scripts_path, f))])
-        print(f"  scripts/: {count} file(s)")
-    if os.path.exists(refs_path):
-        count = len([f for f in os.listdir(refs_path) if os.path.isfile(os.path.join(refs_path, f))])
-        print(f"  references/: {count} file(s)")
-    if os.path.exists(assets_path):
-        count = len([f for f in os.listdir(assets_path) if os.path.isfile(os.path.join(assets_path, f))])
-        print(f"  assets/: {count} file(s)")
+    for name, counts in inventory['resources'].items():
+        print(f"  {name}/: {_format_resource(counts)}")
+    print(f"\nTotal: {_format_resource(inventory['totals'])}")
+    return True
+
+
+def show_all_skill_info(plugins_path, as_json=False, use_cache=True):
+    """
+    Show the file inventory of every skill in the marketplace.
+
+    Returns:
+        bool: False if any skill could not be inventoried
+    """
+    skills = sorted(find_skills(plugins_path, use_cache), key=lambda x: (x['plugin'], x['name']))
+
+    def collect(skill):
+        inventory, error = collect_skill_inventory(skill['path'])
+        if inventory:
+            inventory['plugin'] = skill['plugin']
+        return inventory, error
+
+    if len(skills) < PARALLEL_READ_THRESHOLD:
+        results = [collect(skill) for skill in skills]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4)) as pool:
+            results = list(pool.map(collect, skills))
+    inventories = [inventory for inventory, _ in results if inventory]
+    errors = [error for _, error in results if error]
+
+    if as_json:
+        print(json.dumps(inventories, ensure_ascii=False, indent=2))
+        for error in errors:
+            print(f"Warning: {error}", file=sys.stderr)
+        return not errors
+
+    if not inventories:
+        print("No skills found.")
+        return not errors
+
+    def cell(inventory, name):
+        counts = inventory['resources'].get(name)
+        return f"{counts['files']} / {format_size(counts['bytes'])}" if counts else '-'
+
+    print("\n## Skill Inventory\n")
+    print("| Plugin | Skill | SKILL.md | scripts | references | assets | Total |")
+    print("|--------|-------|----------|---------|------------|--------|-------|")
+    totals = {'files': 0, 'bytes': 0, 'lines': 0}
+    for inventory in inventories:
+        print(f"| {inventory['plugin']} | {inventory['name']} | {inventory['skill_md_lines']} lines "
+              f"| {cell(inventory, 'scripts')} | {cell(inventory, 'references')} "
+              f"| {cell(inventory, 'assets')} "
+              f"| {inventory['totals']['files']} / {format_size(inventory['totals']['bytes'])} |")
+        for key in totals:
+            totals[key] += inventory['totals'][key]
+
+    print(f"\nTotal: {len(inventories)} skills, {_format_resource(totals)}")
+    for error in errors:
+        print(f"Warning: {error}")
+    return not errors
 
 
 def main():
@@ -249,26 +611,64 @@ def main():
     # List command
     list_parser = subparsers.add_parser('list', help='List all skills')
     list_parser.add_argument('--path', default=None, help='Plugins directory path')
+    list_parser.add_argument('--no-cache', action='store_true', help='Ignore the skill catalog cache')
+    list_parser.add_argument('--cache-stats', action='store_true', help='Show catalog cache hit rate')
 
     # Search command
     search_parser = subparsers.add_parser('search', help='Search skills by keyword')
     search_parser.add_argument('keyword', help='Keyword to search for')
     search_parser.add_argument('--path', default=None, help='Plugins directory path')
+    search_parser.add_argument('--limit', type=int, default=None,
+                               help=f'Maximum number of results (default: all; {FUZZY_LIMIT} with --fuzzy)')
+    search_parser.add_argument('--fuzzy', action='store_true',
+                               help='Typo-tolerant name lookup (trigram similarity)')
+    search_parser.add_argument('--no-cache', action='store_true', help='Ignore the skill catalog and index caches')
+    search_parser.add_argument('--cache-stats', action='store_true', help='Show catalog cache hit rate')
+
+    # Grep command
+    grep_parser = subparsers.add_parser('grep', help='Regex search across all skill files')
+    grep_parser.add_argument('pattern', help='Regular expression to search for')
+    grep_parser.add_argument('--path', default=None, help='Plugins directory path')
+    grep_parser.add_argument('-i', '--ignore-case', action='store_true', help='Case-insensitive match')
+    grep_parser.add_argument('-l', '--files-with-matches', action='store_true',
+                             help='Only list matching files')
+    grep_parser.add_argument('--workers', type=int, default=None, help='Worker process count')
+    grep_parser.add_argument('--max-size', type=int, default=None,
+                             help='Skip files larger than this many bytes (default: 1 MiB)')
 
     # Info command
     info_parser = subparsers.add_parser('info', help='Show skill information')
-    info_parser.add_argument('skill_path', help='Path to skill directory')
+    info_parser.add_argument('skill_path', nargs='?', help='Path to skill directory')
+    info_parser.add_argument('--all', action='store_true', help='Show the inventory of every skill')
+    info_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    info_parser.add_argument('--path', default=None, help='Plugins directory path (with --all)')
+    info_parser.add_argument('--no-cache', action='store_true', help='Ignore the skill catalog cache (with --all)')
 
     args = parser.parse_args()
 
     if args.command == 'list':
         path = args.path or get_default_plugins_path()
-        list_skills(path)
+        list_skills(path, not args.no_cache, args.cache_stats)
     elif args.command == 'search':
         path = args.path or get_default_plugins_path()
-        search_skills(args.keyword, path)
+        search_skills(args.keyword, path, not args.no_cache, args.cache_stats, args.limit,
+                      args.fuzzy)
+    elif args.command == 'grep':
+        if args.workers is not None and args.workers < 1:
+            grep_parser.error('--workers must be at least 1')
+        path = args.path or get_default_plugins_path()
+        grep_skills(args.pattern, path, args.ignore_case, args.files_with_matches,
+                    args.workers, args.max_size)
     elif args.command == 'info':
-        show_skill_info(args.skill_path)
+        if args.all:
+            path = args.path or get_default_plugins_path()
+            if not show_all_skill_info(path, args.json, not args.no_cache):
+                sys.exit(1)
+        elif args.skill_path:
+            if not show_skill_info(args.skill_path, args.json):
+                sys.exit(1)
+        else:
+            info_parser.print_help()
     else:
         parser.print_help()
 
@@ -6,13 +6,24 @@ Validate a skill's structure and contents.
 Usage:
     python validate_skill.py <skill-path>
     python validate_skill.py plugins/dev-workflow/skills/coding-standards
+    python validate_skill.py --all <plugins-dir> [--json-report <path>] [--junit <path>]
+    python validate_skill.py --watch <plugins-dir> [--backend auto|poll|inotify]
+    python validate_skill.py <skill-path> --import-time
+
+Results are cached per skill against a content hash of the skill directory
+(plugins/.cache/validation_cache.json); pass --no-cache to re-validate all.
 """
 
 import argparse
+import json
 import os
 import sys
 import io
-import re
+import time
+
+from frontmatter import load_skill_md
+from script_analysis import analyze_scripts, print_import_ranking, rank_import_times, skill_scripts
+from validation_cache import ValidationCache
 
 # Windows UTF-8 support
 if sys.platform == 'win32':
@@ -20,50 +31,14 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
 
-def parse_frontmatter(content):
-    """Parse YAML frontmatter from SKILL.md content."""
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.match(pattern, content, re.DOTALL)
-    if not match:
-        return None
-
-    frontmatter = {}
-    lines = match.group(1).strip().split('\n')
-    current_key = None
-    current_value = []
-
-    for line in lines:
-        if line.startswith('  ') and current_key:
-            # Continuation of multiline value
-            current_value.append(line.strip())
-        elif ':' in line:
-            # Save previous key-value
-            if current_key:
-                frontmatter[current_key] = '\n'.join(current_value).strip()
-
-            key, _, value = line.partition(':')
-            current_key = key.strip()
-            value = value.strip()
-
-            if value == '|':
-                current_value = []
-            else:
-                current_value = [value] if value else []
-        else:
-            if current_key:
-                current_value.append(line.strip())
-
-    # Save last key-value
-    if current_key:
-        frontmatter[current_key] = '\n'.join(current_value).strip()
-
-    return frontmatter
-
-
-def validate_skill(skill_path):
+def validate_skill(skill_path, script_workers=None):
     """
     Validate a skill directory structure.
 
+    Args:
+        skill_path: Path to the skill directory
+        script_workers: Process count for script analysis (1 disables the pool)
+
     Returns:
         tuple: (is_valid, errors, warnings)
     """
@@ -85,16 +60,14 @@ def validate_skill(skill_path):
         errors.append("SKILL.md not found")
         return False, errors, warnings
 
-    # Read and parse SKILL.md
+    # Read and parse SKILL.md (frontmatter only; memoized across tools)
     try:
-        with open(skill_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        frontmatter, line_count = load_skill_md(skill_md_path)
     except Exception as e:
         errors.append(f"Failed to read SKILL.md: {e}")
         return False, errors, warnings
 
     # Validate frontmatter
-    frontmatter = parse_frontmatter(content)
     if frontmatter is None:
         errors.append("SKILL.md missing YAML frontmatter (must start with ---)")
     else:
@@ -112,7 +85,6 @@ def validate_skill(skill_path):
             warnings.append("Description is very short (< 20 chars). Consider adding more detail and trigger keywords.")
 
     # Check line count
-    line_count = len(content.split('\n'))
     if line_count > 500:
         warnings.append(f"SKILL.md has {line_count} lines (recommended: < 500). Consider moving content to references/")
 
@@ -122,17 +94,11 @@ def validate_skill(skill_path):
         if not os.listdir(scripts_path):
             warnings.append("scripts/ directory is empty")
         else:
-            # Check Python files for UTF-8 encoding
-            for f in os.listdir(scripts_path):
-                if f.endswith('.py'):
-                    py_path = os.path.join(scripts_path, f)
-                    try:
-                        with open(py_path, 'r', encoding='utf-8') as pf:
-                            py_content = pf.read()
-                        if 'encoding' not in py_content and 'utf-8' not in py_content.lower():
-                            warnings.append(f"scripts/{f}: Consider adding UTF-8 encoding declaration")
-                    except Exception:
-                        pass
+            # Syntax errors, UTF-8 declaration and startup cost of each script
+            for script_errors, script_warnings in analyze_scripts(skill_scripts(skill_path),
+                                                                  script_workers):
+                errors.extend(script_errors)
+                warnings.extend(script_warnings)
 
     refs_path = os.path.join(skill_path, 'references')
     if os.path.exists(refs_path) and not os.listdir(refs_path):
@@ -146,6 +112,30 @@ def validate_skill(skill_path):
     return is_valid, errors, warnings
 
 
+def validate_skill_cached(skill_path, cache):
+    """
+    validate_skill() with results reused while the skill's content is unchanged.
+
+    Args:
+        skill_path: Path to the skill directory
+        cache: ValidationCache, or None to always validate
+
+    Returns:
+        tuple: (is_valid, errors, warnings, from_cache)
+    """
+    if cache is None:
+        return (*validate_skill(skill_path), False)
+
+    digest = cache.skill_hash(skill_path)
+    cached = cache.get(skill_path, digest)
+    if cached is not None:
+        return (*cached, True)
+
+    result = validate_skill(skill_path)
+    cache.put(skill_path, digest, result)
+    return (*result, False)
+
+
 def print_result(skill_path, is_valid, errors, warnings):
     """Print validation results."""
     skill_name = os.path.basename(skill_path)
@@ -176,14 +166,321 @@ def print_result(skill_path, is_valid, errors, warnings):
     return is_valid
 
 
+def get_plugins_dir(plugins_path):
+    """Resolve a marketplace root or plugins directory to the plugins directory."""
+    plugins_dir = os.path.join(plugins_path, 'plugins')
+    return plugins_dir if os.path.isdir(plugins_dir) else plugins_path
+
+
+def discover_skills(plugins_path):
+    """
+    Find every skill directory under a marketplace or plugins directory.
+
+    Returns:
+        Sorted list of skill directory paths (plugins/<plugin>/skills/<skill>)
+    """
+    plugins_dir = get_plugins_dir(plugins_path)
+
+    skill_paths = []
+    for plugin_entry in os.scandir(plugins_dir):
+        skills_dir = os.path.join(plugin_entry.path, 'skills')
+        if not plugin_entry.is_dir() or not os.path.isdir(skills_dir):
+            continue
+        for skill_entry in os.scandir(skills_dir):
+            if skill_entry.is_dir():
+                skill_paths.append(skill_entry.path)
+    return sorted(skill_paths)
+
+
+def _report(skill_path, is_valid, errors, warnings, elapsed, cached=False):
+    return {
+        'path': skill_path,
+        'plugin': os.path.basename(os.path.dirname(os.path.dirname(skill_path))),
+        'skill': os.path.basename(skill_path),
+        'valid': is_valid,
+        'errors': errors,
+        'warnings': warnings,
+        'time': elapsed,
+        'cached': cached
+    }
+
+
+def _validate_for_report(skill_path):
+    """Validate one skill and return a picklable result dict."""
+    start = time.perf_counter()
+    # Already running in a pool worker: analyze scripts in-process
+    is_valid, errors, warnings = validate_skill(skill_path, script_workers=1)
+    return _report(skill_path, is_valid, errors, warnings, time.perf_counter() - start)
+
+
+def validate_all(plugins_path, workers=None, use_cache=True, cache=None):
+    """
+    Validate every skill in a marketplace in a process pool.
+
+    Skills whose content hash matches the validation cache are reported from
+    the cache; only the rest are sent to the pool.
+
+    Args:
+        plugins_path: Marketplace root or plugins directory
+        workers: Process count (default: os.cpu_count())
+        use_cache: Whether to read and update the validation cache
+        cache: ValidationCache to use instead of loading one (e.g. one that
+            the caller keeps updating afterwards)
+
+    Returns:
+        List of result dicts (path, plugin, skill, valid, errors, warnings,
+        time, cached)
+    """
+    skill_paths = discover_skills(plugins_path)
+    if cache is None and use_cache:
+        cache = ValidationCache.for_plugins_dir(get_plugins_dir(plugins_path))
+
+    results = {}
+    pending = []
+    for skill_path in skill_paths:
+        digest = cache.skill_hash(skill_path) if cache else None
+        cached = cache.get(skill_path, digest) if cache else None
+        if cached is not None:
+            results[skill_path] = _report(skill_path, *cached, 0.0, cached=True)
+        else:
+            pending.append((skill_path, digest))
+
+    paths = [p for p, _ in pending]
+    if len(paths) < 8 or workers == 1:
+        fresh = [_validate_for_report(p) for p in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(_validate_for_report, paths, chunksize=chunksize))
+
+    for (skill_path, digest), result in zip(pending, fresh):
+        results[skill_path] = result
+        if cache:
+            cache.put(skill_path, digest, (result['valid'], result['errors'], result['warnings']))
+    if cache:
+        cache.prune_unvisited()
+        cache.save()
+
+    return [results[p] for p in skill_paths]
+
+
+def write_json_report(results, report_path):
+    """Write validation results as JSON."""
+    report = {
+        'total': len(results),
+        'failed': sum(1 for r in results if not r['valid']),
+        'warnings': sum(len(r['warnings']) for r in results),
+        'skills': results
+    }
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def write_junit_report(results, report_path):
+    """Write validation results as JUnit XML (one testcase per skill)."""
+    import xml.etree.ElementTree as ET
+
+    suite = ET.Element('testsuite', {
+        'name': 'skill-validation',
+        'tests': str(len(results)),
+        'failures': str(sum(1 for r in results if not r['valid'])),
+        'errors': '0',
+        'time': f"{sum(r['time'] for r in results):.3f}"
+    })
+    for result in results:
+        case = ET.SubElement(suite, 'testcase', {
+            'classname': result['plugin'],
+            'name': result['skill'],
+            'time': f"{result['time']:.3f}"
+        })
+        if not result['valid']:
+            failure = ET.SubElement(case, 'failure', {
+                'message': f"{len(result['errors'])} error(s)"
+            })
+            failure.text = '\n'.join(result['errors'])
+        if result['warnings']:
+            system_out = ET.SubElement(case, 'system-out')
+            system_out.text = '\n'.join(f"WARNING: {w}" for w in result['warnings'])
+
+    ET.ElementTree(suite).write(report_path, encoding='utf-8', xml_declaration=True)
+
+
+def print_summary(results):
+    """Print failing skills and totals for a marketplace-wide run."""
+    failed = [r for r in results if not r['valid']]
+    warned = [r for r in results if r['valid'] and r['warnings']]
+
+    print(f"\n{'='*50}")
+    print(f"Validation: {len(results)} skill(s)")
+    print(f"{'='*50}\n")
+
+    for result in failed:
+        print(f"✗ {result['plugin']}/{result['skill']}")
+        for error in result['errors']:
+            print(f"    ✗ {error}")
+    for result in warned:
+        print(f"⚠ {result['plugin']}/{result['skill']}")
+        for warning in result['warnings']:
+            print(f"    ⚠ {warning}")
+    if failed or warned:
+        print()
+
+    passed = len(results) - len(failed)
+    cached = sum(1 for r in results if r.get('cached'))
+    print(f"{'✓' if not failed else '✗'} {passed} passed, {len(failed)} failed, "
+          f"{sum(len(r['warnings']) for r in results)} warning(s)"
+          + (f" ({cached} from cache)" if cached else ""))
+
+
+def _status(result):
+    if not result['valid']:
+        return f"FAIL ({len(result['errors'])} error(s))"
+    if result['warnings']:
+        return f"PASS ({len(result['warnings'])} warning(s))"
+    return "PASS"
+
+
+def print_delta(previous, result):
+    """Print how one skill's validation result changed."""
+    label = f"{result['plugin']}/{result['skill']}"
+    before = _status(previous) if previous else None
+    after = _status(result)
+    mark = '✗' if not result['valid'] else ('⚠' if result['warnings'] else '✓')
+
+    if before is None:
+        print(f"{mark} {label}: new, {after}")
+    elif before != after:
+        print(f"{mark} {label}: {before} → {after}")
+    else:
+        print(f"  {label}: still {after}")
+
+    old_messages = set(previous['errors'] + previous['warnings']) if previous else set()
+    for error in result['errors']:
+        if error not in old_messages:
+            print(f"    ✗ {error}")
+    for warning in result['warnings']:
+        if warning not in old_messages:
+            print(f"    ⚠ {warning}")
+    if previous:
+        new_messages = set(result['errors'] + result['warnings'])
+        for message in previous['errors'] + previous['warnings']:
+            if message not in new_messages:
+                print(f"    ✓ fixed: {message}")
+
+
+def watch(plugins_path, backend='auto', interval=1.0, use_cache=True):
+    """
+    Validate every skill, then re-validate skills as their files change.
+
+    Only changed skills are re-validated; each change prints a pass/fail
+    delta against the previous result. Runs until interrupted.
+
+    Args:
+        plugins_path: Marketplace root or plugins directory
+        backend: Change detection backend ('auto', 'poll' or 'inotify')
+        interval: Seconds between stat sweeps (poll backend)
+        use_cache: Whether to read and update the validation cache
+    """
+    from skill_watch import create_watcher
+
+    plugins_dir = get_plugins_dir(plugins_path)
+    cache = ValidationCache.for_plugins_dir(plugins_dir) if use_cache else None
+    watcher = create_watcher(plugins_dir, backend)
+
+    results = {r['path']: r for r in validate_all(plugins_path, use_cache=use_cache, cache=cache)}
+    failed = sum(1 for r in results.values() if not r['valid'])
+    print(f"Watching {len(results)} skill(s) in {plugins_dir} ({watcher.name}); "
+          f"{len(results) - failed} passed, {failed} failed. Ctrl+C to stop.")
+
+    try:
+        while True:
+            changed = watcher.wait(interval)
+            print(f"\n[{time.strftime('%H:%M:%S')}] {len(changed)} skill(s) changed")
+            for skill_path in sorted(changed):
+                previous = results.get(skill_path)
+                if not os.path.isdir(skill_path):
+                    if previous:
+                        del results[skill_path]
+                        print(f"  {previous['plugin']}/{previous['skill']}: removed")
+                    if cache:
+                        cache.forget(skill_path)
+                    continue
+                start = time.perf_counter()
+                is_valid, errors, warnings, _ = validate_skill_cached(skill_path, cache)
+                result = _report(skill_path, is_valid, errors, warnings,
+                                 time.perf_counter() - start)
+                results[skill_path] = result
+                print_delta(previous, result)
+            if cache:
+                cache.save()
+
+            failed = sum(1 for r in results.values() if not r['valid'])
+            print(f"{'✓' if not failed else '✗'} {len(results) - failed} passed, {failed} failed")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    finally:
+        watcher.close()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate a skill structure')
-    parser.add_argument('skill_path', help='Path to the skill directory')
+    parser.add_argument('skill_path', nargs='?', help='Path to the skill directory')
+    parser.add_argument('--all', metavar='PLUGINS_DIR',
+                        help='Validate every skill under a plugins directory')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker process count for --all (default: CPU count)')
+    parser.add_argument('--json-report', metavar='PATH', help='Write a JSON report (--all)')
+    parser.add_argument('--junit', metavar='PATH', help='Write a JUnit XML report (--all)')
+    parser.add_argument('--watch', metavar='PLUGINS_DIR',
+                        help='Re-validate skills under a plugins directory as they change')
+    parser.add_argument('--backend', choices=['auto', 'poll', 'inotify'], default='auto',
+                        help='Change detection for --watch (default: inotify if available)')
+    parser.add_argument('--interval', type=float, default=1.0,
+                        help='Seconds between stat sweeps for the poll backend (default: 1.0)')
+    parser.add_argument('--import-time', action='store_true',
+                        help='Rank scripts by python -X importtime latency (runs each script with --help)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore and do not update the validation cache')
 
     args = parser.parse_args()
 
-    is_valid, errors, warnings = validate_skill(args.skill_path)
+    if args.watch:
+        try:
+            watch(args.watch, args.backend, args.interval, use_cache=not args.no_cache)
+        except OSError as e:
+            print(f"✗ Cannot watch {args.watch}: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if args.all:
+        results = validate_all(args.all, args.workers, use_cache=not args.no_cache)
+        print_summary(results)
+        if args.json_report:
+            write_json_report(results, args.json_report)
+            print(f"JSON report: {args.json_report}")
+        if args.junit:
+            write_junit_report(results, args.junit)
+            print(f"JUnit report: {args.junit}")
+        if args.import_time:
+            scripts = [s for r in results for s in skill_scripts(r['path'])]
+            print_import_ranking(rank_import_times(scripts), get_plugins_dir(args.all))
+        sys.exit(0 if results and all(r['valid'] for r in results) else 1)
+
+    if not args.skill_path:
+        parser.print_help()
+        sys.exit(2)
+
+    cache = None if args.no_cache else ValidationCache.for_skill(args.skill_path)
+    is_valid, errors, warnings, from_cache = validate_skill_cached(args.skill_path, cache)
     print_result(args.skill_path, is_valid, errors, warnings)
+    if from_cache:
+        print("  (unchanged since last validation; result from cache)")
+    if cache:
+        cache.save()
+    if args.import_time:
+        print_import_ranking(rank_import_times(skill_scripts(args.skill_path)), args.skill_path)
 
     sys.exit(0 if is_valid else 1)
 
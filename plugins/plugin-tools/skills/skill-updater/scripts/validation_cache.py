@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-hash cache of validate_skill results.
+
+Each skill directory gets a Merkle-style hash over its file names, sizes and
+contents (directory hashes are built from their sorted children). File
+content hashes are reused while a file's mtime and size are unchanged, so an
+unchanged skill costs only stat calls. Cached results are dropped whenever
+the validator's own source changes, and a run over every skill drops the
+entries of files and skills it no longer saw (prune_unvisited).
+
+Usage (as a module):
+    from validation_cache import ValidationCache
+    cache = ValidationCache.for_plugins_dir(plugins_dir)
+    digest = cache.skill_hash(skill_path)
+    result = cache.get(skill_path, digest)
+    ...
+    cache.put(skill_path, digest, (is_valid, errors, warnings))
+    cache.prune_unvisited()  # only after visiting every skill
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+
+
+CACHE_VERSION = 1
+
+# Validator sources whose content defines the rules; editing any of them
+# invalidates every cached result.
+RULE_SOURCES = ['validate_skill.py', 'frontmatter.py', 'script_analysis.py']
+
+# Directories hashed by name only: their contents change on every run but
+# never affect validation
+OPAQUE_DIRS = {'__pycache__'}
+
+
+def rules_hash():
+    """Hash of the validator source files in this directory."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in RULE_SOURCES:
+        digest.update(name.encode('utf-8'))
+        try:
+            with open(os.path.join(script_dir, name), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b'<missing>')
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """Validation results keyed by skill path and skill content hash."""
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.rules = rules_hash()
+        self.files = {}
+        self.skills = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.visited_files = set()
+        self.visited_skills = set()
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.files = data.get('files', {})
+                if data.get('rules') == self.rules:
+                    self.skills = data.get('skills', {})
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def for_plugins_dir(cls, plugins_dir):
+        """Cache stored in <plugins-dir>/.cache/validation_cache.json."""
+        return cls(os.path.join(plugins_dir, '.cache', 'validation_cache.json'))
+
+    @classmethod
+    def for_skill(cls, skill_path):
+        """
+        Cache for a single skill (plugins/<plugin>/skills/<skill>).
+
+        Returns:
+            ValidationCache, or None if the path is not inside a plugin's
+            skills directory
+        """
+        skills_dir = os.path.dirname(os.path.abspath(skill_path))
+        if os.path.basename(skills_dir) != 'skills':
+            return None
+        return cls.for_plugins_dir(os.path.dirname(os.path.dirname(skills_dir)))
+
+    def _file_hash(self, path, st):
+        self.visited_files.add(path)
+        cached = self.files.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+        self.files[path] = [st.st_mtime_ns, st.st_size, file_hash]
+        self.dirty = True
+        return file_hash
+
+    def _dir_hash(self, dir_path):
+        digest = hashlib.sha256()
+        for entry in sorted(os.scandir(dir_path), key=lambda e: e.name):
+            if entry.name in OPAQUE_DIRS:
+                record = f"d\0{entry.name}\0\n"
+            elif entry.is_dir(follow_symlinks=False):
+                record = f"d\0{entry.name}\0{self._dir_hash(entry.path)}\n"
+            else:
+                st = entry.stat()
+                record = f"f\0{entry.name}\0{st.st_size}\0{self._file_hash(entry.path, st)}\n"
+            digest.update(record.encode('utf-8'))
+        return digest.hexdigest()
+
+    def skill_hash(self, skill_path):
+        """Merkle hash of a skill directory, or None if it cannot be read."""
+        skill_path = os.path.abspath(skill_path)
+        self.visited_skills.add(skill_path)
+        try:
+            return self._dir_hash(skill_path)
+        except OSError:
+            return None
+
+    def get(self, skill_path, digest):
+        """Cached (is_valid, errors, warnings) for a skill hash, or None."""
+        if digest is None:
+            return None
+        cached = self.skills.get(os.path.abspath(skill_path))
+        if cached and cached['hash'] == digest:
+            self.hits += 1
+            return cached['result']
+        self.misses += 1
+        return None
+
+    def put(self, skill_path, digest, result):
+        """Store a (is_valid, errors, warnings) result for a skill hash."""
+        if digest is None:
+            return
+        self.skills[os.path.abspath(skill_path)] = {'hash': digest, 'result': list(result)}
+        self.dirty = True
+
+    def prune_unvisited(self):
+        """
+        Drop file and skill entries not visited since this cache was loaded.
+
+        Only call this after hashing every skill (e.g. validate_all); a
+        single-skill run would otherwise forget all the others.
+        """
+        for table, visited in ((self.files, self.visited_files), (self.skills, self.visited_skills)):
+            stale = [path for path in table if path not in visited]
+            for path in stale:
+                del table[path]
+            if stale:
+                self.dirty = True
+
+    def forget(self, skill_path):
+        """Drop the entries of a skill that was removed."""
+        skill_path = os.path.abspath(skill_path)
+        prefix = skill_path + os.sep
+        stale = [path for path in self.files if path.startswith(prefix)]
+        for path in stale:
+            del self.files[path]
+        if self.skills.pop(skill_path, None) is not None or stale:
+            self.dirty = True
+
+    def save(self):
+        """Write the cache if anything changed."""
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': CACHE_VERSION,
+                    'rules': self.rules,
+                    'files': self.files,
+                    'skills': self.skills
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+        except OSError:
+            pass